@@ -0,0 +1,139 @@
+# api_client.py
+"""Client side of api_server.py.
+
+RemoteBlog has the same methods as functions.Blog, but each one is a call
+to the API server, so the GUI can run without a database connection or
+bcrypt of its own. blog_gui.py uses it when MINIBLOG_API_URL is set, e.g.
+``MINIBLOG_API_URL=http://127.0.0.1:8765``.
+"""
+import functools
+import json
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+import codec
+
+
+class ApiUnavailable(Exception):
+    """The server could not be reached or answered with an error."""
+
+
+class RemoteBlog:
+    def __init__(self, base_url, timeout=30):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self._token = None
+        self._user_id = None
+        self._user_name = None
+        # from the login reply and get_user_profile(); is_admin() reads it so
+        # the sidebar never waits on the network
+        self._role = None
+        # gather() fans out over HTTP the way Blog.gather does over connections
+        self._fanout = ThreadPoolExecutor(max_workers=4, thread_name_prefix="api-fanout")
+
+    # ----------------------- SESSION --------------------------- #
+    @property
+    def user_id(self):
+        return self._user_id
+
+    @property
+    def user_name(self):
+        return self._user_name
+
+    def log_in(self, user_name, password):
+        return self._start_session("log_in", user_name, password)
+
+    def create_account(self, first_name, last_name, contact, email, bio, user_name, password):
+        return self._start_session(
+            "create_account", first_name, last_name, contact, email, bio, user_name, password
+        )
+
+    def resume_session(self, token):
+        return self._start_session("resume_session", token)
+
+    def _start_session(self, method, *args):
+        reply = self._post(method, args)
+        if not reply.get("result"):
+            return False
+        self._token = reply["token"]
+        self._user_id = reply["user_id"]
+        self._user_name = reply["user_name"]
+        self._role = reply.get("role")
+        return True
+
+    def clear_session(self):
+        if self._token is not None:
+            try:
+                self._post("logout", ())
+            except ApiUnavailable as e:
+                print("❌ logout error:", e)
+        self._token = None
+        self._user_id = None
+        self._user_name = None
+        self._role = None
+
+    @property
+    def cached_role(self):
+        """Same as Blog.cached_role: from the login reply or the last
+        get_user_profile(), without a round trip."""
+        return self._role
+
+    def is_admin(self):
+        """From the cached role; call get_user_profile() (off the Tk thread)
+        to refresh it."""
+        return (self._role or "").lower() == "admin"
+
+    def get_user_profile(self):
+        profile = self._call("get_user_profile")
+        if profile:
+            self._role = profile.get("role")
+        return profile
+
+    # ------------------------ CALLS ---------------------------- #
+    def __getattr__(self, name):
+        if name in codec.BLOG_API:
+            return functools.partial(self._call, name)
+        raise AttributeError(name)
+
+    def _call(self, method, *args, **kwargs):
+        return self._post(method, args, kwargs)["result"]
+
+    def gather(self, *calls):
+        futures = [self._fanout.submit(fn, *args) for fn, *args in calls]
+        return [future.result() for future in futures]
+
+    def warm_up(self):
+        """Same role as Blog.warm_up: check the server answers before the
+        first login. The client itself has nothing heavy to load."""
+        try:
+            with urllib.request.urlopen(f"{self.base_url}/health", timeout=self.timeout) as response:
+                response.read()
+            return True
+        except (urllib.error.URLError, OSError) as e:
+            print("❌ warm up error:", e)
+            return False
+
+    def _post(self, method, args, kwargs=None):
+        request = urllib.request.Request(
+            f"{self.base_url}/api/{method}",
+            data=codec.dumps({"args": list(args), "kwargs": kwargs or {}}),
+            headers={"Content-Type": "application/json"},
+            method="POST",
+        )
+        if self._token is not None:
+            request.add_header("Authorization", f"Bearer {self._token}")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return codec.loads(response.read())
+        except urllib.error.HTTPError as e:
+            try:
+                message = json.loads(e.read()).get("error", e.reason)
+            except ValueError:
+                message = e.reason
+            if e.code == 401:
+                # the server forgot us (restart or idle timeout)
+                self._token = self._user_id = self._user_name = self._role = None
+            raise ApiUnavailable(f"{method}: HTTP {e.code} {message}") from e
+        except (urllib.error.URLError, OSError) as e:
+            raise ApiUnavailable(f"{method}: {e}") from e
@@ -0,0 +1,184 @@
+# api_server.py
+"""Serve the Blog operations as a local HTTP/JSON API.
+
+    python api_server.py [--host 127.0.0.1] [--port 8765] [--workers 16]
+
+Every call is ``POST /api/<method>`` with a body of ``{"args": [...],
+"kwargs": {...}}`` (codec.py format) and answers ``{"result": ...}``.
+``log_in``, ``create_account`` and ``resume_session`` answer with a session
+token and the user's role as well; later calls send it as ``Authorization: Bearer <token>`` and
+``logout`` ends the session. ``GET /health`` reports pool and session counts.
+
+Requests are handled by a fixed pool of ``--workers`` threads that call
+the one shared BlogService with the caller's Session, over one connection
+pool and one query cache. Database connections grow with the workers, not
+with the number of connected clients, and bcrypt runs here instead of on
+every client.
+"""
+import argparse
+import inspect
+import os
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import codec
+from functions import Session, SessionManager, blog_service, db_client
+
+MAX_BODY = 1 << 20  # bytes
+SESSION_TTL = float(os.environ.get("MINIBLOG_API_SESSION_TTL", str(8 * 3600)))  # idle seconds
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+class BlogApiHandler(BaseHTTPRequestHandler):
+    server_version = "MiniBlogAPI/1.0"
+    # one request per connection: a kept-alive idle client would otherwise
+    # hold one of the fixed workers
+    protocol_version = "HTTP/1.0"
+
+    # ------------------------- ROUTING ------------------------- #
+    def do_GET(self):
+        if self.path != "/health":
+            return self._send(404, {"error": "not found"})
+        self._send(200, {
+            "result": {
+                "sessions": len(self.server.sessions),
+                "pool": db_client.pool_stats(),
+                "replicas": db_client.replica_stats(),
+            }
+        })
+
+    def do_POST(self):
+        try:
+            if not self.path.startswith("/api/"):
+                raise ApiError(404, "not found")
+            method = self.path[len("/api/"):]
+            args, kwargs = self._read_call()
+            self._send(200, self._dispatch(method, args, kwargs))
+        except ApiError as e:
+            self._send(e.status, {"error": str(e)})
+        except Exception as e:
+            print(f"❌ api error ({self.path}):", e)
+            self._send(500, {"error": "internal error"})
+
+    def _dispatch(self, method, args, kwargs):
+        if method in ("log_in", "create_account", "resume_session"):
+            session = Session()
+            if not self._call(method, session, args, kwargs):
+                return {"result": False}
+            # the client answers is_admin() from this, without a round trip
+            try:
+                profile = blog_service.get_user_profile(session) or {}
+            except Exception as e:
+                print("❌ api profile error:", e)
+                profile = {}
+            return {
+                "result": True,
+                "token": self.server.sessions.create(session),
+                "user_id": session.user_id,
+                "user_name": session.user_name,
+                "role": profile.get("role"),
+            }
+        if method == "logout":
+            return {"result": self.server.sessions.drop(self._token())}
+        if method not in codec.BLOG_API:
+            raise ApiError(404, f"unknown method {method!r}")
+
+        session = self.server.sessions.get(self._token())
+        if session is None:
+            raise ApiError(401, "not logged in")
+        return {"result": self._call(method, session, args, kwargs)}
+
+    def _call(self, method, session, args, kwargs):
+        fn = getattr(blog_service, method)
+        try:
+            inspect.signature(fn).bind(session, *args, **kwargs)
+        except TypeError as e:
+            raise ApiError(400, f"{method}: {e}")
+        return fn(session, *args, **kwargs)
+
+    # ------------------------- HELPERS ------------------------- #
+    def _token(self):
+        header = self.headers.get("Authorization", "")
+        return header[len("Bearer "):] if header.startswith("Bearer ") else None
+
+    def _read_call(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length > MAX_BODY:
+            raise ApiError(413, "request too large")
+        try:
+            body = codec.loads(self.rfile.read(length)) if length else {}
+        except ValueError:
+            raise ApiError(400, "body is not valid JSON")
+        if not isinstance(body, dict):
+            raise ApiError(400, "body must be an object")
+        args, kwargs = body.get("args", []), body.get("kwargs", {})
+        if not isinstance(args, list) or not isinstance(kwargs, dict):
+            raise ApiError(400, "args must be a list and kwargs an object")
+        return args, kwargs
+
+    def _send(self, status, payload):
+        data = codec.dumps(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass  # per-request lines would drown the console; errors still print
+
+
+class BlogApiServer(HTTPServer):
+    """HTTPServer that hands each connection to a fixed worker pool."""
+
+    request_queue_size = 128
+
+    def __init__(self, address, workers=16, sessions=None):
+        super().__init__(address, BlogApiHandler)
+        self.sessions = sessions if sessions is not None else SessionManager(SESSION_TTL)
+        blog_service.sessions = self.sessions
+        self._workers = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-worker")
+
+    def process_request(self, request, client_address):
+        self._workers.submit(self._handle, request, client_address)
+
+    def _handle(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self._workers.shutdown(wait=False, cancel_futures=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=16, help="request threads")
+    args = parser.parse_args(argv)
+
+    # one connection per worker; more would only sit idle
+    db_client.pool_max_size = max(db_client.pool_max_size, args.workers)
+    server = BlogApiServer((args.host, args.port), workers=args.workers)
+    print(f"MiniBlog API on http://{args.host}:{args.port} ({args.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        db_client.close()
+
+
+if __name__ == "__main__":
+    main()
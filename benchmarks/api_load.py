@@ -0,0 +1,223 @@
+# benchmarks/api_load.py
+"""Load test: desktop clients on MySQL directly vs. through api_server.py.
+
+    python benchmarks/api_load.py [--mode both] [--clients 50] [--duration 30]
+        [--url http://127.0.0.1:8765] [--server-workers 16]
+
+Each simulated client is its own process, like a desktop MiniBlogApp. It
+logs in as ``bench<n>`` (see generate_data.py) and then loops over a mix of
+reads: the community feed, a post, its comments and reactions, and the
+dashboard counters. ``direct`` clients use functions.Blog with their own
+connection pool; ``api`` clients use api_client.RemoteBlog. Without --url
+the API server is started for the run.
+
+Throughput and latency percentiles are printed for each mode, along with
+the peak number of MySQL connections (``Threads_connected``) during the
+run. Results are written to benchmarks/results/.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+
+# --------------------------- CLIENT ---------------------------- #
+def _client(mode, url, user_name, password, duration, ready, go, results):
+    """Runs in a child process."""
+    if mode == "api":
+        from api_client import RemoteBlog
+        blog = RemoteBlog(url)
+    else:
+        from functions import Blog
+        blog = Blog()
+
+    rng = random.Random(user_name)
+    if not blog.log_in(user_name, password):
+        ready.put(f"cannot log in as {user_name}")
+        return
+    ready.put(None)
+    go.wait()
+
+    samples, errors = [], 0
+    recent = []
+    end = time.perf_counter() + duration
+    while time.perf_counter() < end:
+        choice = rng.random()
+        start = time.perf_counter()
+        try:
+            if choice < 0.3 or not recent:
+                page = blog.get_all_blogs_page()
+                recent = [item["id"] for item in page["items"]] or recent
+            elif choice < 0.55:
+                blog.get_blog(rng.choice(recent))
+            elif choice < 0.8:
+                blog.get_comments_page(rng.choice(recent))
+            elif choice < 0.9:
+                blog.get_reaction_summary(rng.choice(recent))
+            else:
+                blog.get_user_statistics()
+        except Exception:
+            errors += 1
+            continue
+        samples.append((time.perf_counter() - start) * 1000)
+    results.put((samples, errors))
+
+
+# --------------------------- SERVER ---------------------------- #
+def _start_server(workers):
+    port = 8700 + random.randint(0, 99)
+    url = f"http://127.0.0.1:{port}"
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "api_server.py"),
+         "--port", str(port), "--workers", str(workers)],
+        cwd=ROOT,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"{url}/health", timeout=1).read()
+            return process, url
+        except OSError:
+            if process.poll() is not None:
+                break
+            time.sleep(0.2)
+    process.kill()
+    raise SystemExit("api_server.py did not come up")
+
+
+def _threads_connected(db_client):
+    db = db_client.get_db()
+    cursor = db.cursor()
+    try:
+        cursor.execute("SHOW GLOBAL STATUS LIKE 'Threads_connected'")
+        return int(cursor.fetchone()["Value"])
+    finally:
+        cursor.close()
+        db_client.release(db)
+
+
+# ----------------------------- RUN ----------------------------- #
+def run(mode, args, db_client):
+    server = None
+    url = args.url
+    if mode == "api" and not url:
+        server, url = _start_server(args.server_workers)
+
+    ctx = multiprocessing.get_context("spawn")  # children must not share sockets
+    ready, results, go = ctx.Queue(), ctx.Queue(), ctx.Event()
+    users = [f"{args.user_prefix}{n}" for n in range(1, args.clients + 1)]
+    clients = [
+        ctx.Process(target=_client,
+                    args=(mode, url, user, args.password, args.duration, ready, go, results))
+        for user in users
+    ]
+    try:
+        for process in clients:
+            process.start()
+        for _ in clients:
+            problem = ready.get(timeout=300)
+            if problem:
+                raise SystemExit(problem)
+
+        peak = {"value": _threads_connected(db_client)}
+        stop = threading.Event()
+
+        def sample():
+            while not stop.wait(0.5):
+                peak["value"] = max(peak["value"], _threads_connected(db_client))
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        began = time.perf_counter()
+        go.set()
+
+        samples, errors = [], 0
+        for _ in clients:
+            client_samples, client_errors = results.get(timeout=args.duration + 120)
+            samples.extend(client_samples)
+            errors += client_errors
+        elapsed = time.perf_counter() - began
+        stop.set()
+        sampler.join()
+    finally:
+        for process in clients:
+            process.join(timeout=10)
+            if process.is_alive():
+                process.kill()
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+
+    if len(samples) < 2:
+        raise SystemExit(f"{mode}: no successful requests ({errors} error(s))")
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "throughput": len(samples) / elapsed,
+        "p50": cuts[49],
+        "p95": cuts[94],
+        "p99": cuts[98],
+        "peak_connections": peak["value"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=("direct", "api", "both"), default="both")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=30, help="seconds of load per mode")
+    parser.add_argument("--url", help="an already running api_server.py")
+    parser.add_argument("--server-workers", type=int, default=16)
+    parser.add_argument("--user-prefix", default="bench")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--out", help="results file (default: benchmarks/results/<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    from functions import db_client
+
+    modes = ("direct", "api") if args.mode == "both" else (args.mode,)
+    results = {}
+    print(f"{'mode':<8} {'req/s':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'errors':>7} {'mysql conns':>12}")
+    for mode in modes:
+        r = results[mode] = run(mode, args, db_client)
+        print(
+            f"{mode:<8} {r['throughput']:>9.1f} {r['p50']:>8.2f} {r['p95']:>8.2f} "
+            f"{r['p99']:>8.2f} {r['errors']:>7} {r['peak_connections']:>12}"
+        )
+
+    report = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "clients": args.clients,
+            "duration": args.duration,
+            "server_workers": args.server_workers,
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+    out = args.out or os.path.join(
+        RESULTS_DIR, datetime.now().strftime("api_load-%Y%m%d-%H%M%S.json")
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"results written to {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# benchmarks/bcrypt_cost.py
+"""Measure bcrypt latency and throughput for a range of work factors.
+
+    python benchmarks/bcrypt_cost.py [--min 10] [--max 14] [--workers 2]
+
+Use it to pick MINIBLOG_BCRYPT_ROUNDS for a deployment: the login path pays
+one hash, and --workers should match MINIBLOG_BCRYPT_WORKERS.
+"""
+import argparse
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+PASSWORD = b"correct horse battery staple"
+
+
+def latency(rounds, samples):
+    """Median and worst wall time of one hashpw call, in milliseconds."""
+    times = []
+    for _ in range(samples):
+        salt = bcrypt.gensalt(rounds)
+        start = time.perf_counter()
+        bcrypt.hashpw(PASSWORD, salt)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times), max(times)
+
+
+def throughput(rounds, workers, seconds):
+    """Hashes per second with ``workers`` threads hashing for ``seconds``."""
+    deadline = time.perf_counter() + seconds
+
+    def worker():
+        done = 0
+        while time.perf_counter() < deadline:
+            bcrypt.hashpw(PASSWORD, bcrypt.gensalt(rounds))
+            done += 1
+        return done
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        total = sum(pool.map(lambda _: worker(), range(workers)))
+    return total / (time.perf_counter() - start)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min", type=int, default=10, help="lowest cost to try")
+    parser.add_argument("--max", type=int, default=14, help="highest cost to try")
+    parser.add_argument("--samples", type=int, default=5, help="hashes per latency sample")
+    parser.add_argument(
+        "--workers", type=int,
+        default=int(os.environ.get("MINIBLOG_BCRYPT_WORKERS", "2")),
+        help="threads for the throughput run",
+    )
+    parser.add_argument("--seconds", type=float, default=3.0, help="length of each throughput run")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="acceptable login hash time")
+    args = parser.parse_args(argv)
+
+    print(f"{'cost':>4}  {'median ms':>10}  {'max ms':>8}  {'hashes/s':>9}  (workers={args.workers})")
+    recommended = None
+    for rounds in range(args.min, args.max + 1):
+        median, worst = latency(rounds, args.samples)
+        rate = throughput(rounds, args.workers, args.seconds)
+        print(f"{rounds:>4}  {median:>10.1f}  {worst:>8.1f}  {rate:>9.1f}")
+        if median <= args.target_ms:
+            recommended = rounds
+
+    if recommended is None:
+        print(f"no cost in range hashes within {args.target_ms:.0f} ms")
+    else:
+        print(f"highest cost within {args.target_ms:.0f} ms: MINIBLOG_BCRYPT_ROUNDS={recommended}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+# benchmarks/blog_methods.py
+"""Time the public Blog methods and compare against a saved baseline.
+
+    python benchmarks/blog_methods.py [--user bench1] [--iterations 100]
+        [--out results.json] [--baseline baseline.json] [--save-baseline]
+
+Run it against data from generate_data.py. Each method is called
+``--iterations`` times after a short warm-up, with the query cache cleared
+before every call (pass --cache to measure cached reads instead). Results
+hold p50/p95/p99/mean in milliseconds. With --baseline, a method whose p95
+grew by more than --threshold (and by at least --min-delta-ms) counts as a
+regression and the exit status is 1.
+"""
+import argparse
+import itertools
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cache import query_cache  # noqa: E402
+from functions import Blog, db_client  # noqa: E402
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+
+def _sample_targets():
+    """Ids worth reading: the busiest thread and a spread of recent posts."""
+    db = db_client.get_db()
+    cursor = db.cursor()
+    try:
+        cursor.execute("SELECT id FROM blog WHERE dlt=0 ORDER BY comment_count DESC LIMIT 1")
+        hot = cursor.fetchone()
+        cursor.execute("SELECT id FROM blog WHERE dlt=0 ORDER BY created_at DESC, id DESC LIMIT 200")
+        recent = [row["id"] for row in cursor.fetchall()]
+        cursor.execute("SELECT COUNT(*) AS n FROM blog")
+        posts = cursor.fetchone()["n"]
+        cursor.execute("SELECT COUNT(*) AS n FROM user_info")
+        users = cursor.fetchone()["n"]
+    finally:
+        cursor.close()
+        db_client.release(db)
+    if not recent:
+        raise SystemExit("no posts found; run benchmarks/generate_data.py first")
+    return {
+        "hot_post": hot["id"] if hot else recent[0],
+        "recent": recent,
+        "dataset": {"posts": posts, "users": users},
+    }
+
+
+def _deep_cursor(fetch, pages):
+    """The cursor ``pages`` pages into a feed, for timing deep pagination."""
+    cursor = None
+    for _ in range(pages):
+        page = fetch(cursor)
+        if page["next_cursor"] is None:
+            break
+        cursor = page["next_cursor"]
+    return cursor
+
+
+def build_cases(blog, user_name, password, targets, writes):
+    posts = itertools.cycle(targets["recent"])
+
+    def next_post():
+        return next(posts)
+
+    deep_feed = _deep_cursor(blog.get_all_blogs_page, 25)
+    deep_comments = _deep_cursor(
+        lambda cursor: blog.get_comments_page(targets["hot_post"], cursor), 10
+    )
+
+    def profile():
+        blog.session.profile = None  # otherwise only the first call reads MySQL
+        return blog.get_user_profile()
+
+    cases = {
+        "log_in": lambda: blog.log_in(user_name, password),
+        "get_user_profile": profile,
+        "get_user_statistics": blog.get_user_statistics,
+        "view_user_blogs_page": blog.view_user_blogs_page,
+        "view_deleted_blogs_page": blog.view_deleted_blogs_page,
+        "get_all_blogs_page": blog.get_all_blogs_page,
+        "get_all_blogs_page[deep]": lambda: blog.get_all_blogs_page(deep_feed),
+        "search_blogs[community]": lambda: blog.search_blogs("python cache", "community"),
+        "search_blogs[mine]": lambda: blog.search_blogs("python", "mine"),
+        "search_blogs[short]": lambda: blog.search_blogs("ci", "community"),
+        "get_blog": lambda: blog.get_blog(next_post()),
+        "get_comments_page[hot]": lambda: blog.get_comments_page(targets["hot_post"]),
+        "get_comments_page[deep]": lambda: blog.get_comments_page(targets["hot_post"], deep_comments),
+        "get_reaction_summary": lambda: blog.get_reaction_summary(next_post()),
+        "list_users": blog.list_users,
+    }
+    if writes:
+        toggle = {"value": None}
+
+        def react():
+            toggle["value"] = None if toggle["value"] else "like"
+            return blog.set_reaction(targets["hot_post"], toggle["value"])
+
+        cases["set_reaction"] = react
+        cases["add_comment"] = lambda: blog.add_comment(next_post(), "benchmark comment")
+    return cases
+
+
+def time_case(fn, iterations, warmup, use_cache):
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iterations):
+        if not use_cache:
+            query_cache.clear()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {
+        "n": len(samples),
+        "p50": cuts[49],
+        "p95": cuts[94],
+        "p99": cuts[98],
+        "mean": statistics.fmean(samples),
+        "max": max(samples),
+    }
+
+
+def compare(results, baseline, threshold, min_delta_ms):
+    """Methods whose p95 regressed against ``baseline``."""
+    regressions = []
+    for name, now in results.items():
+        before = baseline.get("results", {}).get(name)
+        if not before:
+            continue
+        delta = now["p95"] - before["p95"]
+        if delta >= min_delta_ms and now["p95"] > before["p95"] * (1 + threshold):
+            regressions.append((name, before["p95"], now["p95"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--user", default="bench1", help="account to run as (an admin for list_users)")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--only", nargs="*", help="run just these cases")
+    parser.add_argument("--cache", action="store_true", help="keep the query cache between calls")
+    parser.add_argument("--writes", action="store_true", help="also time set_reaction and add_comment")
+    parser.add_argument("--out", help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results to --baseline")
+    parser.add_argument("--threshold", type=float, default=0.2, help="allowed p95 growth (0.2 = 20%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="ignore smaller p95 changes")
+    args = parser.parse_args(argv)
+    if args.iterations < 2:
+        parser.error("--iterations must be at least 2 to compute percentiles")
+
+    blog = Blog()
+    if not blog.log_in(args.user, args.password):
+        raise SystemExit(f"cannot log in as {args.user}")
+    targets = _sample_targets()
+    cases = build_cases(blog, args.user, args.password, targets, args.writes)
+    if args.only:
+        cases = {name: fn for name, fn in cases.items() if name in args.only}
+
+    results = {}
+    print(f"{'method':<28} {'p50':>8} {'p95':>8} {'p99':>8}  (ms)")
+    for name, fn in cases.items():
+        results[name] = time_case(fn, args.iterations, args.warmup, args.cache)
+        r = results[name]
+        print(f"{name:<28} {r['p50']:>8.2f} {r['p95']:>8.2f} {r['p99']:>8.2f}")
+
+    report = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "user": args.user,
+            "iterations": args.iterations,
+            "cache": args.cache,
+            "python": platform.python_version(),
+            "dataset": targets["dataset"],
+            "pool": db_client.pool_stats(),
+        },
+        "results": results,
+    }
+
+    out = args.out or os.path.join(
+        RESULTS_DIR, datetime.now().strftime("blog_methods-%Y%m%d-%H%M%S.json")
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"results written to {out}")
+
+    if not args.baseline:
+        return
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"baseline saved to {args.baseline}")
+        return
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+    for name, before, now in regressions:
+        print(f"❌ {name}: p95 {before:.2f} ms -> {now:.2f} ms")
+    if regressions:
+        raise SystemExit(1)
+    print("no regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
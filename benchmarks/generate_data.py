@@ -0,0 +1,183 @@
+# benchmarks/generate_data.py
+"""Fill a local MiniBlog database with a synthetic, skewed dataset.
+
+    python benchmarks/generate_data.py --users 10000 --posts 200000 \
+        --comments 1000000 --reactions 2000000 [--out data/] [--no-load]
+
+Activity follows a Zipf-like distribution: a few users write most posts,
+and a few posts draw most comments and reactions. Every user is called
+``bench<id>`` with the password ``password`` (stored pre-hashed, so loading
+a million users costs one bcrypt call). Files are written as JSON Lines
+and loaded with import_data.py, which also rebuilds the counters.
+"""
+import argparse
+import bisect
+import itertools
+import json
+import os
+import random
+import sys
+import time
+from array import array
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import bcrypt  # noqa: E402
+
+from functions import BCRYPT_ROUNDS, db_client  # noqa: E402
+from import_data import import_file, rebuild_derived  # noqa: E402
+
+PASSWORD = "password"
+WORDS = (
+    "python database index latency cache query travel recipe music photo "
+    "camera fitness review cloud design garden coffee mountain city story "
+    "summer winter music guitar science history football coding startup"
+).split()
+
+
+class ZipfPicker:
+    """Pick ids ``first .. first+n-1`` with probability ~ 1 / rank ** skew.
+
+    Ranks are shuffled over the ids so the popular rows are not simply the
+    oldest ones.
+    """
+
+    def __init__(self, rng, first, n, skew):
+        self._rng = rng
+        self._ids = list(range(first, first + n))
+        rng.shuffle(self._ids)
+        self._cum = list(itertools.accumulate(1 / rank ** skew for rank in range(1, n + 1)))
+
+    def pick(self):
+        index = bisect.bisect_left(self._cum, self._rng.random() * self._cum[-1])
+        return self._ids[min(index, len(self._ids) - 1)]
+
+
+def _sentence(rng, low, high):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+def _max_id(table):
+    db = db_client.get_db()
+    cursor = db.cursor()
+    try:
+        cursor.execute(f"SELECT COALESCE(MAX(id), 0) AS max_id FROM {table}")
+        return int(cursor.fetchone()["max_id"])
+    finally:
+        cursor.close()
+        db_client.release(db)
+
+
+def generate(args):
+    rng = random.Random(args.seed)
+    os.makedirs(args.out, exist_ok=True)
+    first_user = (0 if args.no_load else _max_id("user_info")) + 1
+    first_post = (0 if args.no_load else _max_id("blog")) + 1
+    now = datetime.now()
+    start = now - timedelta(days=args.days)
+    span = (now - start).total_seconds()
+    password_hash = bcrypt.hashpw(PASSWORD.encode("utf-8"), bcrypt.gensalt(BCRYPT_ROUNDS)).decode()
+
+    def write(name, rows):
+        path = os.path.join(args.out, name)
+        with open(path, "w", encoding="utf-8") as f:
+            for row in rows:
+                f.write(json.dumps(row) + "\n")
+        return path
+
+    def users():
+        for user_id in range(first_user, first_user + args.users):
+            yield {
+                "id": user_id,
+                "first_name": f"Bench{user_id}",
+                "last_name": "User",
+                "email": f"bench{user_id}@example.com",
+                "contact": f"0170{user_id:07d}",
+                "bio": _sentence(rng, 3, 10),
+                "user_name": f"bench{user_id}",
+                "password": password_hash,
+                "role": "admin" if user_id == first_user else "user",
+            }
+
+    post_times = array("d")
+
+    def posts():
+        authors = ZipfPicker(rng, first_user, args.users, args.skew)
+        offsets = sorted(rng.random() * span for _ in range(args.posts))
+        for blog_id, offset in enumerate(offsets, start=first_post):
+            post_times.append(offset)
+            body = "\n\n".join(_sentence(rng, 40, 120) for _ in range(rng.randint(1, 6)))
+            yield {
+                "id": blog_id,
+                "title": _sentence(rng, 2, 7).title(),
+                "main_blog": body,
+                "created_by": authors.pick(),
+                "dlt": 1 if rng.random() < args.deleted else 0,
+                "created_at": (start + timedelta(seconds=offset)).strftime("%Y-%m-%d %H:%M:%S"),
+            }
+
+    def comments():
+        targets = ZipfPicker(rng, first_post, args.posts, args.skew)
+        commenters = ZipfPicker(rng, first_user, args.users, args.skew)
+        for _ in range(args.comments):
+            blog_id = targets.pick()
+            posted = post_times[blog_id - first_post]
+            offset = posted + rng.random() * (span - posted)
+            yield {
+                "blog_id": blog_id,
+                "user_id": commenters.pick(),
+                "comment_text": _sentence(rng, 3, 40),
+                "created_at": (start + timedelta(seconds=offset)).strftime("%Y-%m-%d %H:%M:%S"),
+            }
+
+    def reactions():
+        targets = ZipfPicker(rng, first_post, args.posts, args.skew)
+        for _ in range(args.reactions):
+            yield {
+                "blog_id": targets.pick(),
+                "user_id": rng.randint(first_user, first_user + args.users - 1),
+                "reaction": "like" if rng.random() < args.like_ratio else "dislike",
+            }
+
+    files = []
+    for name, rows in (
+        ("users.jsonl", users()),
+        ("posts.jsonl", posts()),
+        ("comments.jsonl", comments()),
+        ("reactions.jsonl", reactions()),
+    ):
+        began = time.perf_counter()
+        files.append(write(name, rows))
+        print(f"wrote {files[-1]} in {time.perf_counter() - began:.1f}s")
+    return files
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--posts", type=int, default=20000)
+    parser.add_argument("--comments", type=int, default=100000)
+    parser.add_argument("--reactions", type=int, default=200000)
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent (0 = uniform)")
+    parser.add_argument("--deleted", type=float, default=0.05, help="share of posts in the recycle bin")
+    parser.add_argument("--like-ratio", type=float, default=0.8)
+    parser.add_argument("--days", type=int, default=365, help="age of the oldest post")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default="benchmarks/data", help="directory for the JSONL files")
+    parser.add_argument("--batch-size", type=int, default=2000)
+    parser.add_argument("--no-load", action="store_true", help="only write the files")
+    args = parser.parse_args(argv)
+    if min(args.users, args.posts) < 1:
+        parser.error("--users and --posts must be at least 1")
+
+    files = generate(args)
+    if args.no_load:
+        return
+    for kind, path in zip(("users", "posts", "comments", "reactions"), files):
+        import_file(kind, path, batch_size=args.batch_size, restart=True)
+    rebuild_derived("reactions")
+
+
+if __name__ == "__main__":
+    main()
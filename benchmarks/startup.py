@@ -0,0 +1,153 @@
+# benchmarks/startup.py
+"""Cold-start timings of the desktop app: first paint and time to interactive.
+
+    python benchmarks/startup.py [--scenario both] [--runs 5]
+        [--api-url http://127.0.0.1:8765] [--user bench1]
+
+Each run starts ``blog_gui.py`` in a fresh process with
+MINIBLOG_STARTUP_EXIT=1, which makes the app print its startup marks
+(metrics.startup) once it is interactive and quit. ``login`` starts with no
+remembered token (interactive = login form drawn and the connection warmed
+up); ``resume`` starts with a fresh token for --user (see generate_data.py),
+so interactive means the dashboard is showing its data. --api-url runs the
+app as a thin client of an already running api_server.py.
+
+Each scenario gets its own local mirror (mirror.py): the first run starts
+with it empty and fills it, later runs draw from it. --no-mirror turns it
+off to time the server round trip alone.
+
+Reported per scenario: median and worst first paint, interactive and wall
+time (process spawn to report, interpreter start included), and whether
+pymysql/bcrypt were loaded before the first paint. Needs a display.
+Results are written to benchmarks/results/.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RESULTS_DIR = os.path.join(ROOT, "benchmarks", "results")
+
+
+def _remembered_token(args, token_file):
+    """Log in once and leave a token where the app will look for it."""
+    if args.api_url:
+        from api_client import RemoteBlog
+        blog, target = RemoteBlog(args.api_url), args.api_url
+    else:
+        from functions import Blog, db_client
+        blog = Blog()
+        target = f"mysql://{db_client.host}:{db_client.port}/{db_client.database}"
+    if not blog.log_in(args.user, args.password):
+        raise SystemExit(f"cannot log in as {args.user}")
+
+    import remember
+    remember.TOKEN_FILE = token_file
+    token = blog.issue_login_token()
+    remember.save_token(target, token, args.user)
+    return blog, token
+
+
+def start_once(env, timeout):
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "blog_gui.py")],
+        cwd=ROOT, env=env, stdout=subprocess.PIPE, text=True,
+    )
+    try:
+        for line in process.stdout:
+            if line.startswith("{"):
+                wall = (time.perf_counter() - start) * 1000
+                report = json.loads(line)
+                break
+        else:
+            raise SystemExit(f"blog_gui.py exited ({process.wait()}) without a startup report")
+        process.wait(timeout=timeout)
+    finally:
+        if process.poll() is None:
+            process.kill()
+    return dict(report["marks"], wall=wall), report["modules_at_first_paint"]
+
+
+def run(scenario, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        token_file = os.path.join(tmp, "login_token")
+        env = dict(
+            os.environ,
+            MINIBLOG_STARTUP_EXIT="1",
+            MINIBLOG_TOKEN_FILE=token_file,
+            MINIBLOG_MIRROR_FILE="off" if args.no_mirror else os.path.join(tmp, "mirror.sqlite3"),
+        )
+        if args.api_url:
+            env["MINIBLOG_API_URL"] = args.api_url
+
+        samples, preloaded = [], set()
+        for _ in range(args.runs):
+            login = _remembered_token(args, token_file) if scenario == "resume" else None
+            marks, modules = start_once(env, args.timeout)
+            samples.append(marks)
+            preloaded.update(modules)
+            if login is not None:
+                blog, token = login
+                blog.revoke_login_token(token)
+                blog.clear_session()
+
+    result = {"runs": len(samples), "preloaded": sorted(preloaded)}
+    for name in ("first_paint", "interactive", "wall"):
+        values = [marks[name] for marks in samples]
+        result[name] = {"median": statistics.median(values), "max": max(values)}
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=("login", "resume", "both"), default="both")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--api-url", help="run the app against this api_server.py")
+    parser.add_argument("--no-mirror", action="store_true", help="start without the local mirror")
+    parser.add_argument("--user", default="bench1")
+    parser.add_argument("--password", default="password")
+    parser.add_argument("--timeout", type=float, default=60, help="seconds per start")
+    parser.add_argument("--out", help="results file (default: benchmarks/results/<timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    scenarios = ("login", "resume") if args.scenario == "both" else (args.scenario,)
+    results = {}
+    print(f"{'scenario':<9} {'first paint':>12} {'interactive':>12} {'wall':>9}  preloaded")
+    for scenario in scenarios:
+        r = results[scenario] = run(scenario, args)
+        print(
+            f"{scenario:<9} {r['first_paint']['median']:>10.0f}ms {r['interactive']['median']:>10.0f}ms "
+            f"{r['wall']['median']:>7.0f}ms  {', '.join(r['preloaded']) or '-'}"
+        )
+
+    report = {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "runs": args.runs,
+            "api_url": args.api_url,
+            "mirror": not args.no_mirror,
+            "python": platform.python_version(),
+        },
+        "results": results,
+    }
+    out = args.out or os.path.join(
+        RESULTS_DIR, datetime.now().strftime("startup-%Y%m%d-%H%M%S.json")
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"results written to {out}")
+
+
+if __name__ == "__main__":
+    main()
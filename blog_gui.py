@@ -1,18 +1,42 @@
 # blog_gui.py
+import time
+
+STARTED = time.perf_counter()  # startup timings (metrics.startup) count from here
+
+import json
+import os
+import sys
+
 import customtkinter as ctk
 from tkinter import messagebox
 from typing import Optional
 
-from functions import Blog
+from api_client import RemoteBlog
+from cache import query_cache
+from functions import Blog, db_client
+from metrics import query_stats, render_stats, stall_watchdog, startup, ui_report
+from mirror import LocalMirror
+from remember import forget_token, load_token, save_token
+from tasks import CoalescingWriter, TaskRunner
+from widgets import VirtualList
 
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Fixed card heights for the virtualized lists (card + 12px margin each side).
+DASHBOARD_ROW_HEIGHT = 230
+FEED_ROW_HEIGHT = 250
+TRASH_ROW_HEIGHT = 150
+
+# Like/dislike clicks within this window are merged into one write.
+REACTION_WRITE_DELAY_MS = 400
+
 
 class MiniBlogApp(ctk.CTk):
     """Modern CustomTkinter client for the MiniBlog backend."""
 
     def __init__(self):
+        startup.begin(STARTED)
         super().__init__()
         self.title("Blog Asist")
         # full size window
@@ -26,11 +50,28 @@ class MiniBlogApp(ctk.CTk):
         except Exception:
             pass
 
-        self.blog = Blog()
+        # MINIBLOG_API_URL runs the GUI as a thin client of api_server.py
+        self.api_url = os.environ.get("MINIBLOG_API_URL")
+        # what a remembered login token belongs to
+        self.backend = self.api_url or (
+            f"mysql://{db_client.host}:{db_client.port}/{db_client.database}"
+        )
+        self.blog = self._new_blog()
+        # first pages, counters and profile from the last run, drawn before
+        # the server answers (mirror.py)
+        self.mirror = LocalMirror(self.backend)
+        self.tasks = TaskRunner(self)
         self.current_view: Optional[str] = None
         self.nav_buttons: dict[str, ctk.CTkButton] = {}
+        # pages built once and re-shown, keyed by view name (see _show_cached_view)
+        self._views: dict[str, ctk.CTkFrame] = {}
+        self._detail_page = None  # the open post, for render_stats
+        self._sidebar_auth = None
+        self._role_loading = False
         self.dashboard_search_var = ctk.StringVar()
         self.community_search_var = ctk.StringVar()
+        self.remember_var = ctk.BooleanVar(value=True)
+        self._modules_at_first_paint = []
 
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
@@ -45,13 +86,167 @@ class MiniBlogApp(ctk.CTk):
         self.content.grid_rowconfigure(1, weight=1)
         self.content.grid_rowconfigure(2, weight=1)
 
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.bind("<F12>", lambda _e: self.show_perf_report())
+
+        # Only the shell is built here; the database is not touched until the
+        # main loop has drawn it (see _on_first_paint).
         self._build_sidebar()
-        self.show_login()
+        token = self._show_first_view()
+        stall_watchdog.start(self)
+        self.after(0, lambda: self.after_idle(self._on_first_paint, token))
+
+    def _new_blog(self):
+        return RemoteBlog(self.api_url) if self.api_url else Blog()
+
+    def _show_first_view(self):
+        """The login form, or a placeholder while a remembered login is
+        checked. Returns the remembered token, if any."""
+        token = load_token(self.backend)
+        if not token:
+            self.show_login()
+            return None
+
+        self._select_view("login")
+        self.clear_content()
+        ctk.CTkLabel(
+            self.content, text="Signing you back in…", font=("Montserrat", 16), text_color="#94a3b8"
+        ).grid(row=0, column=0, pady=60)
+        return token
+
+    def _on_first_paint(self, token):
+        """Runs once the first frame is on screen: start the background work
+        __init__ held back."""
+        startup.mark("first_paint")
+        self._modules_at_first_paint = sorted(
+            name for name in ("pymysql", "bcrypt") if name in sys.modules
+        )
+        if token:
+            self._resume_or_login(token)
+            return
+
+        def warmed(_ok):
+            self._mark_interactive()
+
+        # connect (and load bcrypt) while the user types their password
+        self.tasks.submit(self.blog.warm_up, on_done=warmed, on_error=warmed, group="startup")
+
+    def _resume_or_login(self, token):
+        """Go straight to the dashboard when a remembered login is still valid."""
+
+        def done(ok):
+            if ok:
+                self.show_dashboard()  # the stats arriving mark it interactive
+            else:
+                forget_token()  # expired or revoked
+                self.show_login()
+                self._mark_interactive()
+
+        def failed(exc):
+            print("❌ resume session error:", exc)
+            self.show_login()
+            self._mark_interactive()
+
+        self.tasks.submit(self._resume_and_load, token, on_done=done, on_error=failed)
+
+    def _resume_and_load(self, token):
+        """Worker side of a remembered login: resume, then fetch what the
+        dashboard shows first so it opens from the query cache."""
+        if not self.blog.resume_session(token):
+            return False
+        if self.blog.cached_role is None:
+            # the sidebar reads the role from here (see _is_admin)
+            self.blog.get_user_profile()
+        if self.mirror.get(self.blog.user_id, "stats") is None:
+            # nothing to draw from yet: fetch the data along with the login
+            try:
+                self.blog.load_dashboard()
+            except Exception as e:
+                print("❌ dashboard preload error:", e)
+        return True
+
+    def _mark_interactive(self):
+        if "interactive" in startup.marks:
+            return
+        startup.mark("interactive")
+        if os.environ.get("MINIBLOG_STARTUP_EXIT"):
+            # benchmarks/startup.py: report on stdout and quit
+            print(json.dumps({
+                "marks": startup.marks,
+                "modules_at_first_paint": self._modules_at_first_paint,
+            }), flush=True)
+            self.after_idle(self._on_close)
+
+    def _on_close(self):
+        stall_watchdog.stop()
+        self.tasks.shutdown()
+        self.mirror.close()
+        self.destroy()
+
+    def _mirrored(self, name, fetch):
+        """Wrap ``fetch`` so what it returns also replaces the mirror's copy of
+        ``name``. ``fetch`` is either a page fetch, of which only the first
+        page (cursor None) is kept, or a call without arguments."""
+        user_id = self.blog.user_id
+
+        def call(*args):
+            result = fetch(*args)
+            if not args or args[0] is None:
+                self.mirror.put(user_id, name, result)
+            return result
+
+        return call
+
+    def show_perf_report(self):
+        """F12: view build times, event-loop stalls and query totals."""
+        report = ui_report()
+        window = ctk.CTkToplevel(self)
+        window.title("Performance report")
+        window.geometry("900x520")
+        box = ctk.CTkTextbox(window, font=("Courier", 12), wrap="none")
+        box.pack(fill="both", expand=True, padx=12, pady=12)
+        box.insert("1.0", report)
+        box.configure(state="disabled")
 
     # ------ UI helpers
+    def _auth_state(self):
+        """Who the sidebar and cached views were built for."""
+        if not self.blog.user_id:
+            return None
+        return self.blog.user_id, self._is_admin()
+
+    def _is_admin(self):
+        """From the profile the login or startup task prefetched, so the Tk
+        thread never waits on the database. While the role is unknown the
+        user counts as non-admin and _load_role fetches it."""
+        role = self.blog.cached_role
+        if role is None and self.blog.user_id:
+            self._load_role()
+        return (role or "").lower() == "admin"
+
+    def _load_role(self):
+        """Fetch the profile in the background, then rebuild the sidebar if
+        the role adds the admin button."""
+        if self._role_loading:
+            return
+        self._role_loading = True
+        user_id = self.blog.user_id
+
+        def done(_profile):
+            self._role_loading = False
+            if self.blog.user_id == user_id and self._auth_state() != self._sidebar_auth:
+                self._build_sidebar()
+
+        def failed(exc):
+            self._role_loading = False
+            print("❌ role load error:", exc)
+
+        self.tasks.submit(self.blog.get_user_profile, on_done=done, on_error=failed, group="role")
+
     def _build_sidebar(self):
         for widget in self.sidebar.winfo_children():
             widget.destroy()
+        self._sidebar_auth = self._auth_state()
 
         ctk.CTkLabel(
             self.sidebar, text="MiniBlog", font=("Montserrat", 26, "bold")
@@ -79,13 +274,9 @@ class MiniBlogApp(ctk.CTk):
             ]
 
             # Add admin button if user is admin
-            try:
-                if self.blog.is_admin():
-                    # insert admin before "Account"
-                    buttons.insert(-1, ("Admin Panel", self.show_admin_panel, "admin"))
-            except Exception:
-                # don't break the sidebar if role check fails
-                pass
+            if self._sidebar_auth[1]:
+                # insert admin before "Account"
+                buttons.insert(-1, ("Admin Panel", self.show_admin_panel, "admin"))
         else:
             buttons = [
                 ("Login", self.show_login, "login"),
@@ -128,11 +319,57 @@ class MiniBlogApp(ctk.CTk):
 
     def _select_view(self, view_name: str):
         self.current_view = view_name
-        self._build_sidebar()
+        if self._auth_state() != self._sidebar_auth:
+            # another user (or role) gets other buttons and other data
+            self._drop_views()
+            self._build_sidebar()
+        else:
+            self._update_nav_buttons()
+
+    def _update_nav_buttons(self):
+        for key, btn in self.nav_buttons.items():
+            is_active = key == self.current_view
+            if (btn.cget("state") == "disabled") != is_active:
+                btn.configure(
+                    fg_color="#2563eb" if is_active else "#1f2937",
+                    state="disabled" if is_active else "normal",
+                )
 
     def clear_content(self):
+        """Destroy the transient view (forms, blog detail) and hide cached pages."""
+        # results for the view being torn down are no longer wanted
+        self.tasks.cancel("view")
+        cached_pages = set(self._views.values())
         for widget in self.content.winfo_children():
-            widget.destroy()
+            if widget in cached_pages:
+                widget.grid_remove()
+            else:
+                widget.destroy()
+
+    def _show_cached_view(self, name, build):
+        """Show the page for ``name``, calling ``build(page)`` the first time.
+
+        Returns ``(page, created)``; when ``created`` is False the caller
+        refreshes the existing widgets instead of rebuilding them.
+        """
+        self.clear_content()
+        page = self._views.get(name)
+        if page is not None:
+            page.grid()
+            return page, False
+
+        page = ctk.CTkFrame(self.content, fg_color="transparent")
+        page.grid(row=0, column=0, rowspan=3, sticky="nsew")
+        page.grid_columnconfigure(0, weight=1)
+        self._views[name] = page
+        build(page)
+        return page, True
+
+    def _drop_views(self):
+        for name, page in self._views.items():
+            self.tasks.cancel(name)
+            page.destroy()
+        self._views = {}
 
     
 
@@ -188,9 +425,14 @@ class MiniBlogApp(ctk.CTk):
         )
         self.login_pass.pack(pady=12)
 
-        ctk.CTkButton(
+        ctk.CTkCheckBox(
+            card, text="Remember me", variable=self.remember_var, font=("Montserrat", 13)
+        ).pack(pady=(8, 0))
+
+        self.login_btn = ctk.CTkButton(
             card, text="Log in", width=200, height=42, command=self.login_action
-        ).pack(pady=(20, 8))
+        )
+        self.login_btn.pack(pady=(16, 8))
 
         ctk.CTkButton(
             card,
@@ -263,16 +505,59 @@ class MiniBlogApp(ctk.CTk):
         ).grid(row=idx + 2, column=0, columnspan=2, pady=(0, 25))
 
     # --------------- Dashboard
+    # count only the view's own page: content also holds every cached page
+    @render_stats.timed("dashboard", root=lambda app: app._views.get("dashboard"))
     def show_dashboard(self):
         if not self._ensure_logged_in():
             return
 
         self._select_view("dashboard")
-        self.clear_content()
-        self._build_sidebar()
+        page, created = self._show_cached_view("dashboard", self._build_dashboard)
+
+        search = (self.dashboard_search_var.get() or "").strip().lower()
+        if not created:
+            if search != page.search:
+                page.search = search
+                page.list_view.reload(*self._dashboard_source(search))
+            else:
+                page.list_view.refresh()
+
+        def fill_stats(stats):
+            for key, value_label in page.stat_labels.items():
+                text = str(stats[key])
+                if value_label.cget("text") != text:
+                    value_label.configure(text=text)
+            self._mark_interactive()
+
+        if created:
+            stored = self.mirror.get(self.blog.user_id, "stats")
+            if stored is not None:
+                fill_stats(stored)
+        self.tasks.submit(
+            self._mirrored("stats", self.blog.get_user_statistics), on_done=fill_stats
+        )
+
+    def _dashboard_source(self, search):
+        """``(fetch_page, empty_text, peek_page)`` for the dashboard list;
+        only the unfiltered list is mirrored."""
+        if search:
+            return (
+                lambda cursor: self.blog.search_blogs(search, "mine", cursor),
+                "No blogs found.",
+                None,
+            )
+        user_id = self.blog.user_id
+        return (
+            self._mirrored("dashboard", self.blog.view_user_blogs_page),
+            "No posts yet.\nTap “New Blog” to publish your first story.",
+            lambda: self.mirror.get(user_id, "dashboard"),
+        )
+
+    def _build_dashboard(self, page):
+        page.grid_rowconfigure(2, weight=1)
 
         # ---------- HEADER ----------
-        header = ctk.CTkFrame(self.content, fg_color="transparent")
+        header = ctk.CTkFrame(page, fg_color="transparent")
         header.grid(row=0, column=0, sticky="we", padx=25, pady=(25, 10))
         header.grid_columnconfigure(0, weight=1)
 
@@ -283,6 +568,7 @@ class MiniBlogApp(ctk.CTk):
         ).grid(row=0, column=0, sticky="w")
 
         def force_refresh():
+            query_cache.invalidate("stats", f"posts:{self.blog.user_id}")
             self.dashboard_search_var.set("")
             self.show_dashboard()
 
@@ -301,7 +587,7 @@ class MiniBlogApp(ctk.CTk):
         entry = ctk.CTkEntry(
             search_row,
             textvariable=self.dashboard_search_var,
-            placeholder_text="Search your blogs by title...",
+            placeholder_text="Search your blogs...",
             font=("Montserrat", 13),
         )
         entry.grid(row=0, column=0, sticky="we", padx=(0, 10))
@@ -313,26 +599,25 @@ class MiniBlogApp(ctk.CTk):
                     fg_color="#374151", hover_color="#1f2937",
                     command=self.clear_dashboard_search).grid(row=0, column=2)
 
-        # ---------- ALWAYS UPDATE DASHBOARD STATISTICS ----------
-        stats = self.blog.get_user_statistics()
-
-        stats_frame = ctk.CTkFrame(self.content, fg_color="transparent")
+        # ---------- DASHBOARD STATISTICS ----------
+        stats_frame = ctk.CTkFrame(page, fg_color="transparent")
         stats_frame.grid(row=1, column=0, sticky="we", padx=25, pady=(5, 20))
         for col in range(3):
             stats_frame.grid_columnconfigure(col, weight=1, uniform="stats")
 
         stat_cards = [
-            ("Your Posts", stats["user_posts"], "#1d4ed8"),
-            ("Recycle Bin", stats["trash_posts"], "#f97316"),
-            ("Community Posts", stats["community_posts"], "#22c55e"),
-            ("Your Comments", stats["user_comments"], "#06b6d4"),
-            ("Likes Received", stats["likes_received"], "#16a34a"),
-            ("Dislikes Received", stats["dislikes_received"], "#dc2626"),
+            ("Your Posts", "user_posts", "#1d4ed8"),
+            ("Recycle Bin", "trash_posts", "#f97316"),
+            ("Community Posts", "community_posts", "#22c55e"),
+            ("Your Comments", "user_comments", "#06b6d4"),
+            ("Likes Received", "likes_received", "#16a34a"),
+            ("Dislikes Received", "dislikes_received", "#dc2626"),
         ]
 
+        page.stat_labels = {}
         row = 0
         col = 0
-        for label, value, color in stat_cards:
+        for label, key, color in stat_cards:
             card = ctk.CTkFrame(stats_frame, corner_radius=14, border_width=1)
             card.grid(row=row, column=col, padx=8, pady=8, sticky="we")
 
@@ -341,73 +626,83 @@ class MiniBlogApp(ctk.CTk):
                 text_color="#94a3b8"
             ).pack(anchor="w", padx=18, pady=(10, 2))
 
-            ctk.CTkLabel(
-                card, text=str(value),
+            page.stat_labels[key] = ctk.CTkLabel(
+                card, text="…",
                 font=("Montserrat", 26, "bold"),
                 text_color=color
-            ).pack(anchor="w", padx=18, pady=(0, 12))
+            )
+            page.stat_labels[key].pack(anchor="w", padx=18, pady=(0, 12))
 
             col += 1
             if col == 3:
                 col = 0
                 row += 1
 
-        # ---------- ALWAYS REFRESH BLOG LIST ----------
-        blogs = self.blog.view_user_blogs() or []
-        blogs = blogs.copy()
-
-        search = (self.dashboard_search_var.get() or "").strip().lower()
-        if search:
-            blogs = [b for b in blogs if search in (b.get("title") or "").lower()]
-
-        list_frame = ctk.CTkScrollableFrame(self.content)
-        list_frame.grid(row=2, column=0, sticky="nsew", padx=25, pady=(0, 25))
-
-        if not blogs:
-            ctk.CTkLabel(
-                list_frame,
-                text="No blogs found." if search else "No posts yet.\nTap “New Blog” to publish your first story.",
-                font=("Montserrat", 16),
-                text_color="#94a3b8"
-            ).pack(pady=120)
-            return
+        # ---------- BLOG LIST ----------
+        page.search = (self.dashboard_search_var.get() or "").strip().lower()
+        fetch_page, empty_text, peek_page = self._dashboard_source(page.search)
+        page.list_view = VirtualList(
+            page,
+            row_height=DASHBOARD_ROW_HEIGHT,
+            create_row=self._create_dashboard_row,
+            bind_row=self._bind_dashboard_row,
+            fetch_page=fetch_page,
+            empty_text=empty_text,
+            runner=self.tasks,
+            task_group="dashboard",
+            peek_page=peek_page,
+        )
+        page.list_view.grid(row=2, column=0, sticky="nsew", padx=25, pady=(0, 25))
 
-        for blog in blogs:
-            card = ctk.CTkFrame(list_frame, corner_radius=16)
-            card.pack(fill="x", pady=12, padx=12)
+    def _create_dashboard_row(self, parent):
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        card = ctk.CTkFrame(row, corner_radius=16)
+        card.pack(fill="both", expand=True, pady=12, padx=12)
 
-            ctk.CTkLabel(card, text=blog["title"],
-                        font=("Montserrat", 18, "bold")).pack(anchor="w", padx=18, pady=(12, 4))
+        row.title_label = ctk.CTkLabel(card, text="", font=("Montserrat", 18, "bold"))
+        row.title_label.pack(anchor="w", padx=18, pady=(12, 4))
 
-            preview = (blog["main_blog"] or "").strip()
-            preview = preview[:320] + "..." if len(preview) > 320 else preview
+        row.preview_label = ctk.CTkLabel(
+            card, text="", font=("Montserrat", 13),
+            wraplength=860, text_color="#e2e8f0", justify="left"
+        )
+        row.preview_label.pack(anchor="w", padx=18, pady=(0, 12))
 
-            ctk.CTkLabel(
-                card, text=preview, font=("Montserrat", 13),
-                wraplength=860, text_color="#e2e8f0", justify="left"
-            ).pack(anchor="w", padx=18, pady=(0, 12))
+        btn_row = ctk.CTkFrame(card, fg_color="transparent")
+        btn_row.pack(side="bottom", fill="x", padx=18, pady=(0, 14))
 
-            btn_row = ctk.CTkFrame(card, fg_color="transparent")
-            btn_row.pack(fill="x", padx=18, pady=(0, 14))
+        row.view_btn = ctk.CTkButton(btn_row, text="View", width=130)
+        row.view_btn.pack(side="left", padx=(0, 8))
 
-            ctk.CTkButton(
-                btn_row, text="View", width=130,
-                command=lambda b=blog: self.show_blog_detail(b, source="dashboard")
-            ).pack(side="left", padx=(0, 8))
-
-            ctk.CTkButton(
-                btn_row, text="Edit", width=90,
-                command=lambda b=blog: self.show_edit_blog(b)
-            ).pack(side="left", padx=(0, 8))
-
-            ctk.CTkButton(
-                btn_row, text="Delete", width=90,
-                fg_color="#ef4444", hover_color="#b91c1c",
-                command=lambda bid=blog["id"]: self.delete_blog(bid)
-            ).pack(side="left")
+        row.edit_btn = ctk.CTkButton(btn_row, text="Edit", width=90)
+        row.edit_btn.pack(side="left", padx=(0, 8))
 
+        row.delete_btn = ctk.CTkButton(
+            btn_row, text="Delete", width=90,
+            fg_color="#ef4444", hover_color="#b91c1c",
+        )
+        row.delete_btn.pack(side="left")
 
+        row.engagement_label = ctk.CTkLabel(
+            btn_row, text="", font=("Montserrat", 12), text_color="#94a3b8"
+        )
+        row.engagement_label.pack(side="right")
+        return row
+
+    def _engagement_text(self, blog) -> str:
+        return (
+            f'👍 {blog.get("like_count", 0)}   '
+            f'👎 {blog.get("dislike_count", 0)}   '
+            f'💬 {blog.get("comment_count", 0)}'
+        )
 
+    def _bind_dashboard_row(self, row, blog):
+        row.title_label.configure(text=blog["title"])
+        row.preview_label.configure(text=blog.get("preview") or "")
+        row.engagement_label.configure(text=self._engagement_text(blog))
+        row.view_btn.configure(command=lambda b=blog: self.show_blog_detail(b, source="dashboard"))
+        row.edit_btn.configure(command=lambda b=blog: self.show_edit_blog(b))
+        row.delete_btn.configure(command=lambda bid=blog["id"]: self.delete_blog(bid))
 
     # ------- Blog forms
     def show_add_blog(self):
@@ -467,7 +762,6 @@ class MiniBlogApp(ctk.CTk):
         self.edit_title.grid(row=1, column=0, padx=20, pady=10, sticky="we")
 
         self.edit_text = ctk.CTkTextbox(frame, width=640, height=320, font=("Consolas", 13))
-        self.edit_text.insert("1.0", blog["main_blog"])
         self.edit_text.grid(row=2, column=0, padx=20, pady=10, sticky="nsew")
 
         btn_row = ctk.CTkFrame(frame, fg_color="transparent")
@@ -476,12 +770,35 @@ class MiniBlogApp(ctk.CTk):
         ctk.CTkButton(
             btn_row, text="Back", fg_color="gray", hover_color="#4b5563", command=self.show_dashboard
         ).pack(side="right", padx=6)
-        ctk.CTkButton(
+        update_btn = ctk.CTkButton(
             btn_row,
             text="Update",
             command=lambda bid=blog["id"]: self.update_blog_action(bid),
-        ).pack(side="right", padx=6)
+        )
+        update_btn.pack(side="right", padx=6)
 
+        def fill(full):
+            if not self.edit_text.winfo_exists():
+                return
+            if full is None:
+                messagebox.showerror("Error", "This blog is no longer available.")
+                self.show_dashboard()
+                return
+            self.edit_text.configure(state="normal")
+            self.edit_text.delete("1.0", "end")
+            self.edit_text.insert("1.0", full["main_blog"])
+            update_btn.configure(state="normal")
+
+        # list rows only carry the preview; the body is loaded on demand
+        if "main_blog" in blog:
+            fill(blog)
+        else:
+            self.edit_text.insert("1.0", "Loading…")
+            self.edit_text.configure(state="disabled")
+            update_btn.configure(state="disabled")
+            self.tasks.submit(self.blog.get_blog, blog["id"], on_done=fill)
+
+    @render_stats.timed("blog_detail", root=lambda app, *a, **k: app._detail_page)
     def show_blog_detail(self, blog, source="dashboard"):
         if not self._ensure_logged_in():
             return
@@ -494,6 +811,7 @@ class MiniBlogApp(ctk.CTk):
         wrapper.grid(row=0, column=0, sticky="nsew", padx=25, pady=25)
         wrapper.grid_columnconfigure(0, weight=1)
         wrapper.grid_rowconfigure(1, weight=1)
+        self._detail_page = wrapper
 
         header = ctk.CTkFrame(wrapper, fg_color="transparent")
         header.grid(row=0, column=0, sticky="we")
@@ -514,7 +832,7 @@ class MiniBlogApp(ctk.CTk):
                 action_row,
                 text="Edit",
                 width=100,
-                command=lambda b=blog: self.show_edit_blog(b),
+                command=lambda: self.show_edit_blog(blog),
             ).pack(side="left", padx=(0, 8))
             ctk.CTkButton(
                 action_row,
@@ -552,7 +870,9 @@ class MiniBlogApp(ctk.CTk):
         reaction_frame.grid(row=2, column=0, sticky="we", padx=28, pady=(12, 0))
         reaction_frame.grid_columnconfigure((0, 1, 2), weight=1, uniform="react")
 
-        stats_label = ctk.CTkLabel(reaction_frame, text="", font=("Montserrat", 12))
+        stats_label = ctk.CTkLabel(
+            reaction_frame, text="Loading reactions…", font=("Montserrat", 12)
+        )
         stats_label.grid(row=0, column=0, columnspan=3, sticky="w", pady=(0, 6))
 
         like_btn = ctk.CTkButton(
@@ -572,18 +892,23 @@ class MiniBlogApp(ctk.CTk):
         )
         dislike_btn.grid(row=1, column=1, sticky="w", padx=(12, 0))
 
-        def refresh_reactions():
-            #-- like / dislike calculation 
-            summary = self.blog.get_reaction_summary(blog["id"]) or {}
-            likes = summary.get("likes", 0)
-            dislikes = summary.get("dislikes", 0)
+        base = {"likes": 0, "dislikes": 0, "user_reaction": None}
+
+        def render_reactions():
+            #-- like / dislike calculation, with the user's unsaved choice applied
+            user_reaction = writer.value
+            likes = base["likes"] - (base["user_reaction"] == "like") + (user_reaction == "like")
+            dislikes = (
+                base["dislikes"]
+                - (base["user_reaction"] == "dislike")
+                + (user_reaction == "dislike")
+            )
             total = likes + dislikes
             like_percent = round((likes / total) * 100, 1) if total else 0
             dislike_percent = round((dislikes / total) * 100, 1) if total else 0
             stats_label.configure(
                 text=f"Reactions • Likes: {likes} ({like_percent}%)   |   Dislikes: {dislikes} ({dislike_percent}%)"
             )
-            user_reaction = summary.get("user_reaction")
             like_btn.configure(
                 fg_color="#22c55e" if user_reaction == "like" else "#1f2937",
                 text=f"👍 Like ({likes})",
@@ -593,17 +918,66 @@ class MiniBlogApp(ctk.CTk):
                 text=f"👎 Dislike ({dislikes})",
             )
 
-        def react(value):
-            if self.handle_reaction(blog["id"], value):
+        def show_reactions(summary):
+            if writer.pending:
+                return  # keep showing the user's latest clicks until they are saved
+            base.update(summary or {})
+            writer.reset(base["user_reaction"])
+            render_reactions()
+
+        def refresh_reactions():
+            self.tasks.submit(
+                self.blog.get_reaction_summary, blog["id"], on_done=show_reactions
+            )
+
+        def reaction_written(ok):
+            if not stats_label.winfo_exists():
+                return  # the user has moved on; the write itself still landed
+            if not ok:
+                messagebox.showerror("Error", "Unable to update reaction.")
+            if not writer.pending:
                 refresh_reactions()
 
-        refresh_reactions()
+        writer = CoalescingWriter(
+            self,
+            self.tasks,
+            lambda value: self.blog.set_reaction(blog["id"], value),
+            delay_ms=REACTION_WRITE_DELAY_MS,
+            on_written=reaction_written,
+            group="action",  # navigating away must not cancel a queued write
+        )
+
+        def react(value):
+            if not self._ensure_logged_in():
+                return
+            # clicking the active reaction again removes it
+            writer.set(None if writer.value == value else value)
+            render_reactions()
 
         text_box = ctk.CTkTextbox(detail_frame, font=("Consolas", 13), wrap="word", height=260)
-        text_box.insert("1.0", blog.get("main_blog") or "")
-        text_box.configure(state="disabled")
         text_box.grid(row=3, column=0, padx=28, pady=(12, 4), sticky="we")
 
+        def show_body(full):
+            nonlocal blog
+            if not text_box.winfo_exists():
+                return
+            if full is not None:
+                blog = full  # lets Edit skip a second fetch
+            text_box.configure(state="normal")
+            text_box.delete("1.0", "end")
+            text_box.insert(
+                "1.0",
+                full["main_blog"] if full else "This blog is no longer available.",
+            )
+            text_box.configure(state="disabled")
+
+        # list rows only carry the preview; the body comes with the rest below
+        if "main_blog" in blog:
+            show_body(blog)
+        else:
+            text_box.insert("1.0", blog.get("preview") or "Loading…")
+            text_box.configure(state="disabled")
+
         comments_frame = ctk.CTkScrollableFrame(detail_frame)
         comments_frame.grid(row=4, column=0, padx=28, pady=(4, 12), sticky="nsew")
 
@@ -625,7 +999,34 @@ class MiniBlogApp(ctk.CTk):
             command=lambda: self.submit_comment(blog["id"], comment_entry, comments_frame),
         ).grid(row=0, column=1)
 
-        self.populate_comments(blog["id"], comments_frame)
+        ctk.CTkButton(
+            input_row,
+            text="↻",
+            width=40,
+            fg_color="#1f2937",
+            command=lambda: self.refresh_comments(comments_frame),
+        ).grid(row=0, column=2, padx=(8, 0))
+
+        self.populate_comments(blog["id"], comments_frame, load=False)
+
+        def fill(data):
+            if data["blog"] is None:
+                self.mirror.forget_blog(blog["id"])  # deleted since the list was loaded
+            if not comments_frame.winfo_exists():
+                return
+            show_body(data["blog"])
+            show_reactions(data["reactions"])
+            self._comments_loaded(comments_frame, data["comments"])
+
+        def failed(exc):
+            if comments_frame.winfo_exists():
+                self._comments_failed(comments_frame, exc)
+
+        # post, reactions and comments are fetched side by side on separate
+        # connections, so the view waits for the slowest of them only
+        self.tasks.submit(
+            self.blog.load_blog_detail, blog["id"], on_done=fill, on_error=failed
+        )
 
     # ------------------------------------------------------------------ Actions
     def register_action(self):
@@ -642,13 +1043,21 @@ class MiniBlogApp(ctk.CTk):
             messagebox.showwarning("Missing info", "All fields are required.")
             return
 
-        ok, err = self.blog.create_account(*values)
-        if ok:
-            messagebox.showinfo("Success", "Account created! You are now logged in.")
-            # profile set in create_account: show dashboard
-            self.show_dashboard()
-        else:
-            messagebox.showerror("Error", err or "Username already exists or database error.")
+
+        blog = self.blog
+
+        def register():
+            # like sign_in, load the role before the sidebar asks for it
+            return blog.create_account(*values) and bool(blog.get_user_profile())
+
+        def done(ok):
+            if ok:
+                messagebox.showinfo("Success", "Account created! You are now logged in.")
+                self.show_dashboard()
+            else:
+                messagebox.showerror("Error", "Username already exists or database error.")
+
+        self.tasks.submit(register, on_done=done, group="action")
 
     def login_action(self):
         username = self.login_user.get().strip()
@@ -656,10 +1065,38 @@ class MiniBlogApp(ctk.CTk):
         if not username or not password:
             messagebox.showwarning("Missing info", "Enter both username and password.")
             return
-        if self.blog.log_in(username, password):
-            self.show_dashboard()
-        else:
-            messagebox.showerror("Error", "Invalid username or password.")
+
+        remember = self.remember_var.get()
+        blog = self.blog
+
+        def sign_in():
+            # warm the profile cache too, the sidebar needs the role right away
+            if not (blog.log_in(username, password) and blog.get_user_profile()):
+                return False
+            old_token = load_token(self.backend)
+            if old_token:
+                blog.revoke_login_token(old_token)
+            if remember:
+                token = blog.issue_login_token()
+                if token:
+                    save_token(self.backend, token, blog.user_name)
+                    return True
+            forget_token()
+            return True
+
+        def done(ok):
+            self.login_btn.configure(state="normal", text="Log in")
+            if ok:
+                self.show_dashboard()
+            else:
+                messagebox.showerror("Error", "Invalid username or password.")
+
+        def failed(exc):
+            self.login_btn.configure(state="normal", text="Log in")
+            messagebox.showerror("Error", f"Unable to log in: {exc}")
+
+        self.login_btn.configure(state="disabled", text="Signing in…")
+        self.tasks.submit(sign_in, on_done=done, on_error=failed)
 
     def add_blog_action(self):
         title = self.blog_title.get().strip()
@@ -667,11 +1104,15 @@ class MiniBlogApp(ctk.CTk):
         if not title or not main_blog:
             messagebox.showwarning("Missing info", "Title and content cannot be empty.")
             return
-        if self.blog.add_blog(title, main_blog):
-            messagebox.showinfo("Published", "Your blog has been posted.")
-            self.show_dashboard()
-        else:
-            messagebox.showerror("Error", "Failed to save blog.")
+
+        def done(ok):
+            if ok:
+                messagebox.showinfo("Published", "Your blog has been posted.")
+                self.show_dashboard()
+            else:
+                messagebox.showerror("Error", "Failed to save blog.")
+
+        self.tasks.submit(self.blog.add_blog, title, main_blog, on_done=done, group="action")
 
     def update_blog_action(self, blog_id):
         title = self.edit_title.get().strip()
@@ -679,105 +1120,162 @@ class MiniBlogApp(ctk.CTk):
         if not title or not main_blog:
             messagebox.showwarning("Missing info", "Title and content cannot be empty.")
             return
-        if self.blog.update_blog(blog_id, title, main_blog):
-            messagebox.showinfo("Updated", "Blog updated successfully.")
-            self.show_dashboard()
-        else:
-            messagebox.showerror("Error", "Could not update this blog.")
+
+        def done(ok):
+            if ok:
+                messagebox.showinfo("Updated", "Blog updated successfully.")
+                self.show_dashboard()
+            else:
+                messagebox.showerror("Error", "Could not update this blog.")
+
+        self.tasks.submit(
+            self.blog.update_blog, blog_id, title, main_blog, on_done=done, group="action"
+        )
 
     def delete_blog(self, blog_id):
         if not messagebox.askyesno("Confirm delete", "Delete this blog?"):
             return
-        if self.blog.soft_delete_blog(blog_id):
-            messagebox.showinfo("Deleted", "Blog moved to trash.")
-            self.show_dashboard()
-        else:
-            messagebox.showerror("Error", "Failed to delete blog.")
+
+        def done(ok):
+            if ok:
+                self.mirror.forget_blog(blog_id)
+                messagebox.showinfo("Deleted", "Blog moved to trash.")
+                self.show_dashboard()
+            else:
+                messagebox.showerror("Error", "Failed to delete blog.")
+
+        self.tasks.submit(self.blog.soft_delete_blog, blog_id, on_done=done, group="action")
 
     # ------- Recycle bin
     def show_recycle_bin(self):
         if not self._ensure_logged_in():
             return
         self._select_view("recycle_bin")
-        self.clear_content()
+        page, created = self._show_cached_view("recycle_bin", self._build_recycle_bin)
+        if not created:
+            page.list_view.refresh()
+
+    def _build_recycle_bin(self, page):
+        page.grid_rowconfigure(1, weight=1)
 
-        header = ctk.CTkFrame(self.content, fg_color="transparent")
+        header = ctk.CTkFrame(page, fg_color="transparent")
         header.grid(row=0, column=0, sticky="we", padx=25, pady=(25, 10))
         ctk.CTkLabel(
             header, text="Recycle Bin", font=("Montserrat", 24, "bold")
         ).grid(row=0, column=0, sticky="w")
 
-        trashed = self.blog.view_deleted_blogs() or []
-        list_frame = ctk.CTkScrollableFrame(self.content)
-        list_frame.grid(row=1, column=0, sticky="nsew", padx=25, pady=(0, 25))
+        page.list_view = VirtualList(
+            page,
+            row_height=TRASH_ROW_HEIGHT,
+            create_row=self._create_trash_row,
+            bind_row=self._bind_trash_row,
+            fetch_page=self.blog.view_deleted_blogs_page,
+            empty_text="Recycle bin is empty.",
+            runner=self.tasks,
+            task_group="recycle_bin",
+        )
+        page.list_view.grid(row=1, column=0, sticky="nsew", padx=25, pady=(0, 25))
 
-        if not trashed:
-            ctk.CTkLabel(
-                list_frame,
-                text="Recycle bin is empty.",
-                font=("Montserrat", 16),
-                text_color="#94a3b8",
-            ).pack(pady=80)
-            return
+    def _create_trash_row(self, parent):
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        card = ctk.CTkFrame(row, corner_radius=16)
+        card.pack(fill="both", expand=True, pady=12, padx=12)
 
-        for blog in trashed:
-            card = ctk.CTkFrame(list_frame, corner_radius=16)
-            card.pack(fill="x", expand=True, pady=12, padx=12)
+        row.title_label = ctk.CTkLabel(card, text="", font=("Montserrat", 18, "bold"))
+        row.title_label.pack(anchor="w", padx=18, pady=(14, 4))
 
-            ctk.CTkLabel(
-                card, text=blog["title"], font=("Montserrat", 18, "bold")
-            ).pack(anchor="w", padx=18, pady=(14, 4))
+        row.created_label = ctk.CTkLabel(
+            card,
+            text="",
+            font=("Montserrat", 12),
+            text_color="#94a3b8",
+        )
+        row.created_label.pack(anchor="w", padx=18)
 
-            ctk.CTkLabel(
-                card,
-                text="Created on: " + self._format_timestamp(blog.get("created_at")),
-                font=("Montserrat", 12),
-                text_color="#94a3b8",
-            ).pack(anchor="w", padx=18)
+        btn_row = ctk.CTkFrame(card, fg_color="transparent")
+        btn_row.pack(fill="x", padx=18, pady=(8, 14))
 
-            btn_row = ctk.CTkFrame(card, fg_color="transparent")
-            btn_row.pack(fill="x", padx=18, pady=(8, 14))
+        row.restore_btn = ctk.CTkButton(btn_row, text="Restore", width=120)
+        row.restore_btn.pack(side="left", padx=(0, 12))
 
-            ctk.CTkButton(
-                btn_row,
-                text="Restore",
-                width=120,
-                command=lambda bid=blog["id"]: self.restore_blog_action(bid),
-            ).pack(side="left", padx=(0, 12))
+        row.delete_btn = ctk.CTkButton(
+            btn_row,
+            text="Delete forever",
+            width=140,
+            fg_color="#ef4444",
+            hover_color="#b91c1c",
+        )
+        row.delete_btn.pack(side="left")
+        return row
 
-            ctk.CTkButton(
-                btn_row,
-                text="Delete forever",
-                width=140,
-                fg_color="#ef4444",
-                hover_color="#b91c1c",
-                command=lambda bid=blog["id"]: self.permanent_delete_action(bid),
-            ).pack(side="left")
+    def _bind_trash_row(self, row, blog):
+        row.title_label.configure(text=blog["title"])
+        row.created_label.configure(
+            text="Created on: " + self._format_timestamp(blog.get("created_at"))
+        )
+        row.restore_btn.configure(command=lambda bid=blog["id"]: self.restore_blog_action(bid))
+        row.delete_btn.configure(command=lambda bid=blog["id"]: self.permanent_delete_action(bid))
 
     def restore_blog_action(self, blog_id):
-        if self.blog.restore_blog(blog_id):
-            messagebox.showinfo("Restored", "Blog restored to dashboard.")
-            self.show_recycle_bin()
-        else:
-            messagebox.showerror("Error", "Unable to restore blog.")
+
+        def done(ok):
+            if ok:
+                messagebox.showinfo("Restored", "Blog restored to dashboard.")
+                self.show_recycle_bin()
+            else:
+                messagebox.showerror("Error", "Unable to restore blog.")
+
+        self.tasks.submit(self.blog.restore_blog, blog_id, on_done=done, group="action")
 
     def permanent_delete_action(self, blog_id):
         if not messagebox.askyesno("Permanent delete", "Delete this blog permanently?"):
             return
-        if self.blog.permanent_delete_blog(blog_id):
-            messagebox.showinfo("Deleted", "Blog removed permanently.")
-            self.show_recycle_bin()
-        else:
-            messagebox.showerror("Error", "Unable to delete blog.")
+
+        def done(ok):
+            if ok:
+                self.mirror.forget_blog(blog_id)
+                messagebox.showinfo("Deleted", "Blog removed permanently.")
+                self.show_recycle_bin()
+            else:
+                messagebox.showerror("Error", "Unable to delete blog.")
+
+        self.tasks.submit(self.blog.permanent_delete_blog, blog_id, on_done=done, group="action")
 
     # ------------------------------------------------------------------ Blog feed
+    @render_stats.timed("blog_feed", root=lambda app: app._views.get("blog_feed"))
     def show_blog_feed(self):
         if not self._ensure_logged_in():
             return
         self._select_view("blog_feed")
-        self.clear_content()
+        page, created = self._show_cached_view("blog_feed", self._build_blog_feed)
+
+        community_term = (self.community_search_var.get() or "").strip().lower()
+        if not created:
+            if community_term != page.search:
+                page.search = community_term
+                page.list_view.reload(*self._feed_source(community_term))
+            else:
+                page.list_view.refresh()
 
-        header = ctk.CTkFrame(self.content, fg_color="transparent")
+    def _feed_source(self, community_term):
+        """``(fetch_page, empty_text, peek_page)``, as for the dashboard."""
+        if community_term:
+            return (
+                lambda cursor: self.blog.search_blogs(community_term, "community", cursor),
+                "No blogs match your search.",
+                None,
+            )
+        user_id = self.blog.user_id
+        return (
+            self._mirrored("feed", self.blog.get_all_blogs_page),
+            "No blogs yet. Check back soon!",
+            lambda: self.mirror.get(user_id, "feed"),
+        )
+
+    def _build_blog_feed(self, page):
+        page.grid_rowconfigure(1, weight=1)
+
+        header = ctk.CTkFrame(page, fg_color="transparent")
         header.grid(row=0, column=0, sticky="we", padx=25, pady=(25, 10))
         header.grid_columnconfigure(0, weight=1)
         header.grid_rowconfigure(1, weight=0)
@@ -794,7 +1292,7 @@ class MiniBlogApp(ctk.CTk):
         community_entry = ctk.CTkEntry(
             search_row,
             textvariable=self.community_search_var,
-            placeholder_text="Search community posts by title...",
+            placeholder_text="Search community posts...",
             font=("Montserrat", 13),
         )
         community_entry.grid(row=0, column=0, sticky="we", padx=(0, 10))
@@ -816,82 +1314,167 @@ class MiniBlogApp(ctk.CTk):
             command=self.clear_community_search,
         ).grid(row=0, column=2)
 
-        blogs = self.blog.get_all_blogs() or []
-        community_term = (self.community_search_var.get() or "").strip().lower()
-        if community_term:
-            blogs = [
-                blog
-                for blog in blogs
-                if community_term in (blog.get("title") or "").lower()
-            ]
+        page.search = (self.community_search_var.get() or "").strip().lower()
+        fetch_page, empty_text, peek_page = self._feed_source(page.search)
+        page.list_view = VirtualList(
+            page,
+            row_height=FEED_ROW_HEIGHT,
+            create_row=self._create_feed_row,
+            bind_row=self._bind_feed_row,
+            fetch_page=fetch_page,
+            empty_text=empty_text,
+            runner=self.tasks,
+            task_group="blog_feed",
+            peek_page=peek_page,
+        )
+        page.list_view.grid(row=1, column=0, sticky="nsew", padx=25, pady=(0, 25))
 
-        list_frame = ctk.CTkScrollableFrame(self.content)
-        list_frame.grid(row=1, column=0, sticky="nsew", padx=25, pady=(0, 25))
+    def _create_feed_row(self, parent):
+        row = ctk.CTkFrame(parent, fg_color="transparent")
+        card = ctk.CTkFrame(row, corner_radius=16)
+        card.pack(fill="both", expand=True, pady=12, padx=12)
 
-        if not blogs:
-            empty = (
-                "No blogs match your search."
-                if community_term
-                else "No blogs yet. Check back soon!"
-            )
-            ctk.CTkLabel(
-                list_frame,
-                text=empty,
-                font=("Montserrat", 16),
-                text_color="#94a3b8",
-            ).pack(pady=120)
-            return
+        row.title_label = ctk.CTkLabel(card, text="", font=("Montserrat", 19, "bold"))
+        row.title_label.pack(anchor="w", padx=18, pady=(16, 4))
 
-        for blog in blogs:
-            card = ctk.CTkFrame(list_frame, corner_radius=16)
-            card.pack(fill="x", expand=True, pady=12, padx=12)
+        row.subtitle_label = ctk.CTkLabel(
+            card,
+            text="",
+            font=("Montserrat", 12),
+            text_color="#94a3b8",
+        )
+        row.subtitle_label.pack(anchor="w", padx=18)
 
-            author = blog.get("first_name") or blog.get("user_name") or "Unknown"
-            if blog.get("last_name"):
-                author = f'{blog["first_name"]} {blog["last_name"]}'
-            subtitle = f'By {author} • {self._format_timestamp(blog.get("created_at"))}'
+        footer = ctk.CTkFrame(card, fg_color="transparent")
+        footer.pack(side="bottom", fill="x", padx=18, pady=(0, 16))
 
-            ctk.CTkLabel(
-                card, text=blog["title"], font=("Montserrat", 19, "bold")
-            ).pack(anchor="w", padx=18, pady=(16, 4))
-            ctk.CTkLabel(
-                card,
-                text=subtitle,
-                font=("Montserrat", 12),
-                text_color="#94a3b8",
-            ).pack(anchor="w", padx=18)
+        row.engagement_label = ctk.CTkLabel(
+            footer, text="", font=("Montserrat", 12), text_color="#94a3b8"
+        )
+        row.engagement_label.pack(side="left")
 
-            preview = (blog["main_blog"] or "").strip()
-            if len(preview) > 320:
-                preview = preview[:320].rstrip() + "..."
-            ctk.CTkLabel(
-                card,
-                text=preview,
-                font=("Montserrat", 13),
-                wraplength=860,
-                justify="left",
-            ).pack(anchor="w", padx=18, pady=(8, 12))
+        row.view_btn = ctk.CTkButton(footer, text="View & interact", width=160)
+        row.view_btn.pack(side="right")
 
-            ctk.CTkButton(
-                card,
-                text="View & interact",
-                width=160,
-                command=lambda b=blog: self.show_blog_detail(b, source="blog_feed"),
-            ).pack(anchor="e", padx=18, pady=(0, 16))
+        row.preview_label = ctk.CTkLabel(
+            card,
+            text="",
+            font=("Montserrat", 13),
+            wraplength=860,
+            justify="left",
+        )
+        row.preview_label.pack(anchor="w", padx=18, pady=(8, 12))
+        return row
 
-    def populate_comments(self, blog_id, container):
+    def _bind_feed_row(self, row, blog):
+        author = blog.get("first_name") or blog.get("user_name") or "Unknown"
+        if blog.get("last_name"):
+            author = f'{blog["first_name"]} {blog["last_name"]}'
+        subtitle = f'By {author} • {self._format_timestamp(blog.get("created_at"))}'
+
+        row.title_label.configure(text=blog["title"])
+        row.subtitle_label.configure(text=subtitle)
+        row.preview_label.configure(text=blog.get("preview") or "")
+        row.engagement_label.configure(text=self._engagement_text(blog))
+        row.view_btn.configure(
+            command=lambda b=blog: self.show_blog_detail(b, source="blog_feed")
+        )
+
+    @render_stats.timed("comments", root=lambda app, blog_id, container, load=True: container)
+    def populate_comments(self, blog_id, container, load=True):
+        """Show the first page of a thread; later rows are only ever appended.
+
+        With ``load=False`` the caller fetches the first page itself and hands
+        it to ``_comments_loaded``.
+        """
         for widget in container.winfo_children():
             widget.destroy()
-        comments = self.blog.get_comments(blog_id) or []
-        if not comments:
-            ctk.CTkLabel(
+        container.comment_state = {
+            "blog_id": blog_id,
+            "seen": set(),
+            "last_key": None,    # (created_at, id) of the newest rendered comment
+            "next_cursor": None,
+            "loading": not load,
+            "reload": False,     # a refresh was asked for while loading
+            "placeholder": ctk.CTkLabel(
                 container,
-                text="No comments yet. Be the first!",
+                text="Loading comments…",
                 font=("Montserrat", 12),
                 text_color="#94a3b8",
-            ).pack(pady=10, padx=10)
+            ),
+            "more_btn": ctk.CTkButton(
+                container,
+                text="Load more comments",
+                width=200,
+                fg_color="#1f2937",
+                command=lambda: self._load_comments(container, more=True),
+            ),
+        }
+        container.comment_state["placeholder"].pack(pady=10, padx=10)
+        if load:
+            self._load_comments(container)
+
+    def _load_comments(self, container, more=False):
+        """Fetch the next page (``more``) or whatever was posted since the last
+        rendered comment, and append it."""
+        state = container.comment_state
+        if state["loading"]:
+            state["reload"] = state["reload"] or not more
             return
-        for comment in comments:
+        state["loading"] = True
+        if more:
+            state["more_btn"].configure(state="disabled", text="Loading…")
+            fetch = self.blog.get_comments_page
+            position = state["next_cursor"]
+        elif state["last_key"] is None:
+            fetch = self.blog.get_comments_page
+            position = None
+        else:
+            fetch = self.blog.get_comments_after
+            position = state["last_key"]
+
+        def done(page):
+            if container.winfo_exists():
+                self._comments_loaded(container, page)
+            else:
+                state["loading"] = False
+
+        def failed(exc):
+            if container.winfo_exists():
+                self._comments_failed(container, exc)
+            else:
+                state["loading"] = False
+
+        self.tasks.submit(fetch, state["blog_id"], position, on_done=done, on_error=failed)
+
+    def _comments_loaded(self, container, page):
+        state = container.comment_state
+        state["loading"] = False
+        self._append_comments(container, page)
+        if state["reload"]:
+            state["reload"] = False
+            self.refresh_comments(container)
+
+    def _comments_failed(self, container, exc):
+        state = container.comment_state
+        state["loading"] = False
+        print("❌ load comments error:", exc)
+        self._append_comments(container, None)
+        if not state["seen"]:
+            state["placeholder"].configure(text="Unable to load comments.")
+
+    @render_stats.timed("comments_append", root=lambda app, container, page: container)
+    def _append_comments(self, container, page):
+        state = container.comment_state
+        page = page or {"items": [], "next_cursor": state["next_cursor"]}
+        state["more_btn"].pack_forget()
+
+        for comment in page["items"]:
+            if comment["id"] in state["seen"]:
+                continue
+            state["seen"].add(comment["id"])
+            state["last_key"] = (comment["created_at"], comment["id"])
+
             block = ctk.CTkFrame(container, corner_radius=10)
             block.pack(fill="x", padx=10, pady=6)
             author = comment.get("first_name") or comment.get("user_name") or "User"
@@ -910,6 +1493,23 @@ class MiniBlogApp(ctk.CTk):
                 justify="left",
             ).pack(anchor="w", padx=12, pady=(0, 10))
 
+        state["next_cursor"] = page["next_cursor"]
+        placeholder = state["placeholder"]
+        if state["seen"]:
+            placeholder.pack_forget()
+        else:
+            placeholder.configure(text="No comments yet. Be the first!")
+            placeholder.pack(pady=10, padx=10)
+        if state["next_cursor"] is not None:
+            state["more_btn"].configure(state="normal", text="Load more comments")
+            state["more_btn"].pack(pady=(4, 10))
+
+    def refresh_comments(self, container):
+        """Append comments posted since the thread was last loaded."""
+        state = container.comment_state
+        # with older pages still unread, new rows arrive after them
+        self._load_comments(container, more=state["next_cursor"] is not None)
+
     def submit_comment(self, blog_id, entry_widget, comments_frame):
         if not self._ensure_logged_in():
             return
@@ -917,36 +1517,72 @@ class MiniBlogApp(ctk.CTk):
         if not text:
             messagebox.showwarning("Empty comment", "Please write a comment first.")
             return
-        if self.blog.add_comment(blog_id, text):
-            entry_widget.delete(0, "end")
-            self.populate_comments(blog_id, comments_frame)
-        else:
-            messagebox.showerror("Error", "Failed to post comment.")
 
-    def handle_reaction(self, blog_id, reaction: str) -> bool:
-        if not self._ensure_logged_in():
-            return False
-        if self.blog.set_reaction(blog_id, reaction):
-            return True
-        messagebox.showerror("Error", "Unable to update reaction.")
-        return False
+        def done(ok):
+            if not ok:
+                messagebox.showerror("Error", "Failed to post comment.")
+            elif comments_frame.winfo_exists():  # the post may have been left meanwhile
+                entry_widget.delete(0, "end")
+                self.refresh_comments(comments_frame)
+
+        # "action": leaving the post must not cancel the write
+        self.tasks.submit(self.blog.add_comment, blog_id, text, on_done=done, group="action")
 
     def logout_action(self):
-        self.blog.clear_session()
+        token = load_token(self.backend)
+        forget_token()
+        # signing out leaves none of the user's data on this machine
+        self.mirror.drop(self.blog.user_id)
+        # the old client revokes the token and ends its session in the
+        # background; the login screen starts on a fresh one
+        old, self.blog = self.blog, self._new_blog()
+
+        def sign_out():
+            if token:
+                old.revoke_login_token(token)
+            old.clear_session()
+
+        self.tasks.submit(sign_out, group="action")
         self.show_login()
 
     # ------------------------------------------------------------------ Account
     def show_account_view(self):
         if not self._ensure_logged_in():
             return
-        profile = self.blog.get_user_profile()
-        if not profile:
-            messagebox.showerror("Error", "Unable to load profile.")
-            return
         self._select_view("account")
-        self.clear_content()
-
-        container = ctk.CTkFrame(self.content, corner_radius=16, border_width=1)
+        page, created = self._show_cached_view("account", self._build_account_view)
+
+        def fill(profile):
+            if profile:
+                self._fill_account_view(page, profile)
+            elif created and not page.info_labels["Username"].cget("text"):
+                messagebox.showerror("Error", "Unable to load profile.")
+
+        if created:
+            stored = self.mirror.get(self.blog.user_id, "profile")
+            if stored is not None:
+                self._fill_account_view(page, stored)
+        self.tasks.submit(self._mirrored("profile", self.blog.get_user_profile), on_done=fill)
+
+    def _fill_account_view(self, page, profile):
+        info_items = {
+            "Username": profile.get("user_name", ""),
+            "Name": f'{profile.get("first_name", "")} {profile.get("last_name", "")}'.strip(),
+            "Email": profile.get("email", ""),
+            "Contact": profile.get("contact", ""),
+            "Bio": profile.get("bio", ""),
+            "Joined": self._format_timestamp(profile.get("created_at")),
+        }
+        for label, value in info_items.items():
+            value_label = page.info_labels[label]
+            text = value or "—"
+            if value_label.cget("text") != text:
+                value_label.configure(text=text)
+
+    def _build_account_view(self, page):
+        page.grid_rowconfigure(0, weight=1)
+
+        container = ctk.CTkFrame(page, corner_radius=16, border_width=1)
         container.grid(row=0, column=0, padx=40, pady=30, sticky="nsew")
         container.grid_columnconfigure(0, weight=1)
         container.grid_rowconfigure(2, weight=1)
@@ -963,91 +1599,253 @@ class MiniBlogApp(ctk.CTk):
             text_color="#94a3b8",
         ).grid(row=1, column=0, sticky="w", padx=25, pady=(0, 20))
 
-        info_items = [
-            ("Username", profile.get("user_name", "")),
-            ("Name", f'{profile.get("first_name", "")} {profile.get("last_name", "")}'.strip()),
-            ("Email", profile.get("email", "")),
-            ("Contact", profile.get("contact", "")),
-            ("Bio", profile.get("bio", "")),
-            ("Joined", self._format_timestamp(profile.get("created_at"))),
-        ]
-
         info_scroll = ctk.CTkScrollableFrame(container, width=720)
         info_scroll.grid(row=2, column=0, padx=25, pady=(0, 25), sticky="nsew")
         info_scroll.grid_columnconfigure(0, weight=1)
 
-        for idx, (label, value) in enumerate(info_items, start=0):
+        page.info_labels = {}
+        for idx, label in enumerate(("Username", "Name", "Email", "Contact", "Bio", "Joined")):
             frame = ctk.CTkFrame(info_scroll, corner_radius=12)
             frame.grid(row=idx, column=0, padx=0, pady=6, sticky="we")
             ctk.CTkLabel(frame, text=label, font=("Montserrat", 12, "bold")).pack(
                 anchor="w", padx=18, pady=(12, 2)
             )
-            ctk.CTkLabel(
+            page.info_labels[label] = ctk.CTkLabel(
                 frame,
-                text=value or "—",
+                text="",
                 font=("Montserrat", 12),
                 text_color="#e2e8f0",
                 wraplength=520,
                 justify="left",
-            ).pack(anchor="w", padx=18, pady=(0, 12))
+            )
+            page.info_labels[label].pack(anchor="w", padx=18, pady=(0, 12))
 
     # ------------------------------------------------------------------ Admin Panel
     def show_admin_panel(self):
         if not self._ensure_logged_in():
             return
-        # only allow admins
-        try:
-            if not self.blog.is_admin():
-                messagebox.showerror("Access denied", "You are not an admin.")
-                return
-        except Exception:
-            messagebox.showerror("Error", "Unable to verify admin status.")
+        # only allow admins (list_users checks again on the server side)
+        if not self._is_admin():
+            messagebox.showerror("Access denied", "You are not an admin.")
             return
 
         self._select_view("admin")
-        self.clear_content()
+        page, _created = self._show_cached_view("admin", self._build_admin_panel)
+
+        def show_users(users):
+            page.loading_label.grid_remove()
+            self._render_users(page.users_frame, users or [])
+
+        self.tasks.submit(self.blog.list_users, on_done=show_users)
 
-        container = ctk.CTkFrame(self.content, corner_radius=16, border_width=1)
+    def _build_admin_panel(self, page):
+        page.grid_rowconfigure(0, weight=1)
+
+        container = ctk.CTkFrame(page, corner_radius=16, border_width=1)
         container.grid(row=0, column=0, padx=40, pady=30, sticky="nsew")
         container.grid_columnconfigure(0, weight=1)
+        container.grid_rowconfigure(1, weight=1)
 
         ctk.CTkLabel(container, text="Admin Panel", font=("Montserrat", 26, "bold")).grid(
             row=0, column=0, sticky="w", padx=25, pady=(25, 6)
         )
 
+        page.tabs = ctk.CTkTabview(
+            container, command=lambda: self._refresh_query_stats(page, reschedule=False)
+        )
+        page.tabs.grid(row=1, column=0, padx=25, pady=(4, 25), sticky="nsew")
+        users_tab = page.tabs.add("Users")
+        queries_tab = page.tabs.add("Queries")
+        for tab in (users_tab, queries_tab):
+            tab.grid_columnconfigure(0, weight=1)
+        users_tab.grid_rowconfigure(0, weight=1)
+        queries_tab.grid_rowconfigure(2, weight=1)
+
         # Users list frame
-        users_frame = ctk.CTkScrollableFrame(container)
-        users_frame.grid(row=1, column=0, padx=25, pady=(10, 25), sticky="nsew")
-        users_frame.grid_columnconfigure(0, weight=1)
+        page.users_frame = ctk.CTkScrollableFrame(users_tab)
+        page.users_frame.grid(row=0, column=0, padx=0, pady=(6, 0), sticky="nsew")
+        page.users_frame.grid_columnconfigure(0, weight=1)
+        page.users_frame.user_rows = {}
 
-        users = self.blog.list_users() or []
-        if not users:
-            ctk.CTkLabel(users_frame, text="No users found.", font=("Montserrat", 12), text_color="#94a3b8").pack(pady=12)
+        page.loading_label = ctk.CTkLabel(
+            page.users_frame, text="Loading users…", font=("Montserrat", 12), text_color="#94a3b8"
+        )
+        page.loading_label.grid(row=0, column=0, pady=12)
+
+        self._build_query_stats(page, queries_tab)
+
+    # ------------------------------------------------------------------ Query stats
+    QUERY_COLUMNS = ("Method", "Calls", "Errors", "Rows", "Avg", "p50", "p95", "p99", "Max")
+
+    def _build_query_stats(self, page, tab):
+        top = ctk.CTkFrame(tab, fg_color="transparent")
+        top.grid(row=0, column=0, sticky="we", pady=(6, 0))
+        top.grid_columnconfigure(0, weight=1)
+        page.query_summary = ctk.CTkLabel(
+            top, text="", font=("Montserrat", 12), text_color="#94a3b8", justify="left", anchor="w"
+        )
+        page.query_summary.grid(row=0, column=0, sticky="w")
+        ctk.CTkButton(top, text="UI report", width=90, command=self.show_perf_report).grid(
+            row=0, column=1, sticky="e", padx=(0, 8)
+        )
+        ctk.CTkButton(top, text="Reset", width=90, command=self.reset_query_stats).grid(
+            row=0, column=2, sticky="e"
+        )
+
+        ctk.CTkLabel(
+            tab,
+            text=f"Times in ms; percentiles are histogram bucket bounds. "
+                 f"Slow queries (≥ {query_stats.slow_ms or 'off'} ms) go to {query_stats.slow_log_path}.",
+            font=("Montserrat", 11),
+            text_color="#64748b",
+            anchor="w",
+        ).grid(row=1, column=0, sticky="w", pady=(2, 6))
+
+        page.query_table = ctk.CTkScrollableFrame(tab)
+        page.query_table.grid(row=2, column=0, sticky="nsew")
+        page.query_table.grid_columnconfigure(0, weight=1)
+        for col, title in enumerate(self.QUERY_COLUMNS):
+            ctk.CTkLabel(
+                page.query_table, text=title, font=("Montserrat", 12, "bold"),
+                anchor="w" if col == 0 else "e",
+            ).grid(row=0, column=col, sticky="we", padx=8, pady=(4, 6))
+        page.query_rows = {}
+        self._refresh_query_stats(page)
+
+    def reset_query_stats(self):
+        query_stats.reset()
+        page = self._views.get("admin")
+        if page is not None:
+            self._refresh_query_stats(page, reschedule=False)
+
+    @staticmethod
+    def _format_ms(value):
+        return ">2500" if value == float("inf") else f"{value:.1f}"
+
+    def _refresh_query_stats(self, page, reschedule=True):
+        """Update the Queries tab in place; reschedules itself every 2 s while
+        the admin page exists and only redraws while the tab is on screen."""
+        if not page.winfo_exists():
+            return
+        if reschedule:
+            self.after(2000, lambda: self._refresh_query_stats(page))
+        if self.current_view != "admin" or page.tabs.get() != "Queries":
             return
 
-        for u in users:
-            row = ctk.CTkFrame(users_frame, corner_radius=10)
-            row.pack(fill="x", padx=12, pady=8)
-            name = f'{u.get("first_name") or ""} {u.get("last_name") or ""}'.strip()
-            name = name or u.get("user_name") or "User"
-            ctk.CTkLabel(row, text=f'{u.get("id")} • {name} • {u.get("user_name")} • {u.get("role")}', font=("Montserrat", 12, "bold")).pack(anchor="w", padx=12, pady=8)
-
-            btn_row = ctk.CTkFrame(row, fg_color="transparent")
-            btn_row.pack(anchor="e", padx=12, pady=(6, 10))
-            # Promote / Demote
-            if u.get("role") != "admin":
-                ctk.CTkButton(btn_row, text="Make Admin", width=120, command=lambda uid=u["id"]: self._admin_set_role(uid, "admin")).pack(side="left", padx=(0,8))
-            else:
-                ctk.CTkButton(btn_row, text="Revoke Admin", width=120, fg_color="#ef4444", hover_color="#b91c1c", command=lambda uid=u["id"]: self._admin_set_role(uid, "user")).pack(side="left", padx=(0,8))
+        entries = query_stats.snapshot()
+        pool = db_client.pool_stats()
+        cache = query_cache.stats()
+        summary = (
+            f"Pool: {pool['in_use']}/{pool['max_size']} in use, {pool['idle']} idle · "
+            f"Cache: {cache['entries']} entries, {cache['hit_rate']:.0%} hit rate"
+        )
+        if db_client.replicas:
+            replicas = db_client.replica_stats()
+            up = sum(not stats["down"] for stats in replicas.values())
+            summary += (
+                f" · Replicas: {up}/{len(replicas)} up, "
+                f"{sum(stats['in_use'] for stats in replicas.values())} in use"
+            )
+        page.query_summary.configure(text=summary)
+
+        rows = page.query_rows
+        for method in set(rows) - {entry["method"] for entry in entries}:
+            for label in rows.pop(method):
+                label.destroy()
+        for index, entry in enumerate(entries, start=1):
+            values = (
+                entry["method"],
+                str(entry["calls"]),
+                str(entry["errors"]),
+                str(entry["rows"]),
+                f"{entry['avg_ms']:.1f}",
+                self._format_ms(entry["p50_ms"]),
+                self._format_ms(entry["p95_ms"]),
+                self._format_ms(entry["p99_ms"]),
+                f"{entry['max_ms']:.1f}",
+            )
+            labels = rows.get(entry["method"])
+            if labels is None:
+                labels = rows[entry["method"]] = [
+                    ctk.CTkLabel(page.query_table, text="", font=("Montserrat", 12),
+                                 anchor="w" if col == 0 else "e")
+                    for col in range(len(values))
+                ]
+            for col, (label, value) in enumerate(zip(labels, values)):
+                if label.cget("text") != value:
+                    label.configure(text=value)
+                label.grid(row=index, column=col, sticky="we", padx=8, pady=2)
+            if entry["errors"]:
+                labels[2].configure(text_color="#f87171")
+
+    def _render_users(self, users_frame, users):
+        """Diff ``users`` against the rows on screen: new users get a row,
+        changed ones are re-bound and removed ones are destroyed."""
+        rows = users_frame.user_rows
+        wanted = {u["id"] for u in users}
+        for user_id in [uid for uid in rows if uid not in wanted]:
+            rows.pop(user_id).destroy()
+
+        if not users:
+            if not hasattr(users_frame, "empty_label"):
+                users_frame.empty_label = ctk.CTkLabel(
+                    users_frame, text="No users found.", font=("Montserrat", 12), text_color="#94a3b8"
+                )
+            users_frame.empty_label.grid(row=0, column=0, pady=12)
+            return
+        if hasattr(users_frame, "empty_label"):
+            users_frame.empty_label.grid_remove()
+
+        for idx, u in enumerate(users):
+            row = rows.get(u["id"])
+            if row is None:
+                row = rows[u["id"]] = self._create_user_row(users_frame)
+            if row.user != u:
+                self._bind_user_row(row, u)
+            # keep the list order without recreating anything
+            row.grid(row=idx, column=0, sticky="we", padx=12, pady=8)
+
+    def _create_user_row(self, users_frame):
+        row = ctk.CTkFrame(users_frame, corner_radius=10)
+        row.user = None
+        row.info_label = ctk.CTkLabel(row, text="", font=("Montserrat", 12, "bold"))
+        row.info_label.pack(anchor="w", padx=12, pady=8)
+
+        btn_row = ctk.CTkFrame(row, fg_color="transparent")
+        btn_row.pack(anchor="e", padx=12, pady=(6, 10))
+        row.role_btn = ctk.CTkButton(btn_row, text="", width=120)
+        row.role_btn.pack(side="left", padx=(0, 8))
+        return row
+
+    def _bind_user_row(self, row, u):
+        row.user = u
+        name = f'{u.get("first_name") or ""} {u.get("last_name") or ""}'.strip()
+        name = name or u.get("user_name") or "User"
+        row.info_label.configure(text=f'{u.get("id")} • {name} • {u.get("user_name")} • {u.get("role")}')
+        # Promote / Demote
+        if u.get("role") != "admin":
+            row.role_btn.configure(
+                text="Make Admin", fg_color="#2563eb", hover_color="#1d4ed8",
+                command=lambda uid=u["id"]: self._admin_set_role(uid, "admin"),
+            )
+        else:
+            row.role_btn.configure(
+                text="Revoke Admin", fg_color="#ef4444", hover_color="#b91c1c",
+                command=lambda uid=u["id"]: self._admin_set_role(uid, "user"),
+            )
 
     def _admin_set_role(self, user_id, role):
         if not messagebox.askyesno("Confirm", f"Set user {user_id} role to {role}?"):
             return
-        if self.blog.set_user_role(user_id, role):
-            messagebox.showinfo("Success", "Role updated.")
-            self.show_admin_panel()
-        else:
-            messagebox.showerror("Error", "Unable to update role.")
+
+        def done(ok):
+            if ok:
+                messagebox.showinfo("Success", "Role updated.")
+                self.show_admin_panel()
+            else:
+                messagebox.showerror("Error", "Unable to update role.")
+
+        self.tasks.submit(self.blog.set_user_role, user_id, role, on_done=done, group="action")
 
 if __name__ == "__main__":
     app = MiniBlogApp()
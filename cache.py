@@ -0,0 +1,201 @@
+# cache.py
+import functools
+import inspect
+import threading
+import time
+from collections import OrderedDict, defaultdict
+
+
+class QueryCache:
+    """Thread-safe LRU cache with per-entry TTL and tag-based invalidation.
+
+    Every entry carries a set of tags (e.g. ``"feed"`` or ``"blog:42"``);
+    ``invalidate(*tags)`` drops every entry carrying any of them. The oldest
+    entry is evicted once ``max_entries`` is reached.
+
+    Invalidations are stamped from a running sequence. A load takes the
+    current number before it reads (``begin_load()``) and hands it to
+    ``put(since=...)``, which refuses the value if one of its tags was
+    invalidated in between: the read may predate the write.
+    """
+
+    def __init__(self, max_entries=512, default_ttl=30):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries = OrderedDict()       # key -> (expires_at, value, tags)
+        self._by_tag = defaultdict(set)     # tag -> keys
+        self._seq = 0                       # bumped by every invalidation
+        self._invalidated = {}              # tag -> seq of its last invalidation
+        self._cleared = 0                   # seq of the last clear()
+        self._loads = defaultdict(int)      # seq -> loads started at it, still running
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._counters = dict.fromkeys(
+            ("hits", "misses", "expired", "evicted", "invalidated", "stale_puts"), 0
+        )
+
+    # ------------------------- LOOKUP -------------------------- #
+    def get(self, key):
+        """Return ``(True, value)`` on a fresh hit, else ``(False, None)``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return False, None
+            expires_at, value, _tags = entry
+            if expires_at <= time.monotonic():
+                self._drop(key)
+                self._counters["expired"] += 1
+                self._counters["misses"] += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return True, value
+
+    def put(self, key, value, ttl=None, tags=(), since=None):
+        """Store ``value``; with ``since`` (from begin_load()), only if none of
+        ``tags`` has been invalidated since then."""
+        ttl = self.default_ttl if ttl is None else ttl
+        tags = frozenset(tags)
+        with self._lock:
+            if since is not None and (
+                self._cleared > since
+                or any(self._invalidated.get(tag, 0) > since for tag in tags)
+            ):
+                self._counters["stale_puts"] += 1
+                return
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (time.monotonic() + ttl, value, tags)
+            for tag in tags:
+                self._by_tag[tag].add(key)
+            while len(self._entries) > self.max_entries:
+                oldest = next(iter(self._entries))
+                self._drop(oldest)
+                self._counters["evicted"] += 1
+
+    # ---------------------- INVALIDATION ----------------------- #
+    def invalidate(self, *tags):
+        with self._lock:
+            self._seq += 1
+            for tag in tags:
+                self._invalidated[tag] = self._seq
+                for key in list(self._by_tag.get(tag, ())):
+                    self._drop(key)
+                    self._counters["invalidated"] += 1
+            self._forget_old_invalidations()
+
+    def clear(self):
+        with self._lock:
+            self._seq += 1
+            self._cleared = self._seq
+            self._entries.clear()
+            self._by_tag.clear()
+
+    def begin_load(self):
+        """Sequence number to pass to put(since=...); pair with end_load()."""
+        with self._lock:
+            self._loads[self._seq] += 1
+            return self._seq
+
+    def end_load(self, since):
+        with self._lock:
+            self._loads[since] -= 1
+            if not self._loads[since]:
+                del self._loads[since]
+
+    def _forget_old_invalidations(self):
+        # a stamp only matters to loads that began before it
+        if len(self._invalidated) <= 4 * self.max_entries:
+            return
+        oldest = min(self._loads, default=self._seq)
+        self._invalidated = {
+            tag: seq for tag, seq in self._invalidated.items() if seq > oldest
+        }
+
+    def _drop(self, key):
+        _expires_at, _value, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+    # ---------------------- ERROR RESULTS ---------------------- #
+    def bypass(self):
+        """Don't store the result of the load running on this thread.
+
+        Blog methods swallow errors and return an empty fallback; calling
+        this from the ``except`` block keeps that fallback out of the cache.
+        """
+        self._local.bypass = True
+
+    def _reset_bypass(self):
+        self._local.bypass = False
+
+    def _load_cacheable(self):
+        return not getattr(self._local, "bypass", False)
+
+    def stats(self):
+        with self._lock:
+            data = dict(self._counters)
+            data["entries"] = len(self._entries)
+            data["max_entries"] = self.max_entries
+        lookups = data["hits"] + data["misses"]
+        data["hit_rate"] = data["hits"] / lookups if lookups else 0.0
+        return data
+
+
+query_cache = QueryCache()
+
+
+def cached(ttl=None, tags=(), per_user=False, item_tag=None, cache=query_cache):
+    """Read-through caching for BlogService read methods.
+
+    The wrapped method takes the caller's session first. ``tags`` are
+    format strings filled from the other arguments, by parameter name, and
+    the session's user, e.g. ``"blog:{blog_id}"`` or ``"posts:{user}"``.
+    Arguments are bound to the signature first, so positional, keyword and
+    defaulted calls share one entry. ``per_user`` adds
+    the user id to the key for results that depend on who is asking. For page
+    results, ``item_tag`` (e.g. ``"blog:{id}"``) additionally tags the entry
+    with every item it contains, so invalidating one post drops every cached
+    page that shows it.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        @functools.wraps(method)
+        def wrapper(self, session, *args, **kwargs):
+            user = session.user_id
+            bound = signature.bind(self, session, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(list(bound.arguments.items())[2:])  # without self, session
+            key = (
+                method.__name__,
+                user if per_user else None,
+                tuple(arguments.items()),
+            )
+            found, value = cache.get(key)
+            if found:
+                return value
+
+            cache._reset_bypass()
+            since = cache.begin_load()
+            try:
+                value = method(self, session, *args, **kwargs)
+                if not cache._load_cacheable():
+                    return value
+
+                entry_tags = {tag.format(user=user, **arguments) for tag in tags}
+                if item_tag and isinstance(value, dict):
+                    entry_tags.update(item_tag.format(**item) for item in value.get("items", ()))
+                cache.put(key, value, ttl=ttl, tags=entry_tags, since=since)
+                return value
+            finally:
+                cache.end_load(since)
+
+        return wrapper
+
+    return decorator
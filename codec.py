@@ -0,0 +1,88 @@
+# codec.py
+"""JSON wire format shared by api_server.py and api_client.py.
+
+Plain JSON loses the types Blog results rely on: page cursors are tuples
+that must come back as tuples, timestamps are datetimes and counters can be
+Decimals. Those are written as single-key objects (``{"__datetime__":
+"2024-01-31T10:00:00"}``) and restored on the other side.
+"""
+import base64
+import json
+from datetime import date, datetime
+from decimal import Decimal
+
+# Blog methods a remote client may call. log_in, create_account,
+# resume_session and logout are handled by the server itself because they
+# create or end the session.
+BLOG_API = (
+    "issue_login_token",
+    "revoke_login_token",
+    "get_user_statistics",
+    "get_user_profile",
+    "is_admin",
+    "add_blog",
+    "view_user_blogs_page",
+    "get_all_blogs_page",
+    "get_blog",
+    "update_blog",
+    "soft_delete_blog",
+    "restore_blog",
+    "permanent_delete_blog",
+    "view_deleted_blogs_page",
+    "search_blogs",
+    "add_comment",
+    "get_comments_page",
+    "get_comments_after",
+    "set_reaction",
+    "get_reaction_summary",
+    "load_dashboard",
+    "load_blog_detail",
+    "list_users",
+    "set_user_role",
+)
+
+
+def _encode(value):
+    if isinstance(value, dict):
+        return {str(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {"__tuple__": [_encode(item) for item in value]}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"__decimal__": str(value)}
+    if isinstance(value, (bytes, bytearray)):
+        return {"__bytes__": base64.b64encode(value).decode("ascii")}
+    return value
+
+
+_DECODERS = {
+    "__tuple__": tuple,
+    "__datetime__": datetime.fromisoformat,
+    "__date__": date.fromisoformat,
+    "__decimal__": Decimal,
+    "__bytes__": base64.b64decode,
+}
+
+
+def _decode(obj):
+    if len(obj) == 1:
+        (key, value), = obj.items()
+        decoder = _DECODERS.get(key)
+        if decoder is not None:
+            return decoder(value)
+    return obj
+
+
+def dumps(value) -> bytes:
+    return json.dumps(_encode(value), separators=(",", ":")).encode("utf-8")
+
+
+def loads(data):
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data, object_hook=_decode)
@@ -1,41 +1,507 @@
+import functools
+import itertools
+import random
+import re
+import threading
+import time
+
+from metrics import query_stats
+
+# pymysql is imported on first use (see _driver()) so the GUI, and the thin
+# client in particular, can draw its first window without loading it.
+
+
+# InnoDB errors after which the whole transaction can simply be rerun.
+ER_LOCK_WAIT_TIMEOUT = 1205
+ER_LOCK_DEADLOCK = 1213
+RETRYABLE_ERRORS = (ER_LOCK_WAIT_TIMEOUT, ER_LOCK_DEADLOCK)
+
+# Statements that leave the data alone; anything else marks the connection
+# as having written (see mydb.release()).
+_READ_STATEMENT = re.compile(r"\s*\(?\s*(SELECT|SHOW|EXPLAIN|DESCRIBE)\b", re.IGNORECASE)
+
+
+class PoolTimeout(Exception):
+    """No connection became available within the checkout timeout."""
+
+
+def _driver():
+    import pymysql
+    import pymysql.cursors
+    return pymysql
+
+
+def is_retryable(exc):
+    """True for deadlocks and lock-wait timeouts."""
+    return (
+        isinstance(exc, _driver().err.MySQLError)
+        and bool(exc.args)
+        and exc.args[0] in RETRYABLE_ERRORS
+    )
+
+
+class _InstrumentedExecute:
+    """Reports every statement's time, rows and failure to
+    metrics.query_stats. executemany() goes through execute() as well.
+
+    It also flags its connection once a writing statement runs, which is how
+    mydb knows a session has written.
+    """
+
+    def execute(self, query, args=None):
+        if not _READ_STATEMENT.match(query):
+            self.connection.wrote = True
+        start = time.perf_counter()
+        try:
+            result = super().execute(query, args)
+        except Exception:
+            query_stats.record(query, time.perf_counter() - start, error=True)
+            raise
+        query_stats.record(query, time.perf_counter() - start, rows=self.rowcount)
+        return result
+
+
+@functools.lru_cache(maxsize=None)
+def instrumented_cursor():
+    """The DictCursor subclass every pooled connection uses, built once the
+    driver has been imported."""
+    return type("InstrumentedCursor", (_InstrumentedExecute, _driver().cursors.DictCursor), {})
+
+
+class ConnectionPool:
+    """Bounded, thread-safe pool of database connections.
+
+    Connections are created lazily up to ``max_size``. Idle connections above
+    ``min_size`` are closed once they sit unused for ``idle_timeout`` seconds,
+    and a connection that has been idle for ``health_check_after`` seconds is
+    pinged before it is handed out again.
+    """
+
+    def __init__(
+        self,
+        factory,
+        min_size=1,
+        max_size=10,
+        idle_timeout=300,
+        checkout_timeout=10,
+        health_check_after=30,
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("pool sizes must satisfy 0 <= min_size <= max_size, max_size >= 1")
+
+        self._factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.checkout_timeout = checkout_timeout
+        self.health_check_after = health_check_after
+
+        self._cond = threading.Condition()
+        self._idle = []          # [(connection, last_used)], most recent last
+        self._size = 0           # open + reserved connections
+        self._in_use = 0
+        self._closed = False
+
+        self._stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "wait_time_total": 0.0,
+            "wait_time_max": 0.0,
+            "timeouts": 0,
+            "created": 0,
+            "evicted": 0,
+            "discarded": 0,
+            "failed_health_checks": 0,
+            "peak_in_use": 0,
+        }
+
+    # ----------------------- CHECKOUT -------------------------- #
+    def checkout(self, timeout=None):
+        timeout = self.checkout_timeout if timeout is None else timeout
+        start = time.monotonic()
+        deadline = start + timeout
+        waited = False
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise PoolTimeout("connection pool is closed")
+
+                self._evict_idle_locked()
+                if self._idle:
+                    conn, last_used = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    conn, last_used = None, None
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise PoolTimeout(
+                        f"no connection available after {timeout:.1f}s "
+                        f"({self._in_use}/{self.max_size} in use)"
+                    )
+                if not waited:
+                    waited = True
+                    self._stats["waits"] += 1
+                self._cond.wait(remaining)
+
+            self._in_use += 1
+            self._stats["checkouts"] += 1
+            self._stats["peak_in_use"] = max(self._stats["peak_in_use"], self._in_use)
+            wait_time = time.monotonic() - start
+            self._stats["wait_time_total"] += wait_time
+            self._stats["wait_time_max"] = max(self._stats["wait_time_max"], wait_time)
+
+        # Network work happens outside the lock.
+        try:
+            if conn is not None and not self._is_healthy(conn, last_used):
+                self._close_quietly(conn)
+                with self._cond:
+                    self._stats["failed_health_checks"] += 1
+                conn = None
+            if conn is None:
+                conn = self._factory()
+                with self._cond:
+                    self._stats["created"] += 1
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+
+        return conn
+
+    def checkin(self, conn):
+        if conn is None:
+            return
+
+        healthy = True
+        try:
+            # End any open transaction so the next borrower starts clean
+            # (and does not inherit a stale REPEATABLE READ snapshot).
+            conn.rollback()
+        except Exception:
+            healthy = False
+
+        with self._cond:
+            self._in_use -= 1
+            if healthy and conn.open and not self._closed:
+                self._idle.append((conn, time.monotonic()))
+                conn = None
+            else:
+                self._size -= 1
+                self._stats["discarded"] += 1
+            self._evict_idle_locked()
+            self._cond.notify()
+
+        if conn is not None:
+            self._close_quietly(conn)
+
+    # ----------------------- MAINTENANCE ----------------------- #
+    def _is_healthy(self, conn, last_used):
+        if not conn.open:
+            return False
+        if time.monotonic() - last_used < self.health_check_after:
+            return True
+        try:
+            conn.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    def _evict_idle_locked(self):
+        now = time.monotonic()
+        keep = []
+        # oldest first, so the most recently used connections survive
+        for conn, last_used in self._idle:
+            expired = now - last_used > self.idle_timeout
+            if expired and self._size > self.min_size:
+                self._size -= 1
+                self._stats["evicted"] += 1
+                self._close_quietly(conn)
+            else:
+                keep.append((conn, last_used))
+        self._idle = keep
+
+    @staticmethod
+    def _close_quietly(conn):
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._size -= len(idle)
+            self._cond.notify_all()
+        for conn, _ in idle:
+            self._close_quietly(conn)
+
+    def stats(self):
+        """Snapshot of pool counters, for sizing ``min_size``/``max_size``."""
+        with self._cond:
+            data = dict(self._stats)
+            data.update(
+                size=self._size,
+                idle=len(self._idle),
+                in_use=self._in_use,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                utilisation=self._in_use / self.max_size,
+                peak_utilisation=self._stats["peak_in_use"] / self.max_size,
+                avg_wait=(
+                    data["wait_time_total"] / data["checkouts"]
+                    if data["checkouts"] else 0.0
+                ),
+            )
+        return data
+
+
+def _endpoints(replicas):
+    """Normalise ``replicas``: "host[:port]" strings (a comma separated
+    string is split) or dicts overriding host/port/user/password/database."""
+    if not replicas:
+        return []
+    if isinstance(replicas, str):
+        replicas = [part.strip() for part in replicas.split(",") if part.strip()]
+    endpoints = []
+    for spec in replicas:
+        if isinstance(spec, str):
+            host, _, port = spec.partition(":")
+            spec = {"host": host, "port": int(port)} if port else {"host": host}
+        endpoint = dict(spec)
+        endpoint.setdefault("name", f"{endpoint['host']}:{endpoint.get('port', 3306)}")
+        endpoints.append(endpoint)
+    return endpoints
+
 
-import pymysql
-import pymysql.cursors
 class mydb:
+    """Pooled connections to the primary and, optionally, read replicas.
+
+    ``get_db()`` hands out primary connections. ``get_db(readonly=True,
+    session=...)`` hands out a replica connection (round robin) instead,
+    unless that session committed a write within the last
+    ``read_your_writes`` seconds: then it stays on the primary so an author
+    always reads back their own change. A replica that cannot be reached is
+    skipped for ``replica_retry_after`` seconds and reads fall back to the
+    primary.
+    """
+
     def __init__(
         self,
         host="localhost",
         user="root",
         password="30102004",
         database="miniblog2",
+        port=3306,
+        pool_min_size=1,
+        pool_max_size=10,
+        pool_idle_timeout=300,
+        pool_checkout_timeout=10,
+        replicas=None,
+        read_your_writes=5.0,
+        replica_retry_after=30,
     ):
         self.host = host
+        self.port = port
         self.user = user
         self.password = password
         self.database = database
-        self.connection = None
+        self.pool_min_size = pool_min_size
+        self.pool_max_size = pool_max_size
+        self.pool_idle_timeout = pool_idle_timeout
+        self.pool_checkout_timeout = pool_checkout_timeout
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+        self.replicas = _endpoints(replicas)
+        self.read_your_writes = read_your_writes
+        self.replica_retry_after = replica_retry_after
+        self._replica_pools = {}
+        self._replica_down = {}          # name -> monotonic time to retry it
+        self._next_replica = itertools.count()
+        self._writes_lock = threading.Lock()
+        self._last_write = {}            # session -> monotonic time of its last write
+        self._last_any_write = float("-inf")
 
-    def connect(self):
+    def connect(self, endpoint=None):
+        """Open a new, unpooled connection to the primary or ``endpoint``."""
+        endpoint = endpoint or {}
         try:
-            if (
-                self.connection is None
-                or not self.connection.open
-            ):
-                self.connection = pymysql.connect(
-                    host=self.host,
-                    user=self.user,
-                    password=self.password,
-                    database=self.database,
-                    charset="utf8mb4",
-                    cursorclass=pymysql.cursors.DictCursor,
-                    autocommit=False,   # manual commit for safety
-                )
+            conn = _driver().connect(
+                host=endpoint.get("host", self.host),
+                port=endpoint.get("port", self.port),
+                user=endpoint.get("user", self.user),
+                password=endpoint.get("password", self.password),
+                database=endpoint.get("database", self.database),
+                charset="utf8mb4",
+                cursorclass=instrumented_cursor(),
+                autocommit=False,   # manual commit for safety
+            )
         except Exception as e:
             print("❌ Database connection error:", e)
             raise e
+        conn.replica = endpoint.get("name")
+        return conn
+
+    def _new_pool(self, factory):
+        return ConnectionPool(
+            factory,
+            min_size=self.pool_min_size,
+            max_size=self.pool_max_size,
+            idle_timeout=self.pool_idle_timeout,
+            checkout_timeout=self.pool_checkout_timeout,
+        )
+
+    @property
+    def pool(self):
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    self._pool = self._new_pool(self.connect)
+        return self._pool
+
+    def _replica_pool(self, endpoint):
+        name = endpoint["name"]
+        if name not in self._replica_pools:
+            with self._pool_lock:
+                if name not in self._replica_pools:
+                    self._replica_pools[name] = self._new_pool(
+                        functools.partial(self.connect, endpoint)
+                    )
+        return self._replica_pools[name]
+
+    # ------------------------- ROUTING ------------------------- #
+    def get_db(self, readonly=False, session=None):
+        """Check a connection out of a pool. Pair every call with release().
+
+        ``readonly`` callers may get a replica; ``session`` is any hashable
+        identifying who is asking, used for read-your-writes. Without a
+        session, reads are never held back on the primary.
+        """
+        if readonly and self.replicas and not (session is not None and self.wrote_recently(session)):
+            conn = self._replica_checkout()
+            if conn is not None:
+                return conn
+        conn = self.pool.checkout()
+        conn.session = session
+        conn.wrote = False
+        return conn
+
+    def _replica_checkout(self):
+        start = next(self._next_replica)
+        for offset in range(len(self.replicas)):
+            endpoint = self.replicas[(start + offset) % len(self.replicas)]
+            if self._replica_down.get(endpoint["name"], 0) > time.monotonic():
+                continue
+            try:
+                return self._replica_pool(endpoint).checkout()
+            except PoolTimeout:
+                continue    # busy, not broken
+            except Exception as e:
+                print(f"❌ replica {endpoint['name']} unavailable:", e)
+                self._replica_down[endpoint["name"]] = time.monotonic() + self.replica_retry_after
+        return None
+
+    def release(self, connection):
+        """Return a connection obtained from get_db() to its pool."""
+        name = getattr(connection, "replica", None)
+        if name is not None:
+            self._replica_pools[name].checkin(connection)
+            return
+        if getattr(connection, "wrote", False):
+            self.note_write(connection.session)
+        self.pool.checkin(connection)
+
+    def is_replica(self, connection):
+        return getattr(connection, "replica", None) is not None
+
+    def note_write(self, session=None):
+        """Pin ``session``'s reads to the primary for the next
+        ``read_your_writes`` seconds."""
+        now = time.monotonic()
+        with self._writes_lock:
+            self._last_any_write = now
+            if session is not None:
+                self._last_write[session] = now
+            if len(self._last_write) > 1000:
+                cutoff = now - self.read_your_writes
+                self._last_write = {
+                    key: at for key, at in self._last_write.items() if at > cutoff
+                }
+
+    def wrote_recently(self, session=None):
+        """True if ``session`` (or, without one, anybody) wrote within the
+        read-your-writes window."""
+        with self._writes_lock:
+            if session is None:
+                at = self._last_any_write
+            else:
+                at = self._last_write.get(session, float("-inf"))
+        return time.monotonic() - at < self.read_your_writes
+
+    def run_transaction(self, work, retries=3, backoff=0.02, session=None):
+        """Run ``work(cursor)`` on a pooled connection and commit.
+
+        On a deadlock or lock-wait timeout the transaction is rolled back and
+        ``work`` is run again (up to ``retries`` more times, with jittered
+        exponential backoff), so ``work`` must only touch the database.
+        Returns whatever ``work`` returns; other errors are re-raised.
+        """
+        for attempt in range(retries + 1):
+            db = self.get_db(session=session)
+            cursor = db.cursor()
+            try:
+                result = work(cursor)
+                db.commit()
+                return result
+            except Exception as e:
+                db.rollback()
+                if attempt == retries or not is_retryable(e):
+                    raise
+            finally:
+                cursor.close()
+                self.release(db)
+            time.sleep(random.uniform(0, backoff * 2 ** attempt))
+
+    def warm_up(self):
+        """Import the driver and open the primary pool's ``min_size``
+        connections now, so the first real query does not pay for them.
+
+        Meant for a background thread at startup. Returns False (after
+        printing why) when the database cannot be reached.
+        """
+        connections = []
+        try:
+            for _ in range(max(self.pool_min_size, 1)):
+                connections.append(self.pool.checkout())
+            return True
+        except Exception as e:
+            print("❌ warm up error:", e)
+            return False
+        finally:
+            for conn in connections:
+                self.pool.checkin(conn)
+
+    def pool_stats(self):
+        return self.pool.stats()
 
-        return self.connection
+    def replica_stats(self):
+        """Pool stats per replica, plus whether it is currently skipped."""
+        now = time.monotonic()
+        return {
+            name: dict(pool.stats(), down=self._replica_down.get(name, 0) > now)
+            for name, pool in list(self._replica_pools.items())
+        }
 
-    def get_db(self):
-  
-        return self.connect()
+    def close(self):
+        if self._pool is not None:
+            self._pool.close()
+        for pool in list(self._replica_pools.values()):
+            pool.close()
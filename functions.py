@@ -1,118 +1,288 @@
 # functions.py
-import bcrypt
+import functools
+import hashlib
+import inspect
+import os
+import re
+import secrets
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from cache import cached, query_cache
 from db import mydb
 
-db_client = mydb()
+# Comma separated "host[:port]" read replicas; reads stay on the primary for
+# MINIBLOG_READ_YOUR_WRITES seconds after a session writes.
+db_client = mydb(
+    replicas=os.environ.get("MINIBLOG_DB_REPLICAS"),
+    read_your_writes=float(os.environ.get("MINIBLOG_READ_YOUR_WRITES", "5")),
+)
+
+PAGE_SIZE = 20
+
+# Keyset cursor that sorts after every real (created_at, id) pair, so the
+# first page runs the same statement (and index range) as later pages.
+_FIRST_PAGE = ("9999-12-31 23:59:59", 2147483647)
+# Same idea for relevance-ranked (score, id) cursors.
+_FIRST_RANK = (1e30, 2147483647)
+# Comment threads read oldest first, so their cursor starts before everything.
+_FIRST_COMMENT = ("1970-01-01 00:00:00", 0)
+COMMENT_PAGE_SIZE = 50
+
+SEARCH_SCOPES = ("mine", "community")
+
+REACTIONS = ("like", "dislike")
+_OTHER_REACTION = {"like": "dislike", "dislike": "like"}
+
+# Counters kept in user_stats, maintained by the write paths below.
+USER_STAT_COLUMNS = (
+    "user_posts",
+    "trash_posts",
+    "user_comments",
+    "likes_received",
+    "dislikes_received",
+)
+# site_stats spreads the community post count over this many rows so
+# concurrent publishers do not all queue on one hot counter row.
+SITE_STAT_SLOTS = 16
+# InnoDB's default innodb_ft_min_token_size; shorter words are not indexed.
+_FT_MIN_WORD = 3
+# List queries return blog.preview (computed on write) instead of the body;
+# get_blog() loads main_blog for a single post.
+PREVIEW_LENGTH = 320
+# "Remember me" logins expire after this many days.
+REMEMBER_DAYS = int(os.environ.get("MINIBLOG_REMEMBER_DAYS", "30"))
 
 # ---------------------- PASSWORD HELPERS ---------------------- #
-def _hash_password(raw_password: str) -> bytes:
+# bcrypt work factor for new hashes; stored hashes with another cost are
+# rehashed on the next successful login. benchmarks/bcrypt_cost.py measures
+# what each cost takes on this machine.
+BCRYPT_ROUNDS = int(os.environ.get("MINIBLOG_BCRYPT_ROUNDS", "12"))
+if not 4 <= BCRYPT_ROUNDS <= 31:
+    raise ValueError("MINIBLOG_BCRYPT_ROUNDS must be between 4 and 31")
+
+# bcrypt releases the GIL, so hashes run on their own small pool: a burst of
+# logins is capped at this many cores and cannot tie up every GUI worker.
+_bcrypt_pool = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("MINIBLOG_BCRYPT_WORKERS", "2")),
+    thread_name_prefix="bcrypt",
+)
+
+
+# BlogService.gather() runs the independent reads behind one view side by
+# side on this pool, each on its own pooled connection.
+_fanout_pool = ThreadPoolExecutor(
+    max_workers=int(os.environ.get("MINIBLOG_FANOUT_WORKERS", "8")),
+    thread_name_prefix="blog-fanout",
+)
+_fanout_local = threading.local()
+
+
+def _fanout_call(fn, args):
+    _fanout_local.active = True
+    try:
+        return fn(*args)
+    finally:
+        _fanout_local.active = False
+
+
+def _bcrypt():
+    # imported on first use, like the MySQL driver (see warm_up())
+    import bcrypt
+    return bcrypt
+
+
+def _hash_password(raw_password: str, rounds=None) -> bytes:
     """Hash a plaintext password using bcrypt."""
-    return bcrypt.hashpw(raw_password.encode("utf-8"), bcrypt.gensalt())
+    bcrypt = _bcrypt()
+    salt = bcrypt.gensalt(rounds or BCRYPT_ROUNDS)
+    return _bcrypt_pool.submit(bcrypt.hashpw, raw_password.encode("utf-8"), salt).result()
 
 
 def _check_password(raw_password: str, hashed_password: bytes) -> bool:
     """Check plaintext password against bcrypt hash."""
-    return bcrypt.checkpw(raw_password.encode("utf-8"), hashed_password)
+    return _bcrypt_pool.submit(
+        _bcrypt().checkpw, raw_password.encode("utf-8"), hashed_password
+    ).result()
+
+
+def _token_hash(token: str) -> str:
+    """Login tokens are long random strings, so a plain SHA-256 is enough
+    to keep the stored value useless to a reader of the table."""
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def _hash_cost(hashed_password: bytes) -> int:
+    """The work factor of a ``$2b$12$...`` hash."""
+    return int(hashed_password.split(b"$")[2])
+
+
+def _page_result(rows, limit, key=("created_at", "id")):
+    """Trim a LIMIT n+1 result to n rows and derive the next keyset cursor."""
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = tuple(items[-1][col] for col in key)
+    return {"items": items, "next_cursor": next_cursor}
+
+
+def make_preview(main_blog):
+    """The list-view excerpt stored in blog.preview."""
+    preview = (main_blog or "").strip()
+    if len(preview) > PREVIEW_LENGTH:
+        preview = preview[:PREVIEW_LENGTH].rstrip() + "..."
+    return preview
+
+
+def _empty_page():
+    return {"items": [], "next_cursor": None}
+
+
+def _empty_stats():
+    stats = dict.fromkeys(USER_STAT_COLUMNS, 0)
+    stats["community_posts"] = 0
+    return stats
+
+
+# ---------------------- COUNTER HELPERS ----------------------- #
+# These run on the caller's cursor, inside the caller's transaction, so a
+# counter only moves if the write it describes commits.
+def _bump_user_stats(cursor, user_id, **deltas):
+    """Add deltas (column=delta) to a user's user_stats row."""
+    columns = [col for col, delta in deltas.items() if delta]
+    if not columns:
+        return
+    unknown = set(columns) - set(USER_STAT_COLUMNS)
+    if unknown:
+        raise ValueError(f"unknown user_stats columns: {sorted(unknown)}")
+
+    names = ", ".join(columns)
+    placeholders = ", ".join(["%s"] * len(columns))
+    updates = ", ".join(f"{col} = {col} + VALUES({col})" for col in columns)
+    cursor.execute(
+        f"INSERT INTO user_stats (user_id, {names}) VALUES (%s, {placeholders}) "
+        f"ON DUPLICATE KEY UPDATE {updates}",
+        (user_id, *[deltas[col] for col in columns]),
+    )
+
+
+def _bump_community_posts(cursor, delta, user_id):
+    if not delta:
+        return
+    cursor.execute(
+        """
+        INSERT INTO site_stats (slot, community_posts) VALUES (%s, %s)
+        ON DUPLICATE KEY UPDATE community_posts = community_posts + VALUES(community_posts)
+        """,
+        (user_id % SITE_STAT_SLOTS, delta),
+    )
+
+
+def _fulltext_query(words):
+    """BOOLEAN MODE query requiring every word, each matched as a prefix."""
+    return " ".join(f"+{word}*" for word in words)
+
+
+def _apply_reaction_change(cursor, blog_id, author_id, previous, current):
+    """Move the post's and its author's reaction counters from previous to current."""
+    like_delta = (current == "like") - (previous == "like")
+    dislike_delta = (current == "dislike") - (previous == "dislike")
+    if not like_delta and not dislike_delta:
+        return
+    cursor.execute(
+        """
+        UPDATE blog
+        SET like_count = like_count + %s,
+            dislike_count = dislike_count + %s
+        WHERE id=%s
+        """,
+        (like_delta, dislike_delta, blog_id),
+    )
+    _bump_user_stats(
+        cursor,
+        author_id,
+        likes_received=like_delta,
+        dislikes_received=dislike_delta,
+    )
 
 
 # ============================================================= #
 #                           BLOG SYSTEM                         #
 # ============================================================= #
-class Blog:
-    def __init__(self):
-        self._user_id = None
-        self._user_name = None
-        self._profile_cache = None
+class BlogService:
+    """The Blog operations, shared by every user of the process.
 
-    # ----------------------- SESSION --------------------------- #
-    def clear_session(self):
-        self._user_id = None
-        self._user_name = None
-        self._profile_cache = None
+    It keeps no per-user state: each method takes the caller's Session
+    first, and ``log_in`` / ``create_account`` fill that session in. One
+    instance can serve any number of sessions from any number of threads.
+    """
 
-    @property
-    def user_id(self):
-        return self._user_id
+    def __init__(self, db=None, sessions=None):
+        self.db = db or db_client
+        # the server's SessionManager, if any; set_user_role drops the live
+        # sessions of a user whose role changed
+        self.sessions = sessions
 
-    @property
-    def user_name(self):
-        return self._user_name
+    # ----------------------- SESSION --------------------------- #
+    def _read_db(self, session):
+        """Connection for a read-only method: a replica, unless this session
+        wrote within the read-your-writes window."""
+        db = self.db.get_db(readonly=True, session=session)
+        if self.db.is_replica(db) and self.db.wrote_recently():
+            # someone else's write may not have reached the replica yet;
+            # keep this result out of the shared query cache
+            query_cache.bypass()
+        return db
     
-    def get_user_statistics(self):
-        """Return stats for current user: post counts, comments, likes, etc."""
-        if not self._user_id:
-            return {
-                "user_posts": 0,
-                "trash_posts": 0,
-                "community_posts": 0,
-                "user_comments": 0,
-                "likes_received": 0,
-                "dislikes_received": 0
-            }
+    @cached(ttl=30, tags=("stats",), per_user=True)
+    def get_user_statistics(self, session):
+        """Return stats for current user: post counts, comments, likes, etc.
+
+        Served from the user_stats / site_stats counter tables in one query;
+        run ``python maintenance.py rebuild-stats`` if they ever drift.
+        """
+        if not session.user_id:
+            return _empty_stats()
 
-        db = db_client.get_db()
+        db = self._read_db(session)
         cursor = db.cursor()
 
         try:
-            stats = {}
-
-            cursor.execute(
-                "SELECT COUNT(*) AS cnt FROM blog WHERE created_by=%s AND dlt=0",
-                (self._user_id,)
-            )
-            stats["user_posts"] = cursor.fetchone()["cnt"]
-
-            cursor.execute(
-                "SELECT COUNT(*) AS cnt FROM blog WHERE created_by=%s AND dlt=1",
-                (self._user_id,)
-            )
-            stats["trash_posts"] = cursor.fetchone()["cnt"]
-
-            cursor.execute("SELECT COUNT(*) AS cnt FROM blog WHERE dlt=0")
-            stats["community_posts"] = cursor.fetchone()["cnt"]
-
-            cursor.execute(
-                "SELECT COUNT(*) AS cnt FROM blog_comments WHERE user_id=%s",
-                (self._user_id,)
-            )
-            stats["user_comments"] = cursor.fetchone()["cnt"]
-
             cursor.execute(
                 """
-                SELECT 
-                    SUM(CASE WHEN br.reaction='like' THEN 1 ELSE 0 END) AS likes,
-                    SUM(CASE WHEN br.reaction='dislike' THEN 1 ELSE 0 END) AS dislikes
-                FROM blog_reactions br
-                JOIN blog b ON br.blog_id = b.id
-                WHERE b.created_by = %s
+                SELECT COALESCE(us.user_posts, 0) AS user_posts,
+                       COALESCE(us.trash_posts, 0) AS trash_posts,
+                       COALESCE(us.user_comments, 0) AS user_comments,
+                       COALESCE(us.likes_received, 0) AS likes_received,
+                       COALESCE(us.dislikes_received, 0) AS dislikes_received,
+                       site.community_posts
+                FROM (
+                    SELECT COALESCE(SUM(community_posts), 0) AS community_posts
+                    FROM site_stats
+                ) site
+                LEFT JOIN user_stats us ON us.user_id = %s
                 """,
-                (self._user_id,)
+                (session.user_id,)
             )
-            row = cursor.fetchone()
-            stats["likes_received"] = row["likes"] or 0
-            stats["dislikes_received"] = row["dislikes"] or 0
-
-            return stats
+            row = cursor.fetchone() or {}
+            return {key: int(row.get(key) or 0) for key in _empty_stats()}
 
         except Exception as e:
+            query_cache.bypass()
             print("❌ get_user_statistics error:", e)
-            return {
-                "user_posts": 0,
-                "trash_posts": 0,
-                "community_posts": 0,
-                "user_comments": 0,
-                "likes_received": 0,
-                "dislikes_received": 0
-            }
+            return _empty_stats()
 
         finally:
             cursor.close()
-
-
+            self.db.release(db)
 
     # -------------------- ACCOUNT CREATION --------------------- #
-    def create_account(self, first_name, last_name, contact, email, bio, user_name, password):
-        db = db_client.get_db()
+    def create_account(self, session, first_name, last_name, contact, email, bio, user_name, password):
+        # hash before opening the transaction so it does not hold row locks
+        # (or a pooled connection) for the whole bcrypt run
+        hashed = _hash_password(password)
+        db = self.db.get_db(session=session)
         cursor = db.cursor()
 
         try:
@@ -132,15 +302,16 @@ class Blog:
             )
             user_id = cursor.lastrowid
 
-            hashed = _hash_password(password)
             cursor.execute(
                 "INSERT INTO user_pass (user_id, password) VALUES (%s, %s)",
                 (user_id, hashed),
             )
+            cursor.execute("INSERT INTO user_stats (user_id) VALUES (%s)", (user_id,))
 
             db.commit()
-            self._user_id = user_id
-            self._user_name = user_name
+            query_cache.invalidate("users")
+            session.user_id = user_id
+            session.user_name = user_name
             return True
 
         except Exception as e:
@@ -150,10 +321,13 @@ class Blog:
 
         finally:
             cursor.close()
+            self.db.release(db)
 
     # ------------------------- LOGIN --------------------------- #
-    def log_in(self, user_name, password):
-        db = db_client.get_db()
+    def log_in(self, session, user_name, password):
+        # primary on purpose: an account created moments ago elsewhere may
+        # not have reached the replicas yet
+        db = self.db.get_db(session=session)
         cursor = db.cursor()
 
         try:
@@ -166,38 +340,167 @@ class Blog:
                 """,
                 (user_name,),
             )
-
             user_data = cursor.fetchone()
-            if not user_data:
-                return False
 
-            stored_hash = user_data["password"]
-            if isinstance(stored_hash, str):
-                stored_hash = stored_hash.encode("utf-8")
+        except Exception as e:
+            print("❌ login error:", e)
+            return False
+
+        finally:
+            # the connection goes back before the (slow) password check
+            cursor.close()
+            self.db.release(db)
+
+        if not user_data:
+            return False
 
+        stored_hash = user_data["password"]
+        if isinstance(stored_hash, str):
+            stored_hash = stored_hash.encode("utf-8")
+
+        try:
             if not _check_password(password, stored_hash):
                 return False
+        except Exception as e:
+            print("❌ login error:", e)
+            return False
 
-            self._user_id = user_data["user_id"]
-            self._user_name = user_data["user_name"]
-            self._profile_cache = None
-            return True
+        session.user_id = user_data["user_id"]
+        session.user_name = user_data["user_name"]
+        session.profile = None
+
+        if _hash_cost(stored_hash) != BCRYPT_ROUNDS:
+            self._rehash_password(session, user_data["user_id"], password, stored_hash)
+        return True
+
+    def _rehash_password(self, session, user_id, password, old_hash):
+        """Store a hash at the configured cost. Failures only delay the upgrade."""
+        new_hash = _hash_password(password)
+        db = self.db.get_db(session=session)
+        cursor = db.cursor()
+
+        try:
+            # only replace the hash we verified, never a password changed meanwhile
+            cursor.execute(
+                "UPDATE user_pass SET password=%s WHERE user_id=%s AND password=%s",
+                (new_hash, user_id, old_hash),
+            )
+            db.commit()
 
         except Exception as e:
-            print("❌ login error:", e)
+            db.rollback()
+            print("❌ rehash_password error:", e)
+
+        finally:
+            cursor.close()
+            self.db.release(db)
+
+    # -------------------- REMEMBERED LOGINS -------------------- #
+    def issue_login_token(self, session):
+        """Create a "remember me" token for the logged-in user.
+
+        Returns the token, to be kept by the client; only its SHA-256 is
+        stored. It stays valid for REMEMBER_DAYS unless revoked.
+        """
+        if not session.user_id:
+            return None
+
+        token = secrets.token_urlsafe(32)
+        db = self.db.get_db(session=session)
+        cursor = db.cursor()
+
+        try:
+            cursor.execute(
+                "DELETE FROM login_tokens WHERE user_id=%s AND expires_at <= NOW()",
+                (session.user_id,),
+            )
+            cursor.execute(
+                """
+                INSERT INTO login_tokens (token_hash, user_id, expires_at)
+                VALUES (%s, %s, NOW() + INTERVAL %s DAY)
+                """,
+                (_token_hash(token), session.user_id, REMEMBER_DAYS),
+            )
+            db.commit()
+            return token
+
+        except Exception as e:
+            db.rollback()
+            print("❌ issue_login_token error:", e)
+            return None
+
+        finally:
+            cursor.close()
+            self.db.release(db)
+
+    def resume_session(self, session, token):
+        """Log ``session`` in from a remembered token: one primary-key lookup,
+        no password check. Also fills the profile cache."""
+        if not token:
+            return False
+
+        db = self.db.get_db(session=session)
+        cursor = db.cursor()
+
+        try:
+            cursor.execute(
+                """
+                SELECT u.id, u.first_name, u.last_name, u.email, u.contact, u.bio,
+                       u.user_name, u.created_at, u.role
+                FROM login_tokens t
+                JOIN user_info u ON u.id = t.user_id
+                WHERE t.token_hash = %s AND t.expires_at > NOW()
+                """,
+                (_token_hash(token),),
+            )
+            profile = cursor.fetchone()
+
+        except Exception as e:
+            print("❌ resume_session error:", e)
             return False
 
         finally:
             cursor.close()
+            self.db.release(db)
+
+        if not profile:
+            return False
+        session.user_id = profile["id"]
+        session.user_name = profile["user_name"]
+        session.profile = profile
+        return True
+
+    def revoke_login_token(self, session, token):
+        if not token:
+            return False
+
+        db = self.db.get_db(session=session)
+        cursor = db.cursor()
+
+        try:
+            cursor.execute(
+                "DELETE FROM login_tokens WHERE token_hash=%s", (_token_hash(token),)
+            )
+            db.commit()
+            return cursor.rowcount > 0
+
+        except Exception as e:
+            db.rollback()
+            print("❌ revoke_login_token error:", e)
+            return False
+
+        finally:
+            cursor.close()
+            self.db.release(db)
 
     # ----------------------- PROFILE --------------------------- #
-    def get_user_profile(self):
-        if not self._user_id:
+    def get_user_profile(self, session):
+        if not session.user_id:
             return None
-        if self._profile_cache:
-            return self._profile_cache
+        if session.profile:
+            return session.profile
 
-        db = db_client.get_db()
+        db = self._read_db(session)
         cursor = db.cursor()
 
         try:
@@ -208,10 +511,10 @@ class Blog:
                 FROM user_info
                 WHERE id=%s
                 """,
-                (self._user_id,),
+                (session.user_id,),
             )
             data = cursor.fetchone()
-            self._profile_cache = data
+            session.profile = data
             return data
 
         except Exception as e:
@@ -220,23 +523,30 @@ class Blog:
 
         finally:
             cursor.close()
+            self.db.release(db)
 
     # ============================================================= #
     #                        BLOG OPERATIONS                        #
     # ============================================================= #
-    def add_blog(self, title, main_blog):
-        if not self._user_id:
+    def add_blog(self, session, title, main_blog):
+        if not session.user_id:
             return False
 
-        db = db_client.get_db()
+        db = self.db.get_db(session=session)
         cursor = db.cursor()
 
         try:
             cursor.execute(
-                "INSERT INTO blog (title, main_blog, created_by) VALUES (%s, %s, %s)",
-                (title, main_blog, self._user_id),
+                """
+                INSERT INTO blog (title, main_blog, preview, created_by)
+                VALUES (%s, %s, %s, %s)
+                """,
+                (title, main_blog, make_preview(main_blog), session.user_id),
             )
+            _bump_user_stats(cursor, session.user_id, user_posts=1)
+            _bump_community_posts(cursor, 1, session.user_id)
             db.commit()
+            query_cache.invalidate("feed", f"posts:{session.user_id}", "stats")
             return True
 
         except Exception as e:
@@ -246,65 +556,126 @@ class Blog:
 
         finally:
             cursor.close()
+            self.db.release(db)
 
-    def view_user_blogs(self):
-        if not self._user_id:
-            return []
+    @cached(ttl=30, tags=("posts:{user}",), per_user=True, item_tag="blog:{id}")
+    def view_user_blogs_page(self, session, cursor=None, limit=PAGE_SIZE):
+        """One page of the user's posts, newest first.
+
+        ``cursor`` is the ``next_cursor`` of the previous page (or None for
+        the first page). Returns ``{"items": [...], "next_cursor": ...}``.
+        """
+        if not session.user_id:
+            return _empty_page()
 
-        db = db_client.get_db()
+        created_at, last_id = cursor or _FIRST_PAGE
+        db = self._read_db(session)
         cursor = db.cursor()
 
         try:
             cursor.execute(
-                "SELECT * FROM blog WHERE created_by=%s AND dlt=0 ORDER BY created_at DESC",
-                (self._user_id,),
+                """
+                SELECT id, title, preview, created_by, dlt, created_at,
+                       like_count, dislike_count, comment_count
+                FROM blog
+                WHERE created_by=%s AND dlt=0
+                  AND (created_at < %s OR (created_at = %s AND id < %s))
+                ORDER BY created_at DESC, id DESC
+                LIMIT %s
+                """,
+                (session.user_id, created_at, created_at, last_id, limit + 1),
             )
-            return cursor.fetchall()
+            return _page_result(cursor.fetchall(), limit)
 
         except Exception as e:
-            print("❌ view_user_blogs error:", e)
-            return []
+            query_cache.bypass()
+            print("❌ view_user_blogs_page error:", e)
+            return _empty_page()
 
         finally:
             cursor.close()
+            self.db.release(db)
 
-    def get_all_blogs(self):
-        db = db_client.get_db()
+    @cached(ttl=30, tags=("feed",), item_tag="blog:{id}")
+    def get_all_blogs_page(self, session, cursor=None, limit=PAGE_SIZE):
+        """One page of the community feed, newest first (see view_user_blogs_page)."""
+        created_at, last_id = cursor or _FIRST_PAGE
+        db = self._read_db(session)
         cursor = db.cursor()
 
         try:
             cursor.execute(
                 """
-                SELECT b.*, u.user_name, u.first_name, u.last_name
+                SELECT b.id, b.title, b.preview, b.created_by, b.dlt, b.created_at,
+                       b.like_count, b.dislike_count, b.comment_count,
+                       u.user_name, u.first_name, u.last_name
                 FROM blog b
                 LEFT JOIN user_info u ON b.created_by = u.id
                 WHERE b.dlt=0
-                ORDER BY b.created_at DESC
+                  AND (b.created_at < %s OR (b.created_at = %s AND b.id < %s))
+                ORDER BY b.created_at DESC, b.id DESC
+                LIMIT %s
+                """,
+                (created_at, created_at, last_id, limit + 1),
+            )
+            return _page_result(cursor.fetchall(), limit)
+
+        except Exception as e:
+            query_cache.bypass()
+            print("❌ get_all_blogs_page error:", e)
+            return _empty_page()
+
+        finally:
+            cursor.close()
+            self.db.release(db)
+
+    @cached(ttl=30, tags=("blog:{blog_id}",), per_user=True)
+    def get_blog(self, session, blog_id):
+        """A single post including its full ``main_blog`` body, or None.
+
+        Deleted posts are only returned to their author.
+        """
+        db = self._read_db(session)
+        cursor = db.cursor()
+
+        try:
+            cursor.execute(
                 """
+                SELECT b.*, u.user_name, u.first_name, u.last_name
+                FROM blog b
+                LEFT JOIN user_info u ON b.created_by = u.id
+                WHERE b.id=%s AND (b.dlt=0 OR b.created_by=%s)
+                """,
+                (blog_id, session.user_id),
             )
-            return cursor.fetchall()
+            return cursor.fetchone()
 
         except Exception as e:
-            print("❌ get_all_blogs error:", e)
-            return []
+            query_cache.bypass()
+            print("❌ get_blog error:", e)
+            return None
 
         finally:
             cursor.close()
+            self.db.release(db)
 
-    def update_blog(self, blog_id, title, main_blog):
-        db = db_client.get_db()
+    def update_blog(self, session, blog_id, title, main_blog):
+        db = self.db.get_db(session=session)
         cursor = db.cursor()
 
         try:
             cursor.execute(
                 """
                 UPDATE blog
-                SET title=%s, main_blog=%s
+                SET title=%s, main_blog=%s, preview=%s
                 WHERE id=%s AND created_by=%s
                 """,
-                (title, main_blog, blog_id, self._user_id),
+                (title, main_blog, make_preview(main_blog), blog_id, session.user_id),
             )
             db.commit()
+            # a new title or body can change which searches match the post,
+            # not just the pages that already hold it
+            query_cache.invalidate("feed", f"posts:{session.user_id}", f"blog:{blog_id}")
             return cursor.rowcount > 0
 
         except Exception as e:
@@ -314,18 +685,26 @@ class Blog:
 
         finally:
             cursor.close()
+            self.db.release(db)
 
-    def soft_delete_blog(self, blog_id):
-        db = db_client.get_db()
+    def soft_delete_blog(self, session, blog_id):
+        db = self.db.get_db(session=session)
         cursor = db.cursor()
 
         try:
             cursor.execute(
-                "UPDATE blog SET dlt=1 WHERE id=%s AND created_by=%s",
-                (blog_id, self._user_id),
+                "UPDATE blog SET dlt=1 WHERE id=%s AND created_by=%s AND dlt=0",
+                (blog_id, session.user_id),
             )
+            if cursor.rowcount == 0:
+                db.rollback()
+                return False
+
+            _bump_user_stats(cursor, session.user_id, user_posts=-1, trash_posts=1)
+            _bump_community_posts(cursor, -1, session.user_id)
             db.commit()
-            return cursor.rowcount > 0
+            query_cache.invalidate("feed", f"posts:{session.user_id}", f"blog:{blog_id}", "stats")
+            return True
 
         except Exception as e:
             db.rollback()
@@ -334,18 +713,26 @@ class Blog:
 
         finally:
             cursor.close()
+            self.db.release(db)
 
-    def restore_blog(self, blog_id):
-        db = db_client.get_db()
+    def restore_blog(self, session, blog_id):
+        db = self.db.get_db(session=session)
         cursor = db.cursor()
 
         try:
             cursor.execute(
-                "UPDATE blog SET dlt=0 WHERE id=%s AND created_by=%s",
-                (blog_id, self._user_id),
+                "UPDATE blog SET dlt=0 WHERE id=%s AND created_by=%s AND dlt=1",
+                (blog_id, session.user_id),
             )
+            if cursor.rowcount == 0:
+                db.rollback()
+                return False
+
+            _bump_user_stats(cursor, session.user_id, user_posts=1, trash_posts=-1)
+            _bump_community_posts(cursor, 1, session.user_id)
             db.commit()
-            return cursor.rowcount > 0
+            query_cache.invalidate("feed", f"posts:{session.user_id}", f"blog:{blog_id}", "stats")
+            return True
 
         except Exception as e:
             db.rollback()
@@ -354,18 +741,62 @@ class Blog:
 
         finally:
             cursor.close()
+            self.db.release(db)
 
-    def permanent_delete_blog(self, blog_id):
-        db = db_client.get_db()
+    def permanent_delete_blog(self, session, blog_id):
+        db = self.db.get_db(session=session)
         cursor = db.cursor()
 
         try:
+            cursor.execute(
+                """
+                SELECT dlt, like_count, dislike_count
+                FROM blog
+                WHERE id=%s AND created_by=%s
+                FOR UPDATE
+                """,
+                (blog_id, session.user_id),
+            )
+            row = cursor.fetchone()
+            if not row:
+                db.rollback()
+                return False
+
+            # The cascade removes the post's comments and reactions, so their
+            # authors' counters have to be taken back as well.
+            cursor.execute(
+                """
+                SELECT user_id, COUNT(*) AS cnt
+                FROM blog_comments
+                WHERE blog_id=%s
+                GROUP BY user_id
+                """,
+                (blog_id,),
+            )
+            commenters = cursor.fetchall()
+
             cursor.execute(
                 "DELETE FROM blog WHERE id=%s AND created_by=%s",
-                (blog_id, self._user_id),
+                (blog_id, session.user_id),
             )
+
+            if row["dlt"]:
+                _bump_user_stats(cursor, session.user_id, trash_posts=-1)
+            else:
+                _bump_user_stats(cursor, session.user_id, user_posts=-1)
+                _bump_community_posts(cursor, -1, session.user_id)
+            _bump_user_stats(
+                cursor,
+                session.user_id,
+                likes_received=-row["like_count"],
+                dislikes_received=-row["dislike_count"],
+            )
+            for commenter in commenters:
+                _bump_user_stats(cursor, commenter["user_id"], user_comments=-commenter["cnt"])
+
             db.commit()
-            return cursor.rowcount > 0
+            query_cache.invalidate("feed", f"posts:{session.user_id}", f"blog:{blog_id}", "stats")
+            return True
 
         except Exception as e:
             db.rollback()
@@ -374,56 +805,202 @@ class Blog:
 
         finally:
             cursor.close()
+            self.db.release(db)
 
-    def view_deleted_blogs(self):
-        db = db_client.get_db()
+    @cached(ttl=30, tags=("posts:{user}",), per_user=True, item_tag="blog:{id}")
+    def view_deleted_blogs_page(self, session, cursor=None, limit=PAGE_SIZE):
+        """One page of the user's recycle bin (see view_user_blogs_page)."""
+        if not session.user_id:
+            return _empty_page()
+
+        created_at, last_id = cursor or _FIRST_PAGE
+        db = self._read_db(session)
         cursor = db.cursor()
 
         try:
             cursor.execute(
-                "SELECT * FROM blog WHERE created_by=%s AND dlt=1 ORDER BY created_at DESC",
-                (self._user_id,),
+                """
+                SELECT id, title, preview, created_by, dlt, created_at,
+                       like_count, dislike_count, comment_count
+                FROM blog
+                WHERE created_by=%s AND dlt=1
+                  AND (created_at < %s OR (created_at = %s AND id < %s))
+                ORDER BY created_at DESC, id DESC
+                LIMIT %s
+                """,
+                (session.user_id, created_at, created_at, last_id, limit + 1),
             )
-            return cursor.fetchall()
+            return _page_result(cursor.fetchall(), limit)
 
         except Exception as e:
-            print("❌ view_deleted_blogs error:", e)
-            return []
+            query_cache.bypass()
+            print("❌ view_deleted_blogs_page error:", e)
+            return _empty_page()
 
         finally:
             cursor.close()
+            self.db.release(db)
 
     # ============================================================= #
-    #                          COMMENTS                             #
+    #                            SEARCH                             #
     # ============================================================= #
-    def add_comment(self, blog_id, text):
-        if not self._user_id:
-            return False
-
-        db = db_client.get_db()
+    @cached(ttl=30, tags=("feed", "posts:{user}"), per_user=True, item_tag="blog:{id}")
+    def search_blogs(self, session, term, scope="community", cursor=None, limit=PAGE_SIZE):
+        """Search non-deleted posts by title and body.
+
+        ``scope`` is "mine" (the user's own posts) or "community" (everyone's).
+        Results come from the ``ft_blog_search`` FULLTEXT index ordered by
+        relevance, with ``(score, id)`` as the page cursor. Terms made only of
+        words too short for the index fall back to a title match ordered like
+        the feed, with the usual ``(created_at, id)`` cursor.
+        """
+        if scope not in SEARCH_SCOPES:
+            return _empty_page()
+        if scope == "mine" and not session.user_id:
+            return _empty_page()
+
+        words = re.findall(r"\w+", (term or "").lower())
+        if not words:
+            return _empty_page()
+        indexed = [w for w in words if len(w) >= _FT_MIN_WORD]
+
+        db = self._read_db(session)
+        cursor_pos = cursor
         cursor = db.cursor()
 
         try:
+            if indexed:
+                query = _fulltext_query(indexed)
+                score, last_id = cursor_pos or _FIRST_RANK
+                if scope == "mine":
+                    cursor.execute(
+                        """
+                        SELECT b.id, b.title, b.preview, b.created_by, b.dlt, b.created_at,
+                               b.like_count, b.dislike_count, b.comment_count,
+                               MATCH(b.title, b.main_blog) AGAINST (%s IN BOOLEAN MODE) AS score
+                        FROM blog b
+                        WHERE MATCH(b.title, b.main_blog) AGAINST (%s IN BOOLEAN MODE)
+                          AND b.created_by=%s AND b.dlt=0
+                        HAVING score < %s OR (score = %s AND id < %s)
+                        ORDER BY score DESC, id DESC
+                        LIMIT %s
+                        """,
+                        (query, query, session.user_id, score, score, last_id, limit + 1),
+                    )
+                else:
+                    cursor.execute(
+                        """
+                        SELECT b.id, b.title, b.preview, b.created_by, b.dlt, b.created_at,
+                               b.like_count, b.dislike_count, b.comment_count,
+                               u.user_name, u.first_name, u.last_name,
+                               MATCH(b.title, b.main_blog) AGAINST (%s IN BOOLEAN MODE) AS score
+                        FROM blog b
+                        LEFT JOIN user_info u ON b.created_by = u.id
+                        WHERE MATCH(b.title, b.main_blog) AGAINST (%s IN BOOLEAN MODE)
+                          AND b.dlt=0
+                        HAVING score < %s OR (score = %s AND id < %s)
+                        ORDER BY score DESC, id DESC
+                        LIMIT %s
+                        """,
+                        (query, query, score, score, last_id, limit + 1),
+                    )
+                return _page_result(cursor.fetchall(), limit, key=("score", "id"))
+
+            pattern = "%" + " ".join(words) + "%"
+            created_at, last_id = cursor_pos or _FIRST_PAGE
+            if scope == "mine":
+                cursor.execute(
+                    """
+                    SELECT id, title, preview, created_by, dlt, created_at,
+                           like_count, dislike_count, comment_count
+                    FROM blog
+                    WHERE created_by=%s AND dlt=0 AND title LIKE %s
+                      AND (created_at < %s OR (created_at = %s AND id < %s))
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %s
+                    """,
+                    (session.user_id, pattern, created_at, created_at, last_id, limit + 1),
+                )
+            else:
+                cursor.execute(
+                    """
+                    SELECT b.id, b.title, b.preview, b.created_by, b.dlt, b.created_at,
+                           b.like_count, b.dislike_count, b.comment_count,
+                           u.user_name, u.first_name, u.last_name
+                    FROM blog b
+                    LEFT JOIN user_info u ON b.created_by = u.id
+                    WHERE b.dlt=0 AND b.title LIKE %s
+                      AND (b.created_at < %s OR (b.created_at = %s AND b.id < %s))
+                    ORDER BY b.created_at DESC, b.id DESC
+                    LIMIT %s
+                    """,
+                    (pattern, created_at, created_at, last_id, limit + 1),
+                )
+            return _page_result(cursor.fetchall(), limit)
+
+        except Exception as e:
+            query_cache.bypass()
+            print("❌ search_blogs error:", e)
+            return _empty_page()
+
+        finally:
+            cursor.close()
+            self.db.release(db)
+
+    # ============================================================= #
+    #                          COMMENTS                             #
+    # ============================================================= #
+    def add_comment(self, session, blog_id, text):
+        """Add a comment and bump the post's and the user's counters.
+
+        Like set_reaction(), the post row is locked before the insert, whose
+        foreign-key check would otherwise hold a shared lock that the
+        counter update then has to upgrade, deadlocking two commenters on
+        one post. Deadlocks that still happen rerun the transaction.
+        """
+        if not session.user_id:
+            return False
+
+        def write(cursor):
+            cursor.execute("SELECT id FROM blog WHERE id=%s FOR UPDATE", (blog_id,))
+            if not cursor.fetchone():
+                return False
             cursor.execute(
                 """
                 INSERT INTO blog_comments (blog_id, user_id, comment_text)
                 VALUES (%s, %s, %s)
                 """,
-                (blog_id, self._user_id, text),
+                (blog_id, session.user_id, text),
             )
-            db.commit()
+            cursor.execute(
+                "UPDATE blog SET comment_count = comment_count + 1 WHERE id=%s",
+                (blog_id,),
+            )
+            _bump_user_stats(cursor, session.user_id, user_comments=1)
             return True
 
+        try:
+            added = self.db.run_transaction(write, session=session)
+            query_cache.invalidate(f"blog:{blog_id}", "stats")
+            return added
+
         except Exception as e:
-            db.rollback()
             print("❌ add_comment error:", e)
             return False
 
-        finally:
-            cursor.close()
+    @cached(ttl=15, tags=("blog:{blog_id}",))
+    def get_comments_page(self, session, blog_id, cursor=None, limit=COMMENT_PAGE_SIZE):
+        """One page of a thread, oldest first, with a ``(created_at, id)`` cursor."""
+        return self.get_comments_after(session, blog_id, cursor, limit)
 
-    def get_comments(self, blog_id):
-        db = db_client.get_db()
+    def get_comments_after(self, session, blog_id, after=None, limit=COMMENT_PAGE_SIZE):
+        """Comments posted after the ``(created_at, id)`` of ``after``.
+
+        Uncached, so refreshing a thread only transfers the rows the caller
+        has not rendered yet. Returns a page dict like get_comments_page.
+        """
+        created_at, last_id = after or _FIRST_COMMENT
+        db = self._read_db(session)
         cursor = db.cursor()
 
         try:
@@ -433,146 +1010,176 @@ class Blog:
                 FROM blog_comments c
                 LEFT JOIN user_info u ON c.user_id = u.id
                 WHERE c.blog_id=%s
-                ORDER BY c.created_at ASC
+                  AND (c.created_at > %s OR (c.created_at = %s AND c.id > %s))
+                ORDER BY c.created_at ASC, c.id ASC
+                LIMIT %s
                 """,
-                (blog_id,),
+                (blog_id, created_at, created_at, last_id, limit + 1),
             )
-            return cursor.fetchall()
+            return _page_result(cursor.fetchall(), limit)
 
         except Exception as e:
-            print("❌ get_comments error:", e)
-            return []
+            query_cache.bypass()
+            print("❌ get_comments_after error:", e)
+            return _empty_page()
 
         finally:
             cursor.close()
+            self.db.release(db)
 
     # ============================================================= #
     #                         REACTIONS                             #
     # ============================================================= #
-    def set_reaction(self, blog_id, reaction):
-        if reaction not in ("like", "dislike"):
+    def set_reaction(self, session, blog_id, reaction):
+        """Set the user's reaction to "like" or "dislike", or clear it with None.
+
+        The write is a single upsert on ``unique_react``. The post row is
+        locked first, so concurrent reactions to one post queue on it instead
+        of deadlocking over the foreign-key check; a deadlock or lock-wait
+        timeout that still occurs reruns the transaction.
+        """
+        if reaction not in REACTIONS and reaction is not None:
+            return False
+        if not session.user_id:
             return False
 
-        db = db_client.get_db()
-        cursor = db.cursor()
-
-        try:
-            cursor.execute(
-                "DELETE FROM blog_reactions WHERE blog_id=%s AND user_id=%s",
-                (blog_id, self._user_id),
-            )
-
-            cursor.execute(
-                """
-                INSERT INTO blog_reactions (blog_id, user_id, reaction)
-                VALUES (%s, %s, %s)
-                """,
-                (blog_id, self._user_id, reaction),
-            )
+        def write(cursor):
+            cursor.execute("SELECT created_by FROM blog WHERE id=%s FOR UPDATE", (blog_id,))
+            post = cursor.fetchone()
+            if not post:
+                return False
 
-            db.commit()
+            if reaction is None:
+                cursor.execute(
+                    """
+                    SELECT reaction FROM blog_reactions
+                    WHERE blog_id=%s AND user_id=%s
+                    FOR UPDATE
+                    """,
+                    (blog_id, session.user_id),
+                )
+                row = cursor.fetchone()
+                if not row:
+                    return True
+                previous = row["reaction"]
+                cursor.execute(
+                    "DELETE FROM blog_reactions WHERE blog_id=%s AND user_id=%s",
+                    (blog_id, session.user_id),
+                )
+            else:
+                cursor.execute(
+                    """
+                    INSERT INTO blog_reactions (blog_id, user_id, reaction)
+                    VALUES (%s, %s, %s)
+                    ON DUPLICATE KEY UPDATE reaction = VALUES(reaction)
+                    """,
+                    (blog_id, session.user_id, reaction),
+                )
+                # affected rows: 1 inserted, 2 changed, 0 already set
+                if cursor.rowcount == 0:
+                    return True
+                previous = None if cursor.rowcount == 1 else _OTHER_REACTION[reaction]
+
+            _apply_reaction_change(cursor, blog_id, post["created_by"], previous, reaction)
             return True
 
+        try:
+            changed = self.db.run_transaction(write, session=session)
+            query_cache.invalidate(f"blog:{blog_id}", "stats")
+            return changed
+
         except Exception as e:
-            db.rollback()
             print("❌ set_reaction error:", e)
             return False
 
-        finally:
-            cursor.close()
-
-    def get_reaction_summary(self, blog_id):
-        db = db_client.get_db()
+    @cached(ttl=30, tags=("blog:{blog_id}",), per_user=True)
+    def get_reaction_summary(self, session, blog_id):
+        db = self._read_db(session)
         cursor = db.cursor()
 
         try:
             cursor.execute(
                 """
-                SELECT
-                    SUM(CASE WHEN reaction='like' THEN 1 ELSE 0 END) AS likes,
-                    SUM(CASE WHEN reaction='dislike' THEN 1 ELSE 0 END) AS dislikes
-                FROM blog_reactions
-                WHERE blog_id=%s
+                SELECT b.like_count, b.dislike_count, br.reaction AS user_reaction
+                FROM blog b
+                LEFT JOIN blog_reactions br
+                       ON br.blog_id = b.id AND br.user_id = %s
+                WHERE b.id=%s
                 """,
-                (blog_id,),
+                (session.user_id, blog_id),
             )
-            counts = cursor.fetchone() or {}
-            likes = int(counts.get("likes", 0) or 0)
-            dislikes = int(counts.get("dislikes", 0) or 0)
-
-            cursor.execute(
-                "SELECT reaction FROM blog_reactions WHERE blog_id=%s AND user_id=%s",
-                (blog_id, self._user_id),
-            )
-            row = cursor.fetchone()
-            user_reaction = row["reaction"] if row else None
+            row = cursor.fetchone() or {}
 
             return {
-                "likes": likes,
-                "dislikes": dislikes,
-                "user_reaction": user_reaction,
+                "likes": int(row.get("like_count") or 0),
+                "dislikes": int(row.get("dislike_count") or 0),
+                "user_reaction": row.get("user_reaction"),
             }
 
         except Exception as e:
+            query_cache.bypass()
             print("❌ get_reaction_summary error:", e)
             return {"likes": 0, "dislikes": 0, "user_reaction": None}
 
         finally:
             cursor.close()
+            self.db.release(db)
 
     # ============================================================= #
-    #                        DASHBOARD METRICS                      #
+    #                          VIEW LOADERS                         #
     # ============================================================= #
-    def get_dashboard_metrics(self):
-        db = db_client.get_db()
-        cursor = db.cursor()
-
-        try:
-            # user active posts
-            cursor.execute(
-                "SELECT COUNT(*) AS c FROM blog WHERE created_by=%s AND dlt=0",
-                (self._user_id,),
-            )
-            active = cursor.fetchone().get("c", 0)
-
-            # user trashed posts
-            cursor.execute(
-                "SELECT COUNT(*) AS c FROM blog WHERE created_by=%s AND dlt=1",
-                (self._user_id,),
-            )
-            trashed = cursor.fetchone().get("c", 0)
-
-            # community posts
-            cursor.execute("SELECT COUNT(*) AS c FROM blog WHERE dlt=0")
-            community = cursor.fetchone().get("c", 0)
-
-            return {
-                "active": active,
-                "trashed": trashed,
-                "community": community,
-            }
-
-        except Exception as e:
-            print("❌ get_dashboard_metrics error:", e)
-            return {"active": 0, "trashed": 0, "community": 0}
-
-        finally:
-            cursor.close()
+    def gather(self, *calls):
+        """Run independent calls concurrently and return their results in order.
+
+        Each call is ``(fn, *args)``, usually a BlogService method, e.g.
+        ``gather((self.get_blog, session, 7), (self.get_reaction_summary,
+        session, 7))``. Every call checks out its own connection, so the
+        batch takes as long as its slowest query rather than the sum of all
+        of them. If a call
+        raises, the others still finish and the first error is re-raised.
+        Called from inside a fan-out worker, the calls simply run in turn.
+        """
+        if getattr(_fanout_local, "active", False) or len(calls) < 2:
+            return [fn(*args) for fn, *args in calls]
+        futures = [_fanout_pool.submit(_fanout_call, fn, args) for fn, *args in calls]
+        return [future.result() for future in futures]
+
+    def load_dashboard(self, session, search=None):
+        """Counters and the first page of the user's posts (or of a search)."""
+        # same arguments as the dashboard's first fetch, so a load at startup
+        # leaves that page in the query cache
+        if search:
+            first_page = (self.search_blogs, session, search, "mine", None)
+        else:
+            first_page = (self.view_user_blogs_page, session, None)
+        stats, page = self.gather((self.get_user_statistics, session), first_page)
+        return {"stats": stats, "page": page}
+
+    def load_blog_detail(self, session, blog_id):
+        """Everything the post view shows: full post, reactions and the first
+        page of comments."""
+        blog, reactions, comments = self.gather(
+            (self.get_blog, session, blog_id),
+            (self.get_reaction_summary, session, blog_id),
+            (self.get_comments_page, session, blog_id),
+        )
+        return {"blog": blog, "reactions": reactions, "comments": comments}
 
     # ============================================================= #
     #                         ADMIN ROLE                            #
     # ============================================================= #
-    def is_admin(self):
-        profile = self.get_user_profile()
+    def is_admin(self, session):
+        profile = self.get_user_profile(session)
         if not profile:
             return False
         return (profile.get("role") or "").lower() == "admin"
 
-    def list_users(self):
-        if not self.is_admin():
+    @cached(ttl=30, tags=("users",), per_user=True)
+    def list_users(self, session):
+        if not self.is_admin(session):
             return []
 
-        db = db_client.get_db()
+        db = self._read_db(session)
         cursor = db.cursor()
 
         try:
@@ -586,19 +1193,21 @@ class Blog:
             return cursor.fetchall()
 
         except Exception as e:
+            query_cache.bypass()
             print("❌ list_users error:", e)
             return []
 
         finally:
             cursor.close()
+            self.db.release(db)
 
-    def set_user_role(self, user_id, role):
-        if not self.is_admin():
+    def set_user_role(self, session, user_id, role):
+        if not self.is_admin(session):
             return False
         if role not in ("admin", "user"):
             return False
 
-        db = db_client.get_db()
+        db = self.db.get_db(session=session)
         cursor = db.cursor()
 
         try:
@@ -606,8 +1215,18 @@ class Blog:
                 "UPDATE user_info SET role=%s WHERE id=%s",
                 (role, user_id),
             )
+            changed = cursor.rowcount > 0
+            # remembered logins carry the old role; make the user sign in again
+            cursor.execute("DELETE FROM login_tokens WHERE user_id=%s", (user_id,))
             db.commit()
-            return cursor.rowcount > 0
+            query_cache.invalidate("users")
+            if changed:
+                # sessions cache the profile, role included
+                if session.user_id == user_id:
+                    session.profile = None
+                if self.sessions is not None:
+                    self.sessions.drop_user(user_id)
+            return changed
 
         except Exception as e:
             db.rollback()
@@ -616,3 +1235,136 @@ class Blog:
 
         finally:
             cursor.close()
+            self.db.release(db)
+
+
+# ============================================================= #
+#                            SESSIONS                           #
+# ============================================================= #
+class Session:
+    """One logged-in user: who they are plus what is cached for them.
+
+    BlogService reads and fills it in; it is also the key for
+    read-your-writes routing in mydb. A session is used by one request
+    (or one desktop app) at a time.
+    """
+
+    def __init__(self):
+        self.user_id = None
+        self.user_name = None
+        self.profile = None      # get_user_profile() result
+        self.last_used = time.monotonic()
+
+    def clear(self):
+        self.user_id = None
+        self.user_name = None
+        self.profile = None
+
+
+class SessionManager:
+    """Token -> Session for servers. Sessions idle for ``ttl`` seconds expire."""
+
+    def __init__(self, ttl=8 * 3600):
+        self.ttl = ttl
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def create(self, session):
+        token = secrets.token_urlsafe(32)
+        with self._lock:
+            self._prune_locked()
+            self._sessions[token] = session
+        return token
+
+    def get(self, token):
+        with self._lock:
+            session = self._sessions.get(token)
+            if session is None:
+                return None
+            if time.monotonic() - session.last_used > self.ttl:
+                del self._sessions[token]
+                return None
+            session.last_used = time.monotonic()
+            return session
+
+    def drop(self, token):
+        with self._lock:
+            return self._sessions.pop(token, None) is not None
+
+    def drop_user(self, user_id):
+        """End every session of ``user_id``. Returns how many there were."""
+        with self._lock:
+            tokens = [t for t, s in self._sessions.items() if s.user_id == user_id]
+            for token in tokens:
+                # a request still holding it reloads the profile
+                self._sessions.pop(token).profile = None
+        return len(tokens)
+
+    def _prune_locked(self):
+        cutoff = time.monotonic() - self.ttl
+        for token in [t for t, s in self._sessions.items() if s.last_used < cutoff]:
+            del self._sessions[token]
+
+    def __len__(self):
+        return len(self._sessions)
+
+
+blog_service = BlogService()
+
+
+class Blog:
+    """Single-user front end to BlogService for the desktop app and scripts.
+
+    It owns one Session and passes it to every BlogService method, which
+    it exposes under the same name and signature minus ``session``.
+    """
+
+    def __init__(self, service=None, session=None):
+        self.service = service or blog_service
+        self.session = session or Session()
+
+    def clear_session(self):
+        self.session.clear()
+
+    @property
+    def user_id(self):
+        return self.session.user_id
+
+    @property
+    def user_name(self):
+        return self.session.user_name
+
+    @property
+    def cached_role(self):
+        """The role from the profile already fetched, or None; never queries."""
+        return (self.session.profile or {}).get("role")
+
+    def gather(self, *calls):
+        return self.service.gather(*calls)
+
+    def warm_up(self):
+        """Load bcrypt and the MySQL driver and open the first pooled
+        connection ahead of the first login. False if the database is down."""
+        _bcrypt()
+        return self.service.db.warm_up()
+
+
+def _session_method(name):
+    method = getattr(BlogService, name)
+
+    @functools.wraps(method)
+    def call(self, *args, **kwargs):
+        return getattr(self.service, name)(self.session, *args, **kwargs)
+
+    params = list(inspect.signature(method).parameters.values())
+    call.__signature__ = inspect.Signature([params[0]] + params[2:])
+    return call
+
+
+# every public BlogService method that takes a session
+SESSION_METHODS = tuple(
+    name for name, member in vars(BlogService).items()
+    if callable(member) and not name.startswith("_") and name != "gather"
+)
+for _name in SESSION_METHODS:
+    setattr(Blog, _name, _session_method(_name))
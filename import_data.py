@@ -0,0 +1,342 @@
+# import_data.py
+"""Bulk import users, posts, comments and reactions into MiniBlog.
+
+    python import_data.py users users.csv
+    python import_data.py posts posts.jsonl [--batch-size 2000]
+    python import_data.py comments comments.csv
+    python import_data.py reactions reactions.jsonl
+
+Files are CSV (with a header row) or JSON Lines and are streamed, never
+loaded whole. Each batch is inserted with executemany in its own
+transaction, together with the file's progress row in import_checkpoints,
+so rerunning a failed import resumes after the last committed batch
+(--restart starts over). Import users, then posts, then comments and
+reactions; dashboard counters and per-post counts are rebuilt at the end.
+
+Columns (``id`` is optional everywhere; ``author`` may replace a user id):
+    users      first_name, last_name, email, contact, bio, user_name,
+               password (plaintext, or an existing bcrypt hash), role
+    posts      title, main_blog, created_by | author, dlt, created_at
+    comments   blog_id, user_id | author, comment_text, created_at
+    reactions  blog_id, user_id | author, reaction
+"""
+import argparse
+import csv
+import itertools
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import bcrypt
+
+from functions import BCRYPT_ROUNDS, REACTIONS, db_client, make_preview
+from maintenance import check_counts, rebuild_stats
+
+PROGRESS_EVERY = 2.0  # seconds between progress lines
+_BCRYPT_HASH = re.compile(r"^\$2[aby]\$\d\d\$[./A-Za-z0-9]{53}$")
+
+
+# --------------------------- READING --------------------------- #
+def read_records(path):
+    """Yield one dict per CSV row or JSON line; empty CSV cells become None."""
+    if path.endswith((".jsonl", ".ndjson")):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    elif path.endswith(".csv"):
+        with open(path, encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                yield {key: (value if value != "" else None) for key, value in row.items()}
+    else:
+        raise ValueError(f"{path}: expected a .csv or .jsonl file")
+
+
+def _batches(records, size):
+    records = iter(records)
+    while True:
+        batch = list(itertools.islice(records, size))
+        if not batch:
+            return
+        yield batch
+
+
+def _required(record, number, *fields):
+    missing = [field for field in fields if record.get(field) in (None, "")]
+    if missing:
+        raise ValueError(f"record {number}: missing {', '.join(missing)}")
+
+
+# ----------------------- PASSWORD HASHING ----------------------- #
+def _hash_job(job):
+    """Runs in a worker process."""
+    password, rounds = job
+    if _BCRYPT_HASH.match(password):
+        return password.encode("ascii")  # already hashed, keep it
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds))
+
+
+def _hash_all(ctx, passwords):
+    jobs = [(password, BCRYPT_ROUNDS) for password in passwords]
+    chunk = max(1, len(jobs) // (ctx["workers"] * 4))
+    return list(ctx["hasher"].map(_hash_job, jobs, chunksize=chunk))
+
+
+# ------------------------- USER LOOKUP -------------------------- #
+class _UserIds:
+    """user_name -> id, cached across batches."""
+
+    MAX_ENTRIES = 200_000
+
+    def __init__(self):
+        self._ids = {}
+
+    def resolve(self, cursor, names):
+        wanted = {name for name in names if name not in self._ids}
+        if wanted:
+            if len(self._ids) + len(wanted) > self.MAX_ENTRIES:
+                self._ids.clear()
+            wanted = sorted(wanted)
+            placeholders = ", ".join(["%s"] * len(wanted))
+            cursor.execute(
+                f"SELECT id, user_name FROM user_info WHERE user_name IN ({placeholders})",
+                wanted,
+            )
+            for row in cursor.fetchall():
+                self._ids[row["user_name"]] = row["id"]
+        return self._ids
+
+    def user_id(self, ids, record, number, field):
+        if record.get(field) not in (None, ""):
+            return int(record[field])
+        name = record.get("author")
+        if name in (None, ""):
+            raise ValueError(f"record {number}: missing {field} or author")
+        if name not in ids:
+            raise ValueError(f"record {number}: unknown author {name!r}")
+        return ids[name]
+
+
+def _timestamp(value):
+    return value or datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+# -------------------------- IMPORTERS --------------------------- #
+# Each one inserts a batch of (number, record) pairs on the caller's cursor.
+def import_users(cursor, batch, ctx):
+    for number, record in batch:
+        _required(record, number, "first_name", "last_name", "email", "contact",
+                  "user_name", "password")
+    hashes = _hash_all(ctx, [record["password"] for _, record in batch])
+
+    cursor.executemany(
+        """
+        INSERT INTO user_info (id, first_name, last_name, email, contact, bio, user_name, role)
+        VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        """,
+        [
+            (
+                record.get("id"),
+                record["first_name"],
+                record["last_name"],
+                record["email"],
+                record["contact"],
+                record.get("bio"),
+                record["user_name"],
+                record.get("role") or "user",
+            )
+            for _, record in batch
+        ],
+    )
+    ids = ctx["users"].resolve(cursor, [record["user_name"] for _, record in batch])
+    cursor.executemany(
+        "INSERT INTO user_pass (user_id, password) VALUES (%s, %s)",
+        [(ids[record["user_name"]], hashed) for (_, record), hashed in zip(batch, hashes)],
+    )
+
+
+def import_posts(cursor, batch, ctx):
+    users = ctx["users"]
+    ids = users.resolve(cursor, [r["author"] for _, r in batch if r.get("author")])
+    rows = []
+    for number, record in batch:
+        _required(record, number, "title", "main_blog")
+        rows.append((
+            record.get("id"),
+            record["title"],
+            record["main_blog"],
+            make_preview(record["main_blog"]),
+            users.user_id(ids, record, number, "created_by"),
+            int(record.get("dlt") or 0),
+            _timestamp(record.get("created_at")),
+        ))
+    cursor.executemany(
+        """
+        INSERT INTO blog (id, title, main_blog, preview, created_by, dlt, created_at)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+        """,
+        rows,
+    )
+
+
+def import_comments(cursor, batch, ctx):
+    users = ctx["users"]
+    ids = users.resolve(cursor, [r["author"] for _, r in batch if r.get("author")])
+    rows = []
+    for number, record in batch:
+        _required(record, number, "blog_id", "comment_text")
+        rows.append((
+            record.get("id"),
+            int(record["blog_id"]),
+            users.user_id(ids, record, number, "user_id"),
+            record["comment_text"],
+            _timestamp(record.get("created_at")),
+        ))
+    cursor.executemany(
+        """
+        INSERT INTO blog_comments (id, blog_id, user_id, comment_text, created_at)
+        VALUES (%s, %s, %s, %s, %s)
+        """,
+        rows,
+    )
+
+
+def import_reactions(cursor, batch, ctx):
+    users = ctx["users"]
+    ids = users.resolve(cursor, [r["author"] for _, r in batch if r.get("author")])
+    rows = []
+    for number, record in batch:
+        _required(record, number, "blog_id", "reaction")
+        if record["reaction"] not in REACTIONS:
+            raise ValueError(f"record {number}: reaction must be one of {REACTIONS}")
+        rows.append((
+            int(record["blog_id"]),
+            users.user_id(ids, record, number, "user_id"),
+            record["reaction"],
+        ))
+    cursor.executemany(
+        """
+        INSERT INTO blog_reactions (blog_id, user_id, reaction)
+        VALUES (%s, %s, %s)
+        ON DUPLICATE KEY UPDATE reaction = VALUES(reaction)
+        """,
+        rows,
+    )
+
+
+IMPORTERS = {
+    "users": import_users,
+    "posts": import_posts,
+    "comments": import_comments,
+    "reactions": import_reactions,
+}
+
+
+# ------------------------- CHECKPOINTS -------------------------- #
+def _load_checkpoint(cursor, source):
+    cursor.execute("SELECT rows_done FROM import_checkpoints WHERE source=%s", (source,))
+    row = cursor.fetchone()
+    return row["rows_done"] if row else 0
+
+
+def _save_checkpoint(cursor, source, rows_done):
+    cursor.execute(
+        """
+        INSERT INTO import_checkpoints (source, rows_done) VALUES (%s, %s)
+        ON DUPLICATE KEY UPDATE rows_done = VALUES(rows_done)
+        """,
+        (source, rows_done),
+    )
+
+
+# ---------------------------- RUN ------------------------------- #
+def import_file(kind, path, batch_size=1000, workers=None, restart=False):
+    """Import one file. Returns the number of records inserted by this run."""
+    importer = IMPORTERS[kind]
+    source = f"{kind}:{os.path.abspath(path)}"
+    ctx = {"users": _UserIds(), "hasher": None, "workers": workers or os.cpu_count() or 1}
+    if kind == "users":
+        ctx["hasher"] = ProcessPoolExecutor(max_workers=ctx["workers"])
+
+    db = db_client.get_db()
+    cursor = db.cursor()
+
+    try:
+        if restart:
+            cursor.execute("DELETE FROM import_checkpoints WHERE source=%s", (source,))
+        done = _load_checkpoint(cursor, source)
+        db.commit()
+        if done:
+            print(f"{kind}: resuming {path} after {done} record(s)")
+
+        records = itertools.islice(read_records(path), done, None)
+        numbered = zip(itertools.count(done + 1), records)
+        start = last_report = time.perf_counter()
+        imported = 0
+
+        for batch in _batches(numbered, batch_size):
+            importer(cursor, batch, ctx)
+            done += len(batch)
+            _save_checkpoint(cursor, source, done)
+            db.commit()
+
+            imported += len(batch)
+            now = time.perf_counter()
+            if now - last_report >= PROGRESS_EVERY:
+                last_report = now
+                print(f"{kind}: {done} record(s), {imported / (now - start):.0f} rows/s")
+
+        elapsed = max(time.perf_counter() - start, 1e-9)
+        print(
+            f"{kind}: imported {imported} record(s) in {elapsed:.1f}s "
+            f"({imported / elapsed:.0f} rows/s)"
+        )
+        return imported
+
+    except Exception as e:
+        db.rollback()
+        print(f"❌ import_data error ({kind}, {path}):", e)
+        raise
+
+    finally:
+        cursor.close()
+        db_client.release(db)
+        if ctx["hasher"] is not None:
+            ctx["hasher"].shutdown()
+
+
+def rebuild_derived(kind):
+    """Bring the counters the write paths normally maintain up to date."""
+    print("rebuilding dashboard counters…")
+    rebuild_stats(verbose=False)
+    if kind in ("comments", "reactions"):
+        print("rebuilding per-post engagement counts…")
+        check_counts(fix=True, verbose=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("kind", choices=sorted(IMPORTERS), help="what the file contains")
+    parser.add_argument("path", help=".csv or .jsonl file")
+    parser.add_argument("--batch-size", type=int, default=1000, help="records per transaction")
+    parser.add_argument("--workers", type=int, default=None, help="password hashing processes")
+    parser.add_argument("--restart", action="store_true", help="ignore the saved checkpoint")
+    parser.add_argument("--no-rebuild", action="store_true", help="skip the counter rebuild")
+    args = parser.parse_args(argv)
+
+    import_file(
+        args.kind,
+        args.path,
+        batch_size=args.batch_size,
+        workers=args.workers,
+        restart=args.restart,
+    )
+    if not args.no_rebuild:
+        rebuild_derived(args.kind)
+
+
+if __name__ == "__main__":
+    main()
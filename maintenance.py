@@ -0,0 +1,290 @@
+# maintenance.py
+"""Repair jobs for the denormalized data kept by functions.Blog.
+
+    python maintenance.py rebuild-stats [--dry-run]
+    python maintenance.py check-counts [--fix]
+    python maintenance.py rebuild-previews [--dry-run]
+
+Run them while the app is quiet: counters written by concurrent requests
+during a rebuild can be overwritten.
+"""
+import argparse
+
+from functions import USER_STAT_COLUMNS, db_client, make_preview
+
+
+# ----------------------- USER / SITE STATS ----------------------- #
+_ACTUAL_USER_STATS = """
+    SELECT u.id AS user_id,
+           COALESCE(p.user_posts, 0) AS user_posts,
+           COALESCE(p.trash_posts, 0) AS trash_posts,
+           COALESCE(c.user_comments, 0) AS user_comments,
+           COALESCE(r.likes_received, 0) AS likes_received,
+           COALESCE(r.dislikes_received, 0) AS dislikes_received
+    FROM user_info u
+    LEFT JOIN (
+        SELECT created_by,
+               SUM(CASE WHEN dlt=0 THEN 1 ELSE 0 END) AS user_posts,
+               SUM(CASE WHEN dlt=1 THEN 1 ELSE 0 END) AS trash_posts
+        FROM blog
+        GROUP BY created_by
+    ) p ON p.created_by = u.id
+    LEFT JOIN (
+        SELECT user_id, COUNT(*) AS user_comments
+        FROM blog_comments
+        GROUP BY user_id
+    ) c ON c.user_id = u.id
+    LEFT JOIN (
+        SELECT b.created_by,
+               SUM(CASE WHEN br.reaction='like' THEN 1 ELSE 0 END) AS likes_received,
+               SUM(CASE WHEN br.reaction='dislike' THEN 1 ELSE 0 END) AS dislikes_received
+        FROM blog_reactions br
+        JOIN blog b ON br.blog_id = b.id
+        GROUP BY b.created_by
+    ) r ON r.created_by = u.id
+"""
+
+
+def rebuild_stats(dry_run=False, verbose=True):
+    """Recompute user_stats and site_stats from the source tables.
+
+    Returns the number of users whose counters were out of step (plus one
+    if the community post total was wrong). ``verbose`` prints each one.
+    """
+    drifted_users = f"""
+        FROM ({_ACTUAL_USER_STATS}) actual
+        LEFT JOIN user_stats us ON us.user_id = actual.user_id
+        WHERE {" OR ".join(f"NOT (us.{col} <=> actual.{col})" for col in USER_STAT_COLUMNS)}
+    """
+    db = db_client.get_db()
+    cursor = db.cursor()
+
+    try:
+        # only the report needs the rows; the count stays in MySQL
+        if verbose:
+            cursor.execute(
+                f"""
+                SELECT actual.*, {", ".join(f"us.{col} AS stored_{col}" for col in USER_STAT_COLUMNS)}
+                {drifted_users}
+                """
+            )
+            drifted = cursor.fetchall()
+            drifted_count = len(drifted)
+        else:
+            cursor.execute(f"SELECT COUNT(*) AS drifted {drifted_users}")
+            drifted, drifted_count = (), int(cursor.fetchone()["drifted"])
+
+        cursor.execute(
+            """
+            SELECT
+                (SELECT COUNT(*) FROM blog WHERE dlt=0) AS actual,
+                (SELECT COALESCE(SUM(community_posts), 0) FROM site_stats) AS stored
+            """
+        )
+        site = cursor.fetchone()
+        site_drifted = int(site["actual"]) != int(site["stored"])
+
+        for row in drifted:
+            print(
+                f"user {row['user_id']}: "
+                + ", ".join(
+                    f"{col} {row[f'stored_{col}']} -> {row[col]}"
+                    for col in USER_STAT_COLUMNS
+                    if row[f"stored_{col}"] != row[col]
+                )
+            )
+        if site_drifted and verbose:
+            print(f"community_posts: {site['stored']} -> {site['actual']}")
+
+        if dry_run:
+            return drifted_count + site_drifted
+
+        if drifted_count:
+            # rewrite only the rows that differ
+            columns = ", ".join(USER_STAT_COLUMNS)
+            updates = ", ".join(f"{col} = VALUES({col})" for col in USER_STAT_COLUMNS)
+            cursor.execute(
+                f"""
+                INSERT INTO user_stats (user_id, {columns})
+                SELECT * FROM (
+                    SELECT actual.user_id, {", ".join(f"actual.{col}" for col in USER_STAT_COLUMNS)}
+                    {drifted_users}
+                ) drifted
+                ON DUPLICATE KEY UPDATE {updates}
+                """
+            )
+        cursor.execute("DELETE FROM site_stats")
+        cursor.execute(
+            """
+            INSERT INTO site_stats (slot, community_posts)
+            SELECT 0, COUNT(*) FROM blog WHERE dlt=0
+            """
+        )
+        db.commit()
+        return drifted_count + site_drifted
+
+    except Exception as e:
+        db.rollback()
+        print("❌ rebuild_stats error:", e)
+        raise
+
+    finally:
+        cursor.close()
+        db_client.release(db)
+
+
+# --------------------- BLOG ENGAGEMENT COUNTS --------------------- #
+_ACTUAL_BLOG_COUNTS = """
+    SELECT b.id,
+           b.like_count, b.dislike_count, b.comment_count,
+           COALESCE(r.likes, 0) AS actual_like_count,
+           COALESCE(r.dislikes, 0) AS actual_dislike_count,
+           COALESCE(c.comments, 0) AS actual_comment_count
+    FROM blog b
+    LEFT JOIN (
+        SELECT blog_id,
+               SUM(CASE WHEN reaction='like' THEN 1 ELSE 0 END) AS likes,
+               SUM(CASE WHEN reaction='dislike' THEN 1 ELSE 0 END) AS dislikes
+        FROM blog_reactions
+        GROUP BY blog_id
+    ) r ON r.blog_id = b.id
+    LEFT JOIN (
+        SELECT blog_id, COUNT(*) AS comments
+        FROM blog_comments
+        GROUP BY blog_id
+    ) c ON c.blog_id = b.id
+"""
+
+BLOG_COUNT_COLUMNS = ("like_count", "dislike_count", "comment_count")
+
+
+def check_counts(fix=False, verbose=True):
+    """Compare blog.like_count/dislike_count/comment_count with the
+    reaction and comment tables; with ``fix`` rewrite the ones that differ.
+
+    Returns the number of posts whose counts were wrong.
+    """
+    db = db_client.get_db()
+    cursor = db.cursor()
+
+    try:
+        cursor.execute(
+            f"""
+            SELECT * FROM ({_ACTUAL_BLOG_COUNTS}) counts
+            WHERE like_count <> actual_like_count
+               OR dislike_count <> actual_dislike_count
+               OR comment_count <> actual_comment_count
+            """
+        )
+        wrong = cursor.fetchall()
+        for row in wrong if verbose else ():
+            print(
+                f"blog {row['id']}: "
+                + ", ".join(
+                    f"{col} {row[col]} -> {row['actual_' + col]}"
+                    for col in BLOG_COUNT_COLUMNS
+                    if row[col] != row["actual_" + col]
+                )
+            )
+
+        if fix and wrong:
+            cursor.executemany(
+                """
+                UPDATE blog
+                SET like_count=%s, dislike_count=%s, comment_count=%s
+                WHERE id=%s
+                """,
+                [
+                    (
+                        row["actual_like_count"],
+                        row["actual_dislike_count"],
+                        row["actual_comment_count"],
+                        row["id"],
+                    )
+                    for row in wrong
+                ],
+            )
+            db.commit()
+        return len(wrong)
+
+    except Exception as e:
+        db.rollback()
+        print("❌ check_counts error:", e)
+        raise
+
+    finally:
+        cursor.close()
+        db_client.release(db)
+
+
+# ------------------------- BLOG PREVIEWS ------------------------- #
+def rebuild_previews(dry_run=False, batch_size=500):
+    """Recompute blog.preview from main_blog. Returns the number of stale rows."""
+    db = db_client.get_db()
+    cursor = db.cursor()
+    stale = 0
+    last_id = 0
+
+    try:
+        while True:
+            cursor.execute(
+                "SELECT id, main_blog, preview FROM blog WHERE id > %s ORDER BY id LIMIT %s",
+                (last_id, batch_size),
+            )
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            last_id = rows[-1]["id"]
+            changed = []
+            for row in rows:
+                preview = make_preview(row["main_blog"])
+                if row["preview"] != preview:
+                    changed.append((preview, row["id"]))
+            stale += len(changed)
+            if changed and not dry_run:
+                cursor.executemany("UPDATE blog SET preview=%s WHERE id=%s", changed)
+                db.commit()
+        return stale
+
+    except Exception as e:
+        db.rollback()
+        print("❌ rebuild_previews error:", e)
+        raise
+
+    finally:
+        cursor.close()
+        db_client.release(db)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    stats = commands.add_parser("rebuild-stats", help="recompute dashboard counters")
+    stats.add_argument("--dry-run", action="store_true", help="only report drift")
+
+    counts = commands.add_parser("check-counts", help="verify per-post engagement counts")
+    counts.add_argument("--fix", action="store_true", help="rewrite wrong counts")
+
+    previews = commands.add_parser("rebuild-previews", help="recompute list-view excerpts")
+    previews.add_argument("--dry-run", action="store_true", help="only count stale previews")
+
+    args = parser.parse_args(argv)
+    if args.command == "rebuild-stats":
+        drifted = rebuild_stats(dry_run=args.dry_run)
+        verb = "found" if args.dry_run else "repaired"
+        print(f"rebuild-stats: {verb} {drifted} drifted counter row(s)")
+    elif args.command == "check-counts":
+        wrong = check_counts(fix=args.fix)
+        verb = "fixed" if args.fix else "found"
+        print(f"check-counts: {verb} {wrong} post(s) with wrong counts")
+        if wrong and not args.fix:
+            raise SystemExit(1)
+    elif args.command == "rebuild-previews":
+        stale = rebuild_previews(dry_run=args.dry_run)
+        verb = "found" if args.dry_run else "rewrote"
+        print(f"rebuild-previews: {verb} {stale} stale preview(s)")
+
+
+if __name__ == "__main__":
+    main()
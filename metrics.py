@@ -0,0 +1,428 @@
+# metrics.py
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+
+# Upper bounds (ms) of the latency histogram buckets; the last one is open.
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, float("inf"))
+
+# Files whose frames are skipped when looking for the method that ran a query.
+_INTERNAL_FILES = {
+    os.path.normcase(os.path.abspath(os.path.join(os.path.dirname(__file__), name)))
+    for name in ("db.py", "metrics.py", "cache.py")
+}
+
+
+def owner_method(frame, owners=("BlogService",), fallback=True):
+    """Walk out from ``frame`` to the first method of one of ``owners``.
+
+    Nested helpers (e.g. a transaction body) are skipped until the method
+    that defines them. Without a match, the first frame outside this
+    package's plumbing is used, or None when ``fallback`` is False.
+    """
+    first = None
+    while frame is not None:
+        code = frame.f_code
+        if os.path.normcase(code.co_filename) not in _INTERNAL_FILES:
+            owner = frame.f_locals.get("self")
+            if type(owner).__name__ in owners and hasattr(type(owner), code.co_name):
+                return code.co_name
+            if first is None:
+                first = code.co_name
+        frame = frame.f_back
+    return first if fallback else None
+
+
+class QueryStats:
+    """Per-method SQL timing, row and error counters plus a slow-query log.
+
+    ``record()`` is called by db.instrumented_cursor() for every statement. The
+    statement is charged to the Blog method (or other top-level function)
+    that ran it, found by walking the stack. Statements slower than
+    ``slow_ms`` are appended to ``slow_log_path``.
+    """
+
+    def __init__(self, slow_ms=200, slow_log_path="slow_queries.log", owners=("BlogService",)):
+        self.slow_ms = slow_ms
+        self.slow_log_path = slow_log_path
+        self.owners = set(owners)
+        self._lock = threading.Lock()
+        self._log_lock = threading.Lock()
+        self._methods = {}
+        self.started_at = time.time()
+
+    # ------------------------- RECORDING ------------------------- #
+    def caller(self):
+        """Name of the method that issued the current query."""
+        return owner_method(sys._getframe(1), self.owners) or "?"
+
+    def record(self, sql, seconds, rows=0, error=False, method=None):
+        method = method or self.caller()
+        ms = seconds * 1000
+        bucket = next(i for i, bound in enumerate(BUCKETS_MS) if ms <= bound)
+        with self._lock:
+            entry = self._methods.get(method)
+            if entry is None:
+                entry = self._methods[method] = {
+                    "calls": 0,
+                    "errors": 0,
+                    "rows": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "slow": 0,
+                    "histogram": [0] * len(BUCKETS_MS),
+                }
+            entry["calls"] += 1
+            entry["errors"] += error
+            entry["rows"] += max(rows or 0, 0)
+            entry["total_ms"] += ms
+            entry["max_ms"] = max(entry["max_ms"], ms)
+            entry["histogram"][bucket] += 1
+            slow = self.slow_ms is not None and ms >= self.slow_ms
+            entry["slow"] += slow
+        if slow:
+            self._log_slow(method, ms, rows, error, sql)
+
+    def _log_slow(self, method, ms, rows, error, sql):
+        # only the statement text: arguments can hold password hashes
+        line = (
+            f"{datetime.now().isoformat(timespec='milliseconds')} "
+            f"{ms:.1f}ms method={method} rows={rows}"
+            f"{' error' if error else ''} sql={' '.join(str(sql).split())}\n"
+        )
+        try:
+            with self._log_lock, open(self.slow_log_path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as e:
+            print("❌ slow query log error:", e)
+
+    # -------------------------- READING -------------------------- #
+    @staticmethod
+    def _percentile(histogram, fraction):
+        """Upper bound (ms) of the bucket holding the given fraction of calls."""
+        total = sum(histogram)
+        if not total:
+            return 0.0
+        seen = 0
+        for count, bound in zip(histogram, BUCKETS_MS):
+            seen += count
+            if seen >= fraction * total:
+                return bound
+        return BUCKETS_MS[-1]
+
+    def snapshot(self):
+        """Per-method numbers, busiest (by total time) first."""
+        with self._lock:
+            methods = {name: dict(entry, histogram=list(entry["histogram"]))
+                       for name, entry in self._methods.items()}
+        rows = []
+        for name, entry in methods.items():
+            entry["method"] = name
+            entry["avg_ms"] = entry["total_ms"] / entry["calls"]
+            entry["p50_ms"] = self._percentile(entry["histogram"], 0.50)
+            entry["p95_ms"] = self._percentile(entry["histogram"], 0.95)
+            entry["p99_ms"] = self._percentile(entry["histogram"], 0.99)
+            rows.append(entry)
+        rows.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return rows
+
+    def reset(self):
+        with self._lock:
+            self._methods.clear()
+            self.started_at = time.time()
+
+
+# --------------------------- UI TIMING --------------------------- #
+def count_widgets(root):
+    """Widgets in the subtree under ``root``, by class name."""
+    counts = Counter()
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        counts[type(widget).__name__] += 1
+        stack.extend(widget.winfo_children())
+    return counts
+
+
+class RenderStats:
+    """Wall time spent building views on the Tk thread, with widget counts.
+
+    Decorate the App methods that build a screen with ``timed(view)``. Each
+    call is charged to ``view``; the widget tree under the view's root is
+    counted afterwards (outside the timing) so a slow build can be told
+    apart from a large one. Builds slower than ``slow_ms`` go to the UI log.
+    """
+
+    def __init__(self, slow_ms=100, log=None):
+        self.slow_ms = slow_ms
+        self.log = log
+        self._lock = threading.Lock()
+        self._views = {}
+
+    def timed(self, view, root=None):
+        """``root(app, *args, **kwargs)`` returns the widget to count;
+        the default is ``app.content``."""
+        def decorate(fn):
+            @functools.wraps(fn)
+            def wrapper(app, *args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return fn(app, *args, **kwargs)
+                finally:
+                    ms = (time.perf_counter() - start) * 1000
+                    widget = root(app, *args, **kwargs) if root else app.content
+                    self.record(view, ms, widget)
+            return wrapper
+        return decorate
+
+    def record(self, view, ms, widget=None):
+        counts = Counter()
+        if widget is not None and widget.winfo_exists():
+            counts = count_widgets(widget)
+        with self._lock:
+            entry = self._views.setdefault(
+                view, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+            )
+            entry["calls"] += 1
+            entry["total_ms"] += ms
+            entry["max_ms"] = max(entry["max_ms"], ms)
+            entry["last_ms"] = ms
+            entry["widgets"] = sum(counts.values())
+            entry["breakdown"] = counts
+        if self.log is not None and self.slow_ms is not None and ms >= self.slow_ms:
+            self.log.info(
+                "slow render view=%s %.1fms widgets=%d %s",
+                view, ms, sum(counts.values()), _top(counts),
+            )
+
+    def snapshot(self):
+        """Per-view numbers, slowest (by total time) first."""
+        with self._lock:
+            views = [dict(entry, view=name) for name, entry in self._views.items()]
+        for entry in views:
+            entry["avg_ms"] = entry["total_ms"] / entry["calls"]
+        views.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        return views
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+def _top(counts, n=6):
+    return ", ".join(f"{name}={count}" for name, count in counts.most_common(n))
+
+
+# ------------------------ STALL WATCHDOG ------------------------ #
+_TK_MODULES = ("tkinter", "customtkinter")
+
+
+def tk_callback(frame):
+    """Name of the application callback Tk is running in ``frame``'s stack.
+
+    Tk enters Python through tkinter's CallWrapper (``__call__``) or
+    ``after`` (``callit``); the first frame past the innermost such entry
+    that is not tkinter/customtkinter code is the callback.
+    """
+    stack = []
+    while frame is not None:
+        stack.append(frame)
+        frame = frame.f_back
+    callback = None
+    for frame in reversed(stack):  # outermost first
+        module = frame.f_globals.get("__name__", "")
+        if module.split(".")[0] in _TK_MODULES:
+            if frame.f_code.co_name in ("__call__", "callit"):
+                callback = None
+            continue
+        if callback is None:
+            callback = frame
+    if callback is None:
+        return "?"
+    code = callback.f_code
+    return f"{getattr(code, 'co_qualname', code.co_name)} ({os.path.basename(code.co_filename)}:{callback.f_lineno})"
+
+
+class StallWatchdog:
+    """Report Tk event-loop stalls longer than ``threshold_ms``.
+
+    The Tk thread bumps a heartbeat every ``beat_ms`` via ``after()``. A
+    daemon thread watches it; once the heartbeat is older than the
+    threshold it samples the Tk thread's stack to find the callback and
+    the Blog method that are running. The stall is recorded, with its full
+    length, when the loop comes back.
+    """
+
+    def __init__(self, threshold_ms=250, beat_ms=50, keep=50, log=None):
+        self.threshold_ms = threshold_ms
+        self.beat_ms = beat_ms
+        self.log = log
+        self.stalls = deque(maxlen=keep)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._root = None
+        self._thread_id = None
+        self._last_beat = 0.0
+        self._suspect = None
+
+    def start(self, root):
+        if self.threshold_ms is None or self._root is not None:
+            return
+        self._root = root
+        self._thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._root.after(self.beat_ms, self._beat)
+        threading.Thread(target=self._watch, name="stall-watchdog", daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _beat(self):
+        now = time.perf_counter()
+        with self._lock:
+            gap_ms = (now - self._last_beat) * 1000
+            suspect, self._suspect = self._suspect, None
+            self._last_beat = now
+        if suspect is not None and gap_ms >= self.threshold_ms:
+            self._record(suspect, gap_ms)
+        if not self._stop.is_set():
+            self._root.after(self.beat_ms, self._beat)
+
+    def _watch(self):
+        while not self._stop.wait(self.beat_ms / 1000):
+            with self._lock:
+                beat = self._last_beat
+                if self._suspect is not None:
+                    continue
+            if (time.perf_counter() - beat) * 1000 < self.threshold_ms:
+                continue
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            suspect = {
+                "at": datetime.now(),
+                "callback": tk_callback(frame),
+                "blog_method": owner_method(frame, fallback=False),
+                "stack": traceback.format_stack(frame, limit=8),
+            }
+            del frame
+            with self._lock:
+                if self._last_beat == beat:  # still the same stall
+                    self._suspect = suspect
+
+    def _record(self, suspect, gap_ms):
+        suspect["ms"] = gap_ms
+        self.stalls.append(suspect)
+        if self.log is not None:
+            self.log.warning(
+                "stall %.0fms callback=%s blog_method=%s\n%s",
+                gap_ms, suspect["callback"], suspect["blog_method"] or "-",
+                "".join(suspect["stack"]).rstrip(),
+            )
+
+
+class StartupTimer:
+    """Milestones of one app start, in ms since ``begin(started)``.
+
+    blog_gui.py takes ``started`` before its first heavy import and marks
+    ``first_paint`` once the shell is on screen and ``interactive`` once the
+    first view can be used with its data loaded. Each milestone is kept
+    (and logged) the first time only.
+    """
+
+    def __init__(self, log=None):
+        self.log = log
+        self.started = None
+        self.marks = {}
+        self._lock = threading.Lock()
+
+    def begin(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+
+    def mark(self, name):
+        if self.started is None:
+            return None
+        ms = (time.perf_counter() - self.started) * 1000
+        with self._lock:
+            if name in self.marks:
+                return self.marks[name]
+            self.marks[name] = ms
+        if self.log is not None:
+            self.log.info("startup %s %.0fms", name, ms)
+        return ms
+
+    def summary(self):
+        if not self.marks:
+            return "Startup: not measured"
+        parts = [f"{name}={ms:.0f}ms" for name, ms in sorted(self.marks.items(), key=lambda m: m[1])]
+        return "Startup: " + " ".join(parts)
+
+
+# --------------------------- SETUP ---------------------------- #
+def _env_ms(name, default):
+    value = os.environ.get(name, default)
+    return None if value.lower() in ("", "off", "none") else float(value)
+
+
+def _rotating_log(name, path):
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        handler = RotatingFileHandler(
+            path, maxBytes=1_000_000, backupCount=3, encoding="utf-8", delay=True
+        )
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+query_stats = QueryStats(
+    slow_ms=_env_ms("MINIBLOG_SLOW_QUERY_MS", "200"),
+    slow_log_path=os.environ.get("MINIBLOG_SLOW_QUERY_LOG", "slow_queries.log"),
+)
+
+ui_log = _rotating_log("miniblog.ui", os.environ.get("MINIBLOG_UI_LOG", "ui_perf.log"))
+render_stats = RenderStats(slow_ms=_env_ms("MINIBLOG_SLOW_RENDER_MS", "100"), log=ui_log)
+stall_watchdog = StallWatchdog(threshold_ms=_env_ms("MINIBLOG_STALL_MS", "250"), log=ui_log)
+startup = StartupTimer(log=ui_log)
+
+
+def ui_report():
+    """Text summary of view builds, recent stalls and the busiest queries;
+    also written to the UI log."""
+    lines = [
+        f"UI report {datetime.now().isoformat(timespec='seconds')}",
+        startup.summary(),
+        "",
+        "View builds (ms):",
+    ]
+    for entry in render_stats.snapshot():
+        lines.append(
+            f"  {entry['view']:<20} calls={entry['calls']:<5} avg={entry['avg_ms']:7.1f} "
+            f"max={entry['max_ms']:7.1f} last={entry['last_ms']:7.1f} "
+            f"widgets={entry['widgets']} ({_top(entry['breakdown'], 4)})"
+        )
+    stalls = list(stall_watchdog.stalls)
+    lines += ["", f"Event-loop stalls over {stall_watchdog.threshold_ms or 'off'} ms: {len(stalls)}"]
+    for stall in stalls[-10:]:
+        lines.append(
+            f"  {stall['at']:%H:%M:%S} {stall['ms']:6.0f}ms {stall['callback']}"
+            f" -> {stall['blog_method'] or '-'}"
+        )
+    lines += ["", "Busiest query methods (ms):"]
+    for entry in query_stats.snapshot()[:8]:
+        lines.append(
+            f"  {entry['method']:<28} calls={entry['calls']:<5} total={entry['total_ms']:9.1f} "
+            f"avg={entry['avg_ms']:7.1f}"
+        )
+    report = "\n".join(lines)
+    ui_log.info("%s", report)
+    return report
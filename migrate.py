@@ -0,0 +1,284 @@
+# migrate.py
+"""Versioned schema migrations for the MiniBlog database.
+
+    python migrate.py up        apply every pending file in migrations/
+    python migrate.py status    list applied and pending migrations
+    python migrate.py explain   EXPLAIN the queries in functions.py and fail
+                                on full table scans
+
+Migration files are named ``NNNN_description.sql`` and run in version order.
+Each applied version is recorded in ``schema_migrations``. MySQL commits DDL
+implicitly, so a file that fails half way has to be finished by hand.
+
+Databases created from an older schema.sql already have some of these
+changes. A file can carry ``-- applied-if: <query>`` lines; when every such
+query returns a true first column (checked against ``information_schema``),
+the version is recorded without running the file.
+"""
+import argparse
+import ast
+import os
+import re
+
+from functions import db_client
+
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "migrations")
+_FILE_NAME = re.compile(r"^(\d+)_(\w+)\.sql$")
+_APPLIED_IF = re.compile(r"^\s*--\s*applied-if:\s*(.+?)\s*;?\s*$", re.MULTILINE)
+
+
+# ------------------------- MIGRATIONS -------------------------- #
+def discover(directory=MIGRATIONS_DIR):
+    """Return ``[(version, name, path)]`` sorted by version."""
+    found = []
+    for file_name in os.listdir(directory):
+        match = _FILE_NAME.match(file_name)
+        if match:
+            found.append((int(match.group(1)), match.group(2), os.path.join(directory, file_name)))
+    found.sort()
+    versions = [version for version, _, _ in found]
+    if len(versions) != len(set(versions)):
+        raise ValueError("duplicate migration version in " + directory)
+    return found
+
+
+def split_statements(sql):
+    """Split a migration file into statements ending with ``;`` at end of line."""
+    statements, current = [], []
+    for line in sql.splitlines():
+        if line.strip().startswith("--"):
+            continue
+        current.append(line)
+        if line.rstrip().endswith(";"):
+            statement = "\n".join(current).strip().rstrip(";").strip()
+            if statement:
+                statements.append(statement)
+            current = []
+    rest = "\n".join(current).strip()
+    if rest:
+        statements.append(rest)
+    return statements
+
+
+def applied_if_checks(sql):
+    """The ``-- applied-if:`` queries of a migration file."""
+    return _APPLIED_IF.findall(sql)
+
+
+def already_present(cursor, checks):
+    """True when the file has checks and all of them pass."""
+    if not checks:
+        return False
+    for query in checks:
+        cursor.execute(query)
+        row = cursor.fetchone()
+        if not row or not list(row.values())[0]:
+            return False
+    return True
+
+
+def _ensure_table(cursor):
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INT PRIMARY KEY,
+            name VARCHAR(255) NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+
+def applied_versions(cursor):
+    _ensure_table(cursor)
+    cursor.execute("SELECT version FROM schema_migrations")
+    return {row["version"] for row in cursor.fetchall()}
+
+
+def migrate_up():
+    """Apply pending migrations in order. Returns the versions applied."""
+    db = db_client.get_db()
+    cursor = db.cursor()
+    done = []
+
+    try:
+        applied = applied_versions(cursor)
+        for version, name, path in discover():
+            if version in applied:
+                continue
+            with open(path, encoding="utf-8") as f:
+                sql = f.read()
+            if already_present(cursor, applied_if_checks(sql)):
+                print(f"recording {version:04d}_{name} (already in the schema)")
+            else:
+                statements = split_statements(sql)
+                print(f"applying {version:04d}_{name} ({len(statements)} statement(s))")
+                for statement in statements:
+                    cursor.execute(statement)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                (version, name),
+            )
+            db.commit()
+            done.append(version)
+        return done
+
+    except Exception as e:
+        db.rollback()
+        print("❌ migrate error:", e)
+        raise
+
+    finally:
+        cursor.close()
+        db_client.release(db)
+
+
+def status():
+    db = db_client.get_db()
+    cursor = db.cursor()
+
+    try:
+        applied = applied_versions(cursor)
+        db.commit()
+        pending = 0
+        for version, name, _ in discover():
+            state = "applied" if version in applied else "pending"
+            pending += version not in applied
+            print(f"{version:04d}_{name}: {state}")
+        return pending
+
+    finally:
+        cursor.close()
+        db_client.release(db)
+
+
+# ------------------------ EXPLAIN CHECK ------------------------ #
+# Scans these tables are fine: they never grow past a handful of rows.
+SMALL_TABLES = {"site_stats", "schema_migrations"}
+# Methods that read a whole table on purpose (admin listings).
+FULL_SCAN_ALLOWED = {"list_users"}
+
+
+def collect_queries(path=None):
+    """Find literal SQL passed to ``cursor.execute`` in functions.py.
+
+    Returns ``[(method, sql)]``. Plain ``INSERT ... VALUES`` statements are
+    skipped because they have no plan to check.
+    """
+    path = path or os.path.join(os.path.dirname(os.path.abspath(__file__)), "functions.py")
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+
+    queries = []
+
+    def visit(node, method):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and method is None:
+            method = node.name  # nested helpers report their Blog method
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and node.func.attr == "execute"
+            and node.args
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            sql = " ".join(node.args[0].value.split())
+            if re.match(r"(?i)(SELECT|UPDATE|DELETE|INSERT\s.*\sSELECT)\b", sql):
+                queries.append((method, sql))
+        for child in ast.iter_child_nodes(node):
+            visit(child, method)
+
+    visit(tree, None)
+    return queries
+
+
+def _sample_params(sql):
+    """Plausible values for each ``%s`` so the query can be EXPLAINed."""
+    params = []
+    for match in re.finditer(r"%s", sql):
+        before = sql[:match.start()].rstrip().upper()
+        if re.search(r"CREATED_AT\s*(<|>|<=|>=|=)$", before):
+            params.append("9999-12-31 23:59:59")
+        elif before.endswith("AGAINST (") or before.endswith("AGAINST("):
+            params.append("+search*")
+        elif before.endswith("LIKE"):
+            params.append("%a%")
+        else:
+            params.append(1)
+    return params
+
+
+def _scans(plan, min_rows):
+    """Rows of an EXPLAIN result that read a whole table."""
+    bad = []
+    for row in plan:
+        table = row.get("table") or ""
+        if table.startswith("<") or table in SMALL_TABLES:
+            continue
+        if row.get("type") not in ("ALL", "index"):
+            continue
+        if (row.get("rows") or 0) >= min_rows or not row.get("possible_keys"):
+            bad.append(row)
+    return bad
+
+
+def explain_check(min_rows=100):
+    """EXPLAIN every query in functions.py. Returns the number of failures."""
+    db = db_client.get_db()
+    cursor = db.cursor()
+    failures = 0
+
+    try:
+        for method, sql in collect_queries():
+            if method in FULL_SCAN_ALLOWED:
+                continue
+            try:
+                cursor.execute("EXPLAIN " + sql, _sample_params(sql))
+                plan = cursor.fetchall()
+            except Exception as e:
+                failures += 1
+                print(f"❌ {method}: could not EXPLAIN ({e})")
+                continue
+            for row in _scans(plan, min_rows):
+                failures += 1
+                print(
+                    f"❌ {method}: full scan of {row['table']} "
+                    f"(type={row['type']}, rows={row.get('rows')}, "
+                    f"possible_keys={row.get('possible_keys')})"
+                )
+        db.rollback()
+        return failures
+
+    finally:
+        cursor.close()
+        db_client.release(db)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("up", help="apply pending migrations")
+    commands.add_parser("status", help="show applied and pending migrations")
+    explain = commands.add_parser("explain", help="fail on full table scans in hot queries")
+    explain.add_argument(
+        "--min-rows", type=int, default=100,
+        help="ignore scans estimated below this many rows when an index exists",
+    )
+
+    args = parser.parse_args(argv)
+    if args.command in (None, "up"):
+        done = migrate_up()
+        print(f"migrate: applied {len(done)} migration(s)")
+    elif args.command == "status":
+        pending = status()
+        print(f"migrate: {pending} pending")
+    elif args.command == "explain":
+        failures = explain_check(min_rows=args.min_rows)
+        print(f"explain: {failures} problem(s)")
+        if failures:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+-- search_blogs: relevance-ranked search over titles and bodies
+-- applied-if: SELECT COUNT(*) > 0 FROM information_schema.statistics WHERE table_schema = DATABASE() AND table_name = 'blog' AND index_name = 'ft_blog_search'
+ALTER TABLE blog ADD FULLTEXT KEY ft_blog_search (title, main_blog);
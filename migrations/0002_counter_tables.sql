@@ -0,0 +1,50 @@
+-- get_user_statistics: per-user and community counters
+-- applied-if: SELECT COUNT(*) = 2 FROM information_schema.tables WHERE table_schema = DATABASE() AND table_name IN ('user_stats', 'site_stats')
+CREATE TABLE user_stats (
+    user_id INT PRIMARY KEY,
+    user_posts INT NOT NULL DEFAULT 0,
+    trash_posts INT NOT NULL DEFAULT 0,
+    user_comments INT NOT NULL DEFAULT 0,
+    likes_received INT NOT NULL DEFAULT 0,
+    dislikes_received INT NOT NULL DEFAULT 0,
+
+    FOREIGN KEY (user_id) REFERENCES user_info(id)
+        ON DELETE CASCADE
+);
+
+CREATE TABLE site_stats (
+    slot TINYINT PRIMARY KEY,
+    community_posts INT NOT NULL DEFAULT 0
+);
+
+INSERT INTO user_stats (user_id, user_posts, trash_posts, user_comments, likes_received, dislikes_received)
+SELECT u.id,
+       COALESCE(p.user_posts, 0),
+       COALESCE(p.trash_posts, 0),
+       COALESCE(c.user_comments, 0),
+       COALESCE(r.likes_received, 0),
+       COALESCE(r.dislikes_received, 0)
+FROM user_info u
+LEFT JOIN (
+    SELECT created_by,
+           SUM(CASE WHEN dlt=0 THEN 1 ELSE 0 END) AS user_posts,
+           SUM(CASE WHEN dlt=1 THEN 1 ELSE 0 END) AS trash_posts
+    FROM blog
+    GROUP BY created_by
+) p ON p.created_by = u.id
+LEFT JOIN (
+    SELECT user_id, COUNT(*) AS user_comments
+    FROM blog_comments
+    GROUP BY user_id
+) c ON c.user_id = u.id
+LEFT JOIN (
+    SELECT b.created_by,
+           SUM(CASE WHEN br.reaction='like' THEN 1 ELSE 0 END) AS likes_received,
+           SUM(CASE WHEN br.reaction='dislike' THEN 1 ELSE 0 END) AS dislikes_received
+    FROM blog_reactions br
+    JOIN blog b ON br.blog_id = b.id
+    GROUP BY b.created_by
+) r ON r.created_by = u.id;
+
+INSERT INTO site_stats (slot, community_posts)
+SELECT 0, COUNT(*) FROM blog WHERE dlt=0;
@@ -0,0 +1,23 @@
+-- like/dislike/comment counts on the post row
+-- applied-if: SELECT COUNT(*) = 3 FROM information_schema.columns WHERE table_schema = DATABASE() AND table_name = 'blog' AND column_name IN ('like_count', 'dislike_count', 'comment_count')
+ALTER TABLE blog
+    ADD COLUMN like_count INT NOT NULL DEFAULT 0,
+    ADD COLUMN dislike_count INT NOT NULL DEFAULT 0,
+    ADD COLUMN comment_count INT NOT NULL DEFAULT 0;
+
+UPDATE blog b
+LEFT JOIN (
+    SELECT blog_id,
+           SUM(CASE WHEN reaction='like' THEN 1 ELSE 0 END) AS likes,
+           SUM(CASE WHEN reaction='dislike' THEN 1 ELSE 0 END) AS dislikes
+    FROM blog_reactions
+    GROUP BY blog_id
+) r ON r.blog_id = b.id
+LEFT JOIN (
+    SELECT blog_id, COUNT(*) AS comments
+    FROM blog_comments
+    GROUP BY blog_id
+) c ON c.blog_id = b.id
+SET b.like_count = COALESCE(r.likes, 0),
+    b.dislike_count = COALESCE(r.dislikes, 0),
+    b.comment_count = COALESCE(c.comments, 0);
@@ -0,0 +1,11 @@
+-- On older databases MySQL drops the implicit foreign key indexes on
+-- blog.created_by, blog_comments.blog_id and blog_comments.user_id by itself
+-- once these indexes can back the foreign keys.
+-- view_user_blogs(_page), view_deleted_blogs(_page), search_blogs "mine"
+CREATE INDEX idx_blog_author_feed ON blog (created_by, dlt, created_at);
+-- get_all_blogs(_page), search_blogs "community" title fallback
+CREATE INDEX idx_blog_feed ON blog (dlt, created_at);
+-- get_comments
+CREATE INDEX idx_comments_thread ON blog_comments (blog_id, created_at);
+-- per-user comment lookups (rebuild-stats, permanent_delete_blog)
+CREATE INDEX idx_comments_user ON blog_comments (user_id);
@@ -0,0 +1,11 @@
+-- list queries read this excerpt instead of the full main_blog body
+ALTER TABLE blog
+    ADD COLUMN preview VARCHAR(400) NOT NULL DEFAULT '' AFTER main_blog;
+-- approximate backfill; "python maintenance.py rebuild-previews" recomputes
+-- it exactly the way add_blog/update_blog do
+UPDATE blog
+SET preview = CASE
+    WHEN CHAR_LENGTH(TRIM(main_blog)) > 320
+        THEN CONCAT(TRIM(TRAILING ' ' FROM LEFT(TRIM(main_blog), 320)), '...')
+    ELSE TRIM(main_blog)
+END;
@@ -0,0 +1,7 @@
+-- progress of import_data.py runs, committed with each batch so a failed
+-- import resumes exactly where it stopped
+CREATE TABLE import_checkpoints (
+    source VARCHAR(512) PRIMARY KEY,
+    rows_done BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
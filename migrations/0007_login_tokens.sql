@@ -0,0 +1,12 @@
+-- "remember me" logins: only the SHA-256 of each token is stored, and a
+-- role change or logout deletes the user's rows
+CREATE TABLE login_tokens (
+    token_hash CHAR(64) PRIMARY KEY,
+    user_id INT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    expires_at DATETIME NOT NULL,
+
+    KEY idx_login_tokens_user (user_id, expires_at),
+    FOREIGN KEY (user_id) REFERENCES user_info(id)
+        ON DELETE CASCADE
+);
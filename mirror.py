@@ -0,0 +1,256 @@
+# mirror.py
+"""Local SQLite copy of what the main views show first.
+
+The first page of the community feed and of the user's own posts, the
+dashboard counters and the profile are kept in ``~/.miniblog/mirror.sqlite3``
+(MINIBLOG_MIRROR_FILE to move it, ``off`` to disable), per backend and
+user. Views draw from it at once and then reload from the server, which
+replaces the entry (stale-while-revalidate). Once the entries pass
+MINIBLOG_MIRROR_MB in total, the least recently used ones are evicted.
+
+Values are stored in the codec.py format, so page cursors and timestamps
+come back with their types.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+import codec
+
+MIRROR_FILE = os.environ.get(
+    "MINIBLOG_MIRROR_FILE", os.path.join(os.path.expanduser("~"), ".miniblog", "mirror.sqlite3")
+)
+MAX_BYTES = int(float(os.environ.get("MINIBLOG_MIRROR_MB", "20")) * 1024 * 1024)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    target    TEXT    NOT NULL,
+    user_id   INTEGER NOT NULL,
+    name      TEXT    NOT NULL,
+    value     BLOB    NOT NULL,
+    size      INTEGER NOT NULL,
+    stored_at REAL    NOT NULL,
+    used_at   REAL    NOT NULL,
+    PRIMARY KEY (target, user_id, name)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_used ON entries (used_at);
+
+-- which posts each stored page holds, so a delete can reach every copy
+CREATE TABLE IF NOT EXISTS entry_blogs (
+    target  TEXT    NOT NULL,
+    blog_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    name    TEXT    NOT NULL,
+    PRIMARY KEY (target, blog_id, user_id, name)
+);
+"""
+
+
+def _worth_keeping(value):
+    """Empty pages, all-zero counters and None are also what Blog methods
+    return when they fail, so they never replace a stored copy."""
+    if isinstance(value, dict):
+        return any(value.values())
+    return bool(value)
+
+
+class LocalMirror:
+    """The on-disk mirror for one backend (``target``, as in remember.py).
+
+    Safe to use from the Tk thread and the workers; every call is a few
+    small statements on one shared connection. Errors are printed and
+    treated as a miss, so a broken mirror only costs the head start.
+    """
+
+    def __init__(self, target, path=MIRROR_FILE, max_bytes=MAX_BYTES):
+        self.target = target
+        self.path = path
+        self.max_bytes = max_bytes
+        self.enabled = path.lower() not in ("", "off", "none")
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def _db(self):
+        """The connection, opened on first use."""
+        if self._conn is None and self.enabled:
+            try:
+                if self.path != ":memory:":
+                    os.makedirs(os.path.dirname(os.path.abspath(self.path)), mode=0o700, exist_ok=True)
+                conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+                # readers never wait for the writer, and a crash loses at
+                # most the last few writes, never the file
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.executescript(_SCHEMA)
+                if self.path != ":memory:":
+                    os.chmod(self.path, 0o600)  # holds the user's posts and profile
+                self._conn = conn
+            except (OSError, sqlite3.Error) as e:
+                print("❌ mirror open error:", e)
+                self.enabled = False
+        return self._conn
+
+    # ------------------------- READING ------------------------- #
+    def get(self, user_id, name):
+        """The stored copy of ``name`` for ``user_id``, or None."""
+        if user_id is None:
+            return None
+        with self._lock:
+            db = self._db()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT value FROM entries WHERE target = ? AND user_id = ? AND name = ?",
+                    (self.target, user_id, name),
+                ).fetchone()
+                if row is None:
+                    return None
+                db.execute(
+                    "UPDATE entries SET used_at = ? WHERE target = ? AND user_id = ? AND name = ?",
+                    (time.time(), self.target, user_id, name),
+                )
+                return codec.loads(row[0])
+            except (sqlite3.Error, ValueError) as e:
+                print("❌ mirror read error:", e)
+                return None
+
+    # ------------------------- WRITING ------------------------- #
+    def put(self, user_id, name, value):
+        """Store a fresh copy of ``name``, or drop the old one when ``value``
+        is empty (see _worth_keeping)."""
+        if user_id is None:
+            return
+        if not _worth_keeping(value):
+            self.drop(user_id, name)
+            return
+        data = codec.dumps(value)
+        items = value.get("items") if isinstance(value, dict) else None
+        blog_ids = {item["id"] for item in items or () if "id" in item}
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.execute("BEGIN")
+                    self._delete_locked(db, user_id, name)
+                    db.execute(
+                        "INSERT INTO entries (target, user_id, name, value, size, stored_at, used_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (self.target, user_id, name, data, len(data), now, now),
+                    )
+                    db.executemany(
+                        "INSERT INTO entry_blogs (target, blog_id, user_id, name) VALUES (?, ?, ?, ?)",
+                        [(self.target, blog_id, user_id, name) for blog_id in blog_ids],
+                    )
+                    self._evict_locked(db)
+            except sqlite3.Error as e:
+                print("❌ mirror write error:", e)
+
+    def drop(self, user_id, *names):
+        """Forget ``names`` for ``user_id``; every entry of the user without names."""
+        with self._lock:
+            db = self._db()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.execute("BEGIN")
+                    if names:
+                        for name in names:
+                            self._delete_locked(db, user_id, name)
+                    else:
+                        for table in ("entries", "entry_blogs"):
+                            db.execute(
+                                f"DELETE FROM {table} WHERE target = ? AND user_id = ?",
+                                (self.target, user_id),
+                            )
+            except sqlite3.Error as e:
+                print("❌ mirror drop error:", e)
+
+    def forget_blog(self, blog_id):
+        """Take a deleted (or vanished) post out of every stored page, for
+        every user, so it is not drawn again before the next reload."""
+        with self._lock:
+            db = self._db()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.execute("BEGIN")
+                    pages = db.execute(
+                        "SELECT e.user_id, e.name, e.value FROM entry_blogs b "
+                        "JOIN entries e ON e.target = b.target AND e.user_id = b.user_id "
+                        "AND e.name = b.name WHERE b.target = ? AND b.blog_id = ?",
+                        (self.target, blog_id),
+                    ).fetchall()
+                    for user_id, name, data in pages:
+                        page = codec.loads(data)
+                        page["items"] = [item for item in page["items"] if item.get("id") != blog_id]
+                        if not page["items"]:
+                            # its cursor points past rows that are gone; like
+                            # put(), keep no empty page
+                            self._delete_locked(db, user_id, name)
+                            continue
+                        data = codec.dumps(page)
+                        db.execute(
+                            "UPDATE entries SET value = ?, size = ? "
+                            "WHERE target = ? AND user_id = ? AND name = ?",
+                            (data, len(data), self.target, user_id, name),
+                        )
+                    db.execute(
+                        "DELETE FROM entry_blogs WHERE target = ? AND blog_id = ?",
+                        (self.target, blog_id),
+                    )
+            except (sqlite3.Error, ValueError) as e:
+                print("❌ mirror delete error:", e)
+
+    def _delete_locked(self, db, user_id, name):
+        for table in ("entries", "entry_blogs"):
+            db.execute(
+                f"DELETE FROM {table} WHERE target = ? AND user_id = ? AND name = ?",
+                (self.target, user_id, name),
+            )
+
+    def _evict_locked(self, db):
+        """Drop least recently used entries, of any backend or user, until
+        the total size is within ``max_bytes``."""
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        oldest = db.execute(
+            "SELECT target, user_id, name, size FROM entries ORDER BY used_at"
+        ).fetchall()
+        for target, user_id, name, size in oldest:
+            if total <= self.max_bytes:
+                break
+            for table in ("entries", "entry_blogs"):
+                db.execute(
+                    f"DELETE FROM {table} WHERE target = ? AND user_id = ? AND name = ?",
+                    (target, user_id, name),
+                )
+            total -= size
+
+    # ------------------------- STATS --------------------------- #
+    def stats(self):
+        with self._lock:
+            db = self._db()
+            if db is None:
+                return {"entries": 0, "bytes": 0, "max_bytes": self.max_bytes}
+            try:
+                entries, size = db.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+                ).fetchone()
+            except sqlite3.Error as e:
+                print("❌ mirror stats error:", e)
+                entries, size = 0, 0
+        return {"entries": entries, "bytes": size, "max_bytes": self.max_bytes}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
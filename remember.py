@@ -0,0 +1,50 @@
+# remember.py
+"""Local storage for the "remember me" login token.
+
+The token lives in ``~/.miniblog/login_token`` (MINIBLOG_TOKEN_FILE to
+override), readable by the current user only. It is tagged with the
+backend it was issued by, so pointing the app at another database or API
+server does not try to reuse it there.
+"""
+import json
+import os
+
+TOKEN_FILE = os.environ.get(
+    "MINIBLOG_TOKEN_FILE", os.path.join(os.path.expanduser("~"), ".miniblog", "login_token")
+)
+
+
+def load_token(target):
+    """The saved token for ``target``, or None."""
+    try:
+        with open(TOKEN_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        print("❌ login token read error:", e)
+        return None
+    if not isinstance(data, dict) or data.get("target") != target:
+        return None
+    return data.get("token")
+
+
+def save_token(target, token, user_name):
+    try:
+        os.makedirs(os.path.dirname(TOKEN_FILE), mode=0o700, exist_ok=True)
+        # created 0600 from the start, never world-readable in between
+        fd = os.open(TOKEN_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"target": target, "user_name": user_name, "token": token}, f)
+        os.chmod(TOKEN_FILE, 0o600)  # an older file may have wider permissions
+    except OSError as e:
+        print("❌ login token write error:", e)
+
+
+def forget_token():
+    try:
+        os.remove(TOKEN_FILE)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        print("❌ login token delete error:", e)
@@ -1,6 +1,23 @@
 CREATE DATABASE IF NOT EXISTS miniblog2;
 USE miniblog2;
 
+-- Databases created from this file are already at the latest migration;
+-- older databases are upgraded with: python migrate.py up
+CREATE TABLE schema_migrations (
+    version INT PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO schema_migrations (version, name) VALUES
+(1, 'search_fulltext'),
+(2, 'counter_tables'),
+(3, 'blog_engagement_counts'),
+(4, 'hot_query_indexes'),
+(5, 'blog_preview'),
+(6, 'import_checkpoints'),
+(7, 'login_tokens');
+
 CREATE TABLE user_info (
     id INT AUTO_INCREMENT PRIMARY KEY,
     first_name VARCHAR(150) NOT NULL,
@@ -30,12 +47,22 @@ CREATE TABLE blog (
     id INT AUTO_INCREMENT PRIMARY KEY,
     title VARCHAR(255) NOT NULL,
     main_blog TEXT NOT NULL,
+    preview VARCHAR(400) NOT NULL DEFAULT '', -- excerpt for list views
     created_by INT NOT NULL,
     
     dlt TINYINT(1) DEFAULT 0, -- soft delete flag
+
+    -- engagement counters, kept exact by set_reaction / add_comment
+    like_count INT NOT NULL DEFAULT 0,
+    dislike_count INT NOT NULL DEFAULT 0,
+    comment_count INT NOT NULL DEFAULT 0,
     
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
+    FULLTEXT KEY ft_blog_search (title, main_blog), -- search_blogs
+    KEY idx_blog_author_feed (created_by, dlt, created_at),
+    KEY idx_blog_feed (dlt, created_at),
+
     FOREIGN KEY (created_by) REFERENCES user_info(id)
         ON DELETE CASCADE
 );
@@ -47,6 +74,9 @@ CREATE TABLE blog_comments (
     comment_text TEXT NOT NULL,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
+    KEY idx_comments_thread (blog_id, created_at),
+    KEY idx_comments_user (user_id),
+
     FOREIGN KEY (blog_id) REFERENCES blog(id)
         ON DELETE CASCADE,
     FOREIGN KEY (user_id) REFERENCES user_info(id)
@@ -69,3 +99,41 @@ CREATE TABLE blog_reactions (
         ON DELETE CASCADE
 );
 
+-- Dashboard counters, kept in step by the write paths in functions.py.
+-- Repair drift with: python maintenance.py rebuild-stats
+CREATE TABLE user_stats (
+    user_id INT PRIMARY KEY,
+    user_posts INT NOT NULL DEFAULT 0,
+    trash_posts INT NOT NULL DEFAULT 0,
+    user_comments INT NOT NULL DEFAULT 0,
+    likes_received INT NOT NULL DEFAULT 0,
+    dislikes_received INT NOT NULL DEFAULT 0,
+
+    FOREIGN KEY (user_id) REFERENCES user_info(id)
+        ON DELETE CASCADE
+);
+
+-- community post count, summed over SITE_STAT_SLOTS rows
+CREATE TABLE site_stats (
+    slot TINYINT PRIMARY KEY,
+    community_posts INT NOT NULL DEFAULT 0
+);
+
+-- progress of import_data.py runs (one row per imported file)
+CREATE TABLE import_checkpoints (
+    source VARCHAR(512) PRIMARY KEY,
+    rows_done BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+);
+
+-- "remember me" logins (SHA-256 of the token only)
+CREATE TABLE login_tokens (
+    token_hash CHAR(64) PRIMARY KEY,
+    user_id INT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    expires_at DATETIME NOT NULL,
+
+    KEY idx_login_tokens_user (user_id, expires_at),
+    FOREIGN KEY (user_id) REFERENCES user_info(id)
+        ON DELETE CASCADE
+);
@@ -0,0 +1,146 @@
+# tasks.py
+import queue
+import traceback
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TaskRunner:
+    """Run blocking calls on a worker pool and deliver results on the Tk thread.
+
+    Workers never touch Tk: finished futures are queued and drained by an
+    ``after()`` poll on the main loop, which then calls ``on_done(result)`` or
+    ``on_error(exc)``. Tasks belong to a group; ``cancel(group)`` cancels the
+    group's queued work and drops the results of anything already running, so
+    a view that has been left never receives late data.
+    """
+
+    POLL_MS = 15
+
+    def __init__(self, root, max_workers=4):
+        self._root = root
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="blog-worker"
+        )
+        self._finished = queue.SimpleQueue()
+        self._generation = defaultdict(int)
+        self._pending = defaultdict(set)
+        self._polling = False
+
+    def submit(self, fn, *args, on_done=None, on_error=None, group="view", **kwargs):
+        generation = self._generation[group]
+        future = self._executor.submit(fn, *args, **kwargs)
+        self._pending[group].add(future)
+        future.add_done_callback(
+            lambda f: self._finished.put((group, generation, f, on_done, on_error))
+        )
+        if not self._polling:
+            self._polling = True
+            self._root.after(self.POLL_MS, self._poll)
+        return future
+
+    def cancel(self, group="view"):
+        self._generation[group] += 1
+        for future in self._pending.pop(group, ()):
+            future.cancel()
+
+    def cancel_all(self):
+        for group in list(self._pending):
+            self.cancel(group)
+
+    def _poll(self):
+        while True:
+            try:
+                group, generation, future, on_done, on_error = self._finished.get_nowait()
+            except queue.Empty:
+                break
+            self._pending[group].discard(future)
+            if future.cancelled() or generation != self._generation[group]:
+                continue
+
+            exc = future.exception()
+            try:
+                if exc is not None:
+                    if on_error is not None:
+                        on_error(exc)
+                    else:
+                        print("❌ background task error:", exc)
+                elif on_done is not None:
+                    on_done(future.result())
+            except Exception:
+                traceback.print_exc()
+
+        if any(self._pending.values()):
+            self._root.after(self.POLL_MS, self._poll)
+        else:
+            self._polling = False
+
+    def shutdown(self):
+        self.cancel_all()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+class CoalescingWriter:
+    """Persist only the latest of a burst of values.
+
+    ``set(value)`` records the wanted value and restarts a short timer; when
+    it fires, ``write(value)`` runs on the runner unless the value is already
+    the stored one. Values set while a write is in flight are written after
+    it finishes, so rapid toggles end in at most two writes and the last
+    state always wins. ``on_written(ok)`` runs on the Tk thread after each
+    write.
+    """
+
+    def __init__(self, root, runner, write, stored=None, delay_ms=400,
+                 on_written=None, group="view"):
+        self._root = root
+        self._runner = runner
+        self._write = write
+        self._delay_ms = delay_ms
+        self._on_written = on_written
+        self._group = group
+        self._timer = None
+        self._in_flight = False
+        self.value = stored
+        self.stored = stored
+
+    @property
+    def pending(self):
+        return self._timer is not None or self._in_flight or self.value != self.stored
+
+    def reset(self, stored):
+        """Adopt a freshly loaded server value (ignored while writes are pending)."""
+        if not self.pending:
+            self.value = self.stored = stored
+
+    def set(self, value):
+        self.value = value
+        if self._timer is not None:
+            self._root.after_cancel(self._timer)
+        self._timer = self._root.after(self._delay_ms, self._flush)
+
+    def _flush(self):
+        self._timer = None
+        if self._in_flight or self.value == self.stored:
+            return
+        value = self.value
+        self._in_flight = True
+        self._runner.submit(
+            self._write,
+            value,
+            on_done=lambda ok: self._done(value, ok),
+            on_error=lambda exc: self._done(value, False),
+            group=self._group,
+        )
+
+    def _done(self, value, ok):
+        self._in_flight = False
+        if ok:
+            self.stored = value
+        else:
+            # give up on the local state and let the caller reload
+            self.value = self.stored
+        if ok and self.value != self.stored and self._timer is None:
+            self._flush()
+        if self._on_written is not None:
+            self._on_written(ok)
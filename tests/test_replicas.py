@@ -0,0 +1,238 @@
+# tests/test_replicas.py
+"""Replica routing in db.mydb: round robin, fallback and read-your-writes.
+
+The unit tests run on fake connections. The integration tests at the end
+need a primary and at least one replica (MINIBLOG_DB_REPLICAS, e.g.
+``127.0.0.1:3307``, plus the usual primary settings in functions.py) and
+are skipped otherwise.
+"""
+import os
+import time
+
+import pytest
+
+import db
+from db import mydb
+
+
+class FakeConnection:
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.open = True
+
+    def rollback(self):
+        pass
+
+    def ping(self, reconnect=False):
+        pass
+
+    def close(self):
+        self.open = False
+
+
+class FakeServers:
+    """Stands in for mydb.connect(); ``down`` holds the names that refuse."""
+
+    def __init__(self):
+        self.down = set()
+        self.attempts = []
+
+    def connect(self, endpoint=None):
+        name = (endpoint or {}).get("name", "primary")
+        self.attempts.append(name)
+        if name in self.down:
+            raise ConnectionRefusedError(name)
+        conn = FakeConnection(name)
+        conn.replica = (endpoint or {}).get("name")
+        return conn
+
+
+def make_db(replicas=("replica1:3307", "replica2:3308"), **kwargs):
+    client = mydb(replicas=list(replicas), **kwargs)
+    servers = FakeServers()
+    client.connect = servers.connect  # picked up when the pools are created
+    return client, servers
+
+
+def read(client, session=None):
+    conn = client.get_db(readonly=True, session=session)
+    client.release(conn)
+    return conn.endpoint
+
+
+def write(client, session):
+    conn = client.get_db(session=session)
+    conn.wrote = True  # what InstrumentedCursor does on a non-read statement
+    client.release(conn)
+
+
+# ------------------------- SELECTION --------------------------- #
+def test_reads_round_robin_over_replicas():
+    client, _ = make_db()
+    assert [read(client) for _ in range(4)] == ["replica1:3307", "replica2:3308"] * 2
+
+
+def test_writes_and_unflagged_reads_use_the_primary():
+    client, _ = make_db()
+    assert client.get_db().endpoint == "primary"
+    assert client.get_db(readonly=False, session="s").endpoint == "primary"
+
+
+def test_without_replicas_reads_use_the_primary():
+    client, _ = make_db(replicas=())
+    assert read(client) == "primary"
+    assert client.replica_stats() == {}
+
+
+def test_endpoint_specs():
+    endpoints = db._endpoints("a, b:3307")
+    assert [e["name"] for e in endpoints] == ["a:3306", "b:3307"]
+    assert endpoints[1]["port"] == 3307
+    assert db._endpoints([{"host": "c", "user": "ro"}])[0]["name"] == "c:3306"
+
+
+# -------------------------- FALLBACK --------------------------- #
+def test_down_replica_is_skipped():
+    client, servers = make_db()
+    servers.down.add("replica1:3307")
+    assert [read(client) for _ in range(3)] == ["replica2:3308"] * 3
+    assert client.replica_stats()["replica1:3307"]["down"]
+
+
+def test_all_replicas_down_falls_back_to_primary():
+    client, servers = make_db()
+    servers.down.update({"replica1:3307", "replica2:3308"})
+    assert read(client) == "primary"
+
+
+def test_down_replica_is_not_retried_until_retry_after():
+    client, servers = make_db(replicas=("replica1:3307",), replica_retry_after=60)
+    servers.down.add("replica1:3307")
+    read(client)
+    read(client)
+    assert servers.attempts.count("replica1:3307") == 1
+
+
+def test_down_replica_is_retried_after_retry_after():
+    client, servers = make_db(replicas=("replica1:3307",), replica_retry_after=0.05)
+    servers.down.add("replica1:3307")
+    assert read(client) == "primary"
+    servers.down.clear()
+    time.sleep(0.06)
+    assert read(client) == "replica1:3307"
+
+
+# ----------------------- READ YOUR WRITES ----------------------- #
+def test_writer_reads_from_primary_within_the_window():
+    client, _ = make_db(read_your_writes=60)
+    write(client, "alice")
+    assert read(client, "alice") == "primary"
+    assert read(client, "bob").startswith("replica")
+    assert read(client).startswith("replica")  # no session: never held back
+
+
+def test_writer_returns_to_replicas_after_the_window():
+    client, _ = make_db(read_your_writes=0.05)
+    write(client, "alice")
+    assert read(client, "alice") == "primary"
+    time.sleep(0.06)
+    assert read(client, "alice").startswith("replica")
+
+
+def test_read_only_connection_does_not_pin_the_session():
+    client, _ = make_db(read_your_writes=60)
+    conn = client.get_db(session="alice")
+    client.release(conn)  # nothing written
+    assert read(client, "alice").startswith("replica")
+    assert not client.wrote_recently("alice")
+
+
+def test_wrote_recently_without_session_means_anybody():
+    client, _ = make_db(read_your_writes=60)
+    assert not client.wrote_recently()
+    write(client, "alice")
+    assert client.wrote_recently()
+    assert not client.wrote_recently("bob")
+
+
+def test_cursor_flags_writing_statements():
+    class Base:
+        rowcount = 0
+
+        def __init__(self, connection):
+            self.connection = connection
+
+        def execute(self, query, args=None):
+            return 0
+
+    cursor_class = type("Cursor", (db._InstrumentedExecute, Base), {})
+    for query, wrote in [
+        ("SELECT 1", False),
+        ("  (SELECT 1) UNION (SELECT 2)", False),
+        ("show tables", False),
+        ("UPDATE blog SET title='x'", True),
+        ("INSERT INTO blog_comments VALUES (1)", True),
+    ]:
+        conn = FakeConnection("primary")
+        conn.wrote = False
+        cursor_class(conn).execute(query)
+        assert conn.wrote is wrote, query
+
+
+# ------------------------ INTEGRATION -------------------------- #
+needs_replicas = pytest.mark.skipif(
+    not os.environ.get("MINIBLOG_DB_REPLICAS"),
+    reason="set MINIBLOG_DB_REPLICAS to run against real replicas",
+)
+
+
+@pytest.fixture
+def live_client():
+    pytest.importorskip("pymysql")
+    from functions import db_client
+    client = mydb(
+        host=db_client.host,
+        port=db_client.port,
+        user=db_client.user,
+        password=db_client.password,
+        database=db_client.database,
+        replicas=os.environ["MINIBLOG_DB_REPLICAS"],
+        read_your_writes=60,
+    )
+    yield client
+    client.close()
+
+
+def server_id(client, session=None, readonly=True):
+    conn = client.get_db(readonly=readonly, session=session)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT @@server_id AS id")
+        return cursor.fetchone()["id"], client.is_replica(conn)
+    finally:
+        cursor.close()
+        client.release(conn)
+
+
+@needs_replicas
+def test_live_reads_go_to_a_replica(live_client):
+    primary, on_replica = server_id(live_client, readonly=False)
+    assert not on_replica
+    replica, on_replica = server_id(live_client)
+    assert on_replica and replica != primary
+
+
+@needs_replicas
+def test_live_read_your_writes(live_client):
+    primary, _ = server_id(live_client, readonly=False)
+    # any statement that is not a read marks the connection as having written
+    live_client.run_transaction(lambda cursor: cursor.execute("DO 0"), session="alice")
+    assert server_id(live_client, "alice") == (primary, False)
+    assert server_id(live_client, "bob")[1]
+
+
+@needs_replicas
+def test_live_unreachable_replica_falls_back(live_client):
+    live_client.replicas = db._endpoints("127.0.0.1:1")  # nothing listens there
+    primary, _ = server_id(live_client, readonly=False)
+    assert server_id(live_client) == (primary, False)
@@ -0,0 +1,116 @@
+# tests/test_sessions.py
+"""Role changes reach sessions that already cached the user's profile."""
+from functions import BlogService, Session, SessionManager
+
+
+class FakeCursor:
+    """Answers the profile lookup and the role update from ``roles``."""
+
+    def __init__(self, roles):
+        self.roles = roles
+        self.rowcount = 0
+        self._row = None
+
+    def execute(self, sql, params=()):
+        sql = " ".join(sql.split())
+        if sql.startswith("SELECT") and "FROM user_info" in sql:
+            user_id = params[0]
+            self._row = {"id": user_id, "role": self.roles[user_id]} if user_id in self.roles else None
+        elif sql.startswith("UPDATE user_info SET role"):
+            role, user_id = params
+            self.rowcount = int(self.roles.get(user_id, role) != role)
+            self.roles[user_id] = role
+        else:
+            self.rowcount = 0
+
+    def fetchone(self):
+        return self._row
+
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self, roles):
+        self.roles = roles
+
+    def cursor(self):
+        return FakeCursor(self.roles)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+
+class FakeDb:
+    def __init__(self, roles):
+        self.roles = roles
+
+    def get_db(self, readonly=False, session=None):
+        return FakeConnection(self.roles)
+
+    def release(self, conn):
+        pass
+
+    def is_replica(self, conn):
+        return False
+
+    def wrote_recently(self):
+        return False
+
+
+def logged_in(service, sessions, user_id):
+    session = Session()
+    session.user_id = user_id
+    service.get_user_profile(session)  # cached, as after log_in
+    return session, sessions.create(session)
+
+
+def test_demoted_admin_loses_admin_at_once():
+    sessions = SessionManager()
+    service = BlogService(db=FakeDb({1: "admin", 2: "admin"}), sessions=sessions)
+    admin, _ = logged_in(service, sessions, 1)
+    demoted, token = logged_in(service, sessions, 2)
+    assert service.is_admin(demoted)
+
+    assert service.set_user_role(admin, 2, "user")
+
+    assert sessions.get(token) is None
+    assert not service.is_admin(demoted)
+    again, _ = logged_in(service, sessions, 2)
+    assert not service.is_admin(again)
+    assert service.is_admin(admin)
+
+
+def test_demoting_yourself_without_a_session_manager():
+    service = BlogService(db=FakeDb({1: "admin"}))
+    admin = Session()
+    admin.user_id = 1
+    assert service.is_admin(admin)
+
+    assert service.set_user_role(admin, 1, "user")
+
+    assert not service.is_admin(admin)
+
+
+def test_unchanged_role_keeps_sessions():
+    sessions = SessionManager()
+    service = BlogService(db=FakeDb({1: "admin", 2: "user"}), sessions=sessions)
+    admin, _ = logged_in(service, sessions, 1)
+    _, token = logged_in(service, sessions, 2)
+
+    assert not service.set_user_role(admin, 2, "user")
+
+    assert sessions.get(token) is not None
+
+
+def test_drop_user_only_ends_that_users_sessions():
+    sessions = SessionManager()
+    mine, other = Session(), Session()
+    mine.user_id, other.user_id = 1, 2
+    tokens = [sessions.create(mine), sessions.create(mine), sessions.create(other)]
+
+    assert sessions.drop_user(1) == 2
+    assert [sessions.get(t) is not None for t in tokens] == [False, False, True]
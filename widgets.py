@@ -0,0 +1,363 @@
+# widgets.py
+import math
+import sys
+
+import customtkinter as ctk
+
+
+class VirtualList(ctk.CTkFrame):
+    """Scrollable list that only builds widgets for the rows on screen.
+
+    Rows have a fixed height. ``create_row(parent)`` builds one reusable row
+    widget and ``bind_row(row, item)`` fills it with an item; as the list
+    scrolls, rows leaving the viewport are re-bound to the items coming in.
+    Items are pulled from ``fetch_page(cursor)``, which returns a Blog page
+    dict (``{"items": [...], "next_cursor": ...}``); the next page is requested
+    when the user scrolls within ``prefetch_rows`` of the end. With a
+    ``runner`` (tasks.TaskRunner) pages are fetched off the Tk thread and a
+    loading placeholder is shown until the first one arrives. ``refresh()``
+    re-fetches the pages under the viewport in place, keeping the scroll
+    position, and only re-binds rows whose item actually changed. ``peek_page()``, when given, returns a possibly stale
+    first page (e.g. from mirror.py) to draw at once; it is then refreshed.
+    """
+
+    WHEEL_STEP = 60  # pixels per mouse-wheel notch
+
+    def __init__(
+        self,
+        master,
+        row_height,
+        create_row,
+        bind_row,
+        fetch_page,
+        empty_text="Nothing here yet.",
+        prefetch_rows=5,
+        runner=None,
+        task_group="view",
+        peek_page=None,
+        **kwargs,
+    ):
+        super().__init__(master, **kwargs)
+        self.row_height = row_height
+        self.create_row = create_row
+        self.bind_row = bind_row
+        self.fetch_page = fetch_page
+        self.peek_page = peek_page
+        self.empty_text = empty_text
+        self.prefetch_rows = prefetch_rows
+        self.runner = runner
+        self.task_group = task_group
+
+        self.items = []
+        self._pages = []  # per loaded page: (index of its first item, cursor it was fetched with)
+        self._next_cursor = None
+        self._exhausted = False
+        self._loading = False
+        self._offset = 0
+        self._generation = 0
+
+        self._rows = []
+        self._bound = []  # per row: (index, item) currently shown, or None
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(0, weight=1)
+
+        self._viewport = ctk.CTkFrame(self, fg_color="transparent")
+        self._viewport.grid(row=0, column=0, sticky="nsew")
+        self._viewport.bind("<Configure>", self._on_configure)
+
+        self._scrollbar = ctk.CTkScrollbar(self, command=self._on_scrollbar)
+        self._scrollbar.grid(row=0, column=1, sticky="ns")
+
+        self._empty_label = ctk.CTkLabel(
+            self._viewport,
+            text=empty_text,
+            font=("Montserrat", 16),
+            text_color="#94a3b8",
+        )
+        self._loading_label = ctk.CTkLabel(
+            self._viewport,
+            text="Loading…",
+            font=("Montserrat", 14),
+            text_color="#94a3b8",
+        )
+
+        self._wheel_bindings = []
+        if sys.platform.startswith("linux"):
+            sequences = ("<Button-4>", "<Button-5>")
+        else:
+            sequences = ("<MouseWheel>",)
+        for sequence in sequences:
+            funcid = self.bind_all(sequence, self._on_wheel, add="+")
+            self._wheel_bindings.append((sequence, funcid))
+
+        self.reload()
+
+    # ------------------------- DATA ---------------------------- #
+    def reload(self, fetch_page=None, empty_text=None, peek_page=None):
+        """Drop every loaded item and start again from the first page.
+
+        A new ``fetch_page`` replaces ``peek_page`` as well.
+        """
+        if fetch_page is not None:
+            self.fetch_page = fetch_page
+            self.peek_page = peek_page
+        if empty_text is not None:
+            self.empty_text = empty_text
+            self._empty_label.configure(text=empty_text)
+        self.items = []
+        self._pages = []
+        self._next_cursor = None
+        self._exhausted = False
+        self._loading = False
+        self._offset = 0
+        self._generation += 1
+        self._bound = [None] * len(self._rows)
+        page = self.peek_page() if self.peek_page is not None else None
+        if page is None:
+            self._load_more()
+            return
+        self._append_page(page)
+        self.refresh()
+
+    def refresh(self):
+        """Re-fetch the loaded pages the viewport shows, keeping the rows on
+        screen (and the scroll position) until they arrive."""
+        self._generation += 1
+        generation = self._generation
+        self._loading = True
+        window = self._visible_pages()
+        cursor = self._pages[window.start][1] if window else None
+        count = max(len(window), 1)
+        if self.runner is None:
+            try:
+                pages = self._fetch_window(cursor, count)
+            except Exception:
+                pages = None
+            self._on_refresh(generation, window, pages)
+            return
+        self.runner.submit(
+            self._fetch_window,
+            cursor,
+            count,
+            on_done=lambda pages: self._on_refresh(generation, window, pages),
+            on_error=lambda exc: self._on_refresh(generation, window, None),
+            group=self.task_group,
+        )
+
+    def _visible_pages(self):
+        """range() of the entries of ``_pages`` that hold a row on screen."""
+        first = int(self._offset // self.row_height)
+        last = math.ceil((self._offset + self._viewport_height()) / self.row_height)
+        starts = [start for start, _ in self._pages]
+        lo = hi = None
+        for number, start in enumerate(starts):
+            end = starts[number + 1] if number + 1 < len(starts) else len(self.items)
+            if start < last and end > first:
+                lo = number if lo is None else lo
+                hi = number
+        return range(lo, hi + 1) if lo is not None else range(0)
+
+    def _fetch_window(self, cursor, count):
+        """Up to ``count`` consecutive pages from ``cursor``, each fetched with
+        the cursor the previous one returned. Runs on the worker."""
+        pages = []
+        while len(pages) < count:
+            page = self.fetch_page(cursor)
+            pages.append((cursor, page))
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+        return pages
+
+    def _on_refresh(self, generation, window, pages):
+        if generation != self._generation or not self.winfo_exists():
+            return
+        self._loading = False
+        if pages is not None:
+            self._splice(window, pages)
+        self._layout()
+        self._maybe_load_more()
+
+    def _splice(self, window, pages):
+        """Put the re-fetched ``pages`` in place of the loaded ``window``.
+
+        Pages below it are kept when the window still ends where they start;
+        otherwise posts moved across the boundary, so they are dropped and
+        fetched again as the user scrolls to them.
+        """
+        lo = window.start if window else 0
+        after = window.stop if window else len(self._pages)
+        start = self._pages[lo][0] if lo < len(self._pages) else 0
+        if after < len(self._pages):
+            end, old_next = self._pages[after]
+        else:
+            end, old_next = len(self.items), self._next_cursor
+
+        fresh, index = [], start
+        for cursor, page in pages:
+            fresh.append((index, cursor))
+            index += len(page["items"])
+        items = [item for _, page in pages for item in page["items"]]
+        new_next = pages[-1][1]["next_cursor"]
+
+        if new_next == old_next:
+            shift = index - end
+            tail = [(first + shift, cursor) for first, cursor in self._pages[after:]]
+            self.items = self.items[:start] + items + self.items[end:]
+            self._pages = self._pages[:lo] + fresh + tail
+        else:
+            self.items = self.items[:start] + items
+            self._pages = self._pages[:lo] + fresh
+            self._next_cursor = new_next
+            self._exhausted = new_next is None
+
+    def _load_more(self):
+        if self._loading or self._exhausted:
+            return
+        self._loading = True
+
+        if self.runner is None:
+            try:
+                page = self.fetch_page(self._next_cursor)
+            finally:
+                self._loading = False
+            self._append_page(page)
+            return
+
+        generation = self._generation
+        self._layout()
+        self.runner.submit(
+            self.fetch_page,
+            self._next_cursor,
+            on_done=lambda page: self._on_page(generation, page),
+            on_error=lambda exc: self._on_page(generation, None),
+            group=self.task_group,
+        )
+
+    def _on_page(self, generation, page):
+        if generation != self._generation or not self.winfo_exists():
+            return
+        self._loading = False
+        if page is None:
+            # keep what we have; scrolling to the end again retries
+            self._layout()
+            return
+        self._append_page(page)
+
+    def _append_page(self, page):
+        # _next_cursor is still the cursor this page was fetched with
+        self._pages.append((len(self.items), self._next_cursor))
+        self.items.extend(page["items"])
+        self._next_cursor = page["next_cursor"]
+        self._exhausted = self._next_cursor is None
+        self._layout()
+
+    def _maybe_load_more(self):
+        if self._exhausted or self._loading:
+            return
+        last_visible = (self._offset + self._viewport_height()) / self.row_height
+        if last_visible >= len(self.items) - self.prefetch_rows:
+            self._load_more()
+
+    # ------------------------ LAYOUT --------------------------- #
+    def _viewport_height(self):
+        return max(self._viewport.winfo_height(), 1)
+
+    def _content_height(self):
+        return len(self.items) * self.row_height
+
+    def _ensure_rows(self):
+        needed = math.ceil(self._viewport_height() / self.row_height) + 1
+        if needed > len(self._rows):
+            while len(self._rows) < needed:
+                self._rows.append(self.create_row(self._viewport))
+            # the index -> row mapping depends on the pool size
+            self._bound = [None] * len(self._rows)
+
+    def _layout(self):
+        self._ensure_rows()
+        view_h = self._viewport_height()
+        max_offset = max(0, self._content_height() - view_h)
+        self._offset = min(max(0, self._offset), max_offset)
+
+        first = int(self._offset // self.row_height)
+        pool = len(self._rows)
+        shown = set()
+        for index in range(first, min(first + pool, len(self.items))):
+            slot = index % pool
+            row = self._rows[slot]
+            item = self.items[index]
+            bound = self._bound[slot]
+            # compare by value so a refresh that returns the same data
+            # leaves the card untouched
+            if bound is None or bound[0] != index or bound[1] != item:
+                self.bind_row(row, item)
+                self._bound[slot] = (index, item)
+            row.place(
+                x=0,
+                y=index * self.row_height - self._offset,
+                relwidth=1,
+                height=self.row_height,
+            )
+            shown.add(slot)
+
+        for slot, row in enumerate(self._rows):
+            if slot not in shown:
+                row.place_forget()
+                self._bound[slot] = None
+
+        if self.items or not self._exhausted:
+            self._empty_label.place_forget()
+        else:
+            self._empty_label.place(relx=0.5, rely=0.3, anchor="center")
+        if self._loading and not self.items:
+            self._loading_label.place(relx=0.5, rely=0.3, anchor="center")
+        else:
+            self._loading_label.place_forget()
+
+        total = self._content_height()
+        if total <= view_h:
+            self._scrollbar.set(0, 1)
+        else:
+            self._scrollbar.set(self._offset / total, (self._offset + view_h) / total)
+
+    def _on_configure(self, _event=None):
+        self._layout()
+        self._maybe_load_more()
+
+    def scroll_to(self, offset):
+        self._offset = offset
+        self._layout()
+        self._maybe_load_more()
+
+    # ------------------------ SCROLLING ------------------------ #
+    def _on_scrollbar(self, action, value, units=None):
+        if action == "moveto":
+            self.scroll_to(float(value) * self._content_height())
+        elif action == "scroll":
+            step = self._viewport_height() if units == "pages" else self.WHEEL_STEP
+            self.scroll_to(self._offset + int(value) * step)
+
+    def _on_wheel(self, event):
+        name, own = str(event.widget), str(self)
+        if name != own and not name.startswith(own + "."):
+            return
+        if event.num == 4:
+            delta = -self.WHEEL_STEP
+        elif event.num == 5:
+            delta = self.WHEEL_STEP
+        elif sys.platform == "darwin":
+            delta = -event.delta * 10
+        else:
+            delta = -event.delta / 120 * self.WHEEL_STEP
+        self.scroll_to(self._offset + delta)
+
+    def destroy(self):
+        for sequence, funcid in self._wheel_bindings:
+            script = self.tk.call("bind", "all", sequence)
+            kept = [line for line in script.split("\n") if funcid not in line]
+            self.tk.call("bind", "all", sequence, "\n".join(kept))
+            self.deletecommand(funcid)
+        self._wheel_bindings = []
+        super().destroy()